@@ -0,0 +1,32 @@
+"""Add composite index for active API key lookups
+
+Revision ID: 9b1e4c7d2a60
+Revises: 5c32f135200e
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b1e4c7d2a60"
+down_revision: Union[str, None] = "5c32f135200e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_apikey_user_active",
+        "apikey",
+        ["user_id", "revoked_at", "expires_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_apikey_user_active", table_name="apikey")
@@ -0,0 +1,31 @@
+"""Make the API key token hash index unique
+
+Revision ID: d3f8a1c6b2e4
+Revises: 9b1e4c7d2a60
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3f8a1c6b2e4"
+down_revision: Union[str, None] = "9b1e4c7d2a60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f("ix_apikey_token_hash"), table_name="apikey")
+    op.create_index(op.f("ix_apikey_token_hash"), "apikey", ["token_hash"], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_apikey_token_hash"), table_name="apikey")
+    op.create_index(
+        op.f("ix_apikey_token_hash"), "apikey", ["token_hash"], unique=False
+    )
@@ -0,0 +1,32 @@
+"""Add composite index for listing a user's API keys by creation date
+
+Revision ID: e7a2c4d9f1b3
+Revises: d3f8a1c6b2e4
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a2c4d9f1b3"
+down_revision: Union[str, None] = "d3f8a1c6b2e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_apikey_user_created",
+        "apikey",
+        ["user_id", "created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_apikey_user_created", table_name="apikey")
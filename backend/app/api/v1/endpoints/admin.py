@@ -1,14 +1,16 @@
 """Admin API endpoints for user and role management."""
 
-from typing import Optional
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.rbac import AdminOnly
 from app.core.logging import get_logger
 from app.db.session import get_db_session
 from app.models.user import User
+from app.repositories.user import user_repository
 from app.schemas.role import Role, RoleList, UserList, UserRoleUpdate, UserWithRole
 from app.schemas.user import UserDeletionResponse, UserStatusUpdate
 from app.services.role import RoleService, get_role_service
@@ -26,6 +28,10 @@ from app.services.user import (
 router = APIRouter()
 logger = get_logger(__name__)
 
+# Validate whole lists of ORM rows in a single pydantic-core call
+_ROLE_LIST_ADAPTER = TypeAdapter(List[Role])
+_USER_WITH_ROLE_LIST_ADAPTER = TypeAdapter(List[UserWithRole])
+
 
 @router.get("/roles", response_model=RoleList, tags=["admin"])
 async def list_roles(
@@ -39,8 +45,8 @@ async def list_roles(
     Requires admin privileges.
     """
     role_models = await role_service.get_all_roles(db)
-    roles = [Role.model_validate(role) for role in role_models]
-    return RoleList(roles=roles, total=len(roles))
+    roles = _ROLE_LIST_ADAPTER.validate_python(role_models, from_attributes=True)
+    return RoleList.model_construct(roles=roles, total=len(roles))
 
 
 @router.get("/users", response_model=UserList, tags=["admin"])
@@ -64,8 +70,10 @@ async def list_users(
         users = await get_users_with_roles(db, limit, offset)
         total = await count_total_users(db)
 
-    user_schemas = [UserWithRole.model_validate(user) for user in users]
-    return UserList(
+    user_schemas = _USER_WITH_ROLE_LIST_ADAPTER.validate_python(
+        users, from_attributes=True
+    )
+    return UserList.model_construct(
         users=user_schemas,
         total=total,
         limit=limit,
@@ -84,10 +92,7 @@ async def get_user(
 
     Requires admin privileges.
     """
-    from app.repositories.user import UserRepository
-
-    user_repo = UserRepository()
-    user = await user_repo.get_by_id_with_role(db, user_id)
+    user = await user_repository.get_by_id_with_role(db, user_id)
 
     if not user:
         raise HTTPException(
@@ -95,7 +100,7 @@ async def get_user(
             detail=f"User with ID {user_id} not found",
         )
 
-    return UserWithRole.model_validate(user)
+    return UserWithRole.from_orm_fast(user)
 
 
 @router.put("/users/{user_id}/role", response_model=UserWithRole, tags=["admin"])
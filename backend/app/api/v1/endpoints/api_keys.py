@@ -74,7 +74,7 @@ async def create_api_key(
         expires_in_days=api_key_data.expires_in_days,
     )
 
-    return ApiKeyCreated(api_key=ApiKeyInfo.model_validate(api_key), token=token)
+    return ApiKeyCreated(api_key=ApiKeyInfo.from_orm_fast(api_key), token=token)
 
 
 @router.delete("/{key_id}", response_model=ApiKeyRevoked, tags=["api-keys"])
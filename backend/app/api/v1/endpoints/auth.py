@@ -20,6 +20,7 @@ from app.security.auth import (
     create_auth_cookies_with_csrf,
     create_csrf_token,
     get_refresh_token,
+    invalidate_access_token,
     revoke_refresh_token,
     rotate_refresh_token,
     set_refresh_token_cookie,
@@ -47,7 +48,7 @@ async def get_current_user_info(
     current_user: UserModel = Depends(get_current_user),
 ) -> User:
     """Get current authenticated user information."""
-    return User.model_validate(current_user)
+    return User.from_orm_fast(current_user)
 
 
 @router.get("/registration-status", response_model=RegistrationStatus)
@@ -125,7 +126,7 @@ async def login_user(
     access_token = create_access_token(data={"sub": user.email})
     await create_auth_cookies_with_csrf(response, access_token, db, user)
 
-    return User.model_validate(user)
+    return User.from_orm_fast(user)
 
 
 @router.post("/refresh")
@@ -159,9 +160,11 @@ async def refresh_access_token(
 
     new_refresh_token = await rotate_refresh_token(db, refresh_token, user)
     if not new_refresh_token:
+        # Another request (e.g. a second tab) rotated or revoked it first
+        clear_auth_cookies(response)
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Could not rotate refresh token.",
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token.",
         )
 
     access_token = create_access_token(data={"sub": user.email})
@@ -187,11 +190,14 @@ async def refresh_access_token(
 async def logout_user(
     response: Response,
     refresh_token: Optional[str] = Cookie(None, alias=REFRESH_TOKEN_COOKIE_NAME),
+    access_token: Optional[str] = Cookie(None),
     db: AsyncSession = Depends(get_db_session),
 ) -> dict:
     """Logout user by revoking refresh token and clearing auth cookies."""
     if refresh_token:
         await revoke_refresh_token(db, refresh_token)
+    if access_token:
+        invalidate_access_token(access_token)
 
     clear_auth_cookies(response)
     return {"message": "Successfully logged out"}
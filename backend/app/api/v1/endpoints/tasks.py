@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from app.api.deps import get_current_active_user
 from app.models.user import User
 from app.schemas.tasks import (
+    TASK_STATUS_BY_VALUE,
     DatabaseTaskRequest,
     ErrorTaskRequest,
     TaskResponse,
@@ -40,7 +41,7 @@ async def trigger_simple_task(
     """Trigger a simple background task."""
     task = simple_task.delay(request.message)
 
-    return TaskResponse(
+    return TaskResponse.model_construct(
         task_id=task.id,
         status=TaskStatus.PENDING,
         message="Simple task queued successfully",
@@ -78,7 +79,7 @@ async def trigger_database_task(
     table_name = allowed_operations[request.query]
     task = database_task.delay(table_name)
 
-    return TaskResponse(
+    return TaskResponse.model_construct(
         task_id=task.id,
         status=TaskStatus.PENDING,
         message="Database task queued successfully",
@@ -100,7 +101,7 @@ async def trigger_error_task(
     """Trigger an error task for testing purposes."""
     task = error_task.delay(request.should_fail)
 
-    return TaskResponse(
+    return TaskResponse.model_construct(
         task_id=task.id,
         status=TaskStatus.PENDING,
         message="Error task queued successfully",
@@ -122,7 +123,7 @@ async def get_task_result(
     try:
         result = AsyncResult(task_id, app=celery_app)
 
-        task_status = TaskStatus(result.status)
+        task_status = TASK_STATUS_BY_VALUE[result.status]
 
         # Prepare response data
         result_data = None
@@ -138,6 +139,7 @@ async def get_task_result(
         if hasattr(result, "date_done") and result.date_done:
             completed_at = result.date_done.isoformat()
 
+        # Validated: the task's result is arbitrary and must be a dict
         return TaskResultResponse(
             task_id=task_id,
             status=task_status,
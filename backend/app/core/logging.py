@@ -1,6 +1,8 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 import uuid
 from time import monotonic
@@ -23,6 +25,42 @@ def _extract_request_context(request: Request) -> Dict[str, Any]:
     }
 
 
+# Background listener that performs the actual handler I/O (see setup_logging)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+def _route_root_handlers_through_queue() -> None:
+    """
+    Move the root handlers behind a QueueHandler.
+
+    Records are enqueued on the calling thread and written by a
+    QueueListener thread, so the event loop never blocks on stderr or
+    file I/O (e.g. during a burst of database errors).
+    """
+    global _queue_listener
+    _stop_queue_listener()
+
+    handlers = list(logging.root.handlers)
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    logging.root.handlers = [logging.handlers.QueueHandler(log_queue)]
+
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging() -> None:
     """Configure simplified logging for the application."""
     # Clear any existing handlers
@@ -126,6 +164,8 @@ def setup_logging() -> None:
             cache_logger_on_first_use=True,
         )
 
+    _route_root_handlers_through_queue()
+
     # Log startup message with standard logging to avoid duplicate timestamps
     logger = logging.getLogger(__name__)
     logger.info(
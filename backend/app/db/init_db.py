@@ -5,8 +5,11 @@ This module provides functions to initialize the database with default data
 that the application requires to function properly.
 """
 
+import asyncio
+from typing import Awaitable, Callable
+
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import get_settings
 from app.core.logging import get_logger
@@ -99,22 +102,28 @@ async def init_roles_and_admin(db: AsyncSession) -> None:
             logger.error(f"Failed to promote initial admin user: {e}")
 
 
-async def init_database(db: AsyncSession) -> None:
+async def init_database(session_factory: async_sessionmaker[AsyncSession]) -> None:
     """
     Initialize database with default data.
 
     This function should be called on application startup to ensure
-    all required default data exists in the database.
+    all required default data exists in the database. LLM settings and
+    roles are independent, so they are initialized concurrently, each on
+    its own pooled session (a single AsyncSession cannot run queries
+    concurrently).
 
     Args:
-        db: Database session
+        session_factory: Factory producing database sessions
     """
     logger.info("Initializing database with default data...")
 
-    # Initialize default LLM settings
-    await init_default_llm_settings(db)
+    async def run_in_session(init: Callable[[AsyncSession], Awaitable[None]]) -> None:
+        async with session_factory() as db:
+            await init(db)
 
-    # Initialize roles and admin user
-    await init_roles_and_admin(db)
+    await asyncio.gather(
+        run_in_session(init_default_llm_settings),
+        run_in_session(init_roles_and_admin),
+    )
 
     logger.info("Database initialization completed")
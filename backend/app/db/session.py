@@ -3,8 +3,10 @@ import functools
 from collections.abc import AsyncGenerator, Awaitable
 from typing import Callable, Optional, ParamSpec, Tuple, Type, TypeVar
 
+from fastapi import HTTPException
 from sqlalchemy import text
 from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DBAPIError, OperationalError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
@@ -105,15 +107,11 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 
         # Don't log authentication/authorization errors as database errors
         # These are expected when users access protected endpoints without auth
-        from fastapi import HTTPException
-
         if isinstance(e, HTTPException) and e.status_code in (401, 403):
             # Re-raise without logging as a database error
             raise
 
         # Log actual database errors with specific handling
-        from sqlalchemy.exc import SQLAlchemyError
-
         if isinstance(e, SQLAlchemyError):
             logger.error(f"Database error, rolling back: {e}")
         else:
@@ -144,8 +142,6 @@ def with_transaction_retry(
     """
     if retry_on is None:
         # Default to retrying on common transient database errors
-        from sqlalchemy.exc import DBAPIError, OperationalError
-
         retry_on = (OperationalError, DBAPIError)
 
     def decorator(func: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
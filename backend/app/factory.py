@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -14,10 +16,15 @@ from app.middlewares.rate_limit import register_rate_limit
 from app.middlewares.request_timing_middleware import register_request_id_and_timing
 from app.middlewares.session_middleware import register_session
 from app.middlewares.trusted_hosts_middleware import register_trusted_hosts
+from app.services.api_key import last_used_flusher
+from app.services.llm import get_llm_service_cache, preload_llm_service
+from app.services.llm_settings import llm_settings_service
+from app.utils.fast_json import install_jose_json
 
 
 def create_app() -> FastAPI:
     """Application factory for creating FastAPI app instances."""
+    install_jose_json()
 
     @asynccontextmanager
     async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
@@ -28,13 +35,23 @@ def create_app() -> FastAPI:
         # Skip database initialization in test environment
         if settings.ENVIRONMENT != "test":
             # Initialize database with default data
-            async with async_session_factory() as db:
-                await init_database(db)
+            await init_database(async_session_factory)
+            last_used_flusher.start(async_session_factory)
+            # Warm the LLM caches without delaying startup on a slow provider
+            llm_preload = asyncio.create_task(
+                preload_llm_service(async_session_factory)
+            )
 
         yield
 
         # Skip database connection cleanup in test environment
         if settings.ENVIRONMENT != "test":
+            llm_preload.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await llm_preload
+            await get_llm_service_cache().aclose()
+            await llm_settings_service.aclose()
+            await last_used_flusher.stop()
             await close_db_connection()
 
     app = FastAPI(
@@ -7,6 +7,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -26,6 +27,10 @@ class ApiKey(SQLModel, table=True):
             "expires_at IS NULL OR expires_at > created_at",
             name="ck_expires_after_created",
         ),
+        # Covers active-key lookups/counts per user without touching the heap
+        Index("ix_apikey_user_active", "user_id", "revoked_at", "expires_at"),
+        # Serves a user's key list in creation order without a sort step
+        Index("ix_apikey_user_created", "user_id", "created_at"),
     )
 
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -45,8 +50,10 @@ class ApiKey(SQLModel, table=True):
         sa_column=Column(String(36), nullable=False, unique=True, index=True)
     )
 
-    # SHA256 hash of the full JWT token for constant-time lookup
-    token_hash: str = Field(sa_column=Column(String(64), nullable=False, index=True))
+    # SHA256 hash of the full JWT token; unique, used to look keys up
+    token_hash: str = Field(
+        sa_column=Column(String(64), nullable=False, unique=True, index=True)
+    )
 
     # Optional user-provided label
     label: Optional[str] = Field(
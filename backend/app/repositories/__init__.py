@@ -1,11 +1,11 @@
 """Repository layer for data access abstraction."""
 
-from .api_key import ApiKeyRepository
+from .api_key import ApiKeyRepository, api_key_repository
 from .base import BaseRepository
-from .llm_settings import LLMSettingsRepository
-from .refresh_token import RefreshTokenRepository
-from .role import RoleRepository
-from .user import UserRepository
+from .llm_settings import LLMSettingsRepository, llm_settings_repository
+from .refresh_token import RefreshTokenRepository, refresh_token_repository
+from .role import RoleRepository, role_repository
+from .user import UserRepository, user_repository
 
 __all__ = [
     "BaseRepository",
@@ -14,4 +14,9 @@ __all__ = [
     "LLMSettingsRepository",
     "RefreshTokenRepository",
     "RoleRepository",
+    "user_repository",
+    "api_key_repository",
+    "llm_settings_repository",
+    "refresh_token_repository",
+    "role_repository",
 ]
@@ -1,47 +1,58 @@
 """API Key repository for encapsulating API key database operations."""
 
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import DateTime, Integer, column, func, or_, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlmodel import col, select
 
-from app.core.logging import get_logger
 from app.models.api_key import ApiKey
 
 from .base import BaseRepository
 
-logger = get_logger(__name__)
 
+def _active_key_filter() -> Tuple[Any, ...]:
+    """
+    Build SQL criteria matching ``ApiKey.is_active`` (not revoked, not expired).
+
+    Returns:
+        Where-clause criteria to apply to an ApiKey query
+    """
+    now = datetime.now(timezone.utc)
+    return (
+        ApiKey.revoked_at.is_(None),  # type: ignore[union-attr]
+        or_(
+            ApiKey.expires_at.is_(None),  # type: ignore[union-attr]
+            col(ApiKey.expires_at) > now,
+        ),
+    )
 
-class ApiKeyRepository(BaseRepository[ApiKey]):
-    """Repository for ApiKey entity database operations."""
 
-    def __init__(self) -> None:
-        """Initialize the ApiKeyRepository."""
-        super().__init__(ApiKey)
+class ApiKeyRepository(BaseRepository[ApiKey], model=ApiKey):
+    """Repository for ApiKey entity database operations."""
 
     async def get_by_user_id(self, db: AsyncSession, user_id: int) -> List[ApiKey]:
         """
-        Get all API keys for a specific user.
+        Get all API keys for a specific user, newest first.
 
         Args:
             db: Database session
             user_id: User ID
 
         Returns:
-            List of API keys for the user
+            List of API keys for the user, ordered by creation date descending
 
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = select(ApiKey).where(ApiKey.user_id == user_id)
-            result = await db.execute(statement)
-            return list(result.scalars().all())
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting API keys for user {user_id}: {e}")
-            raise
+        statement = (
+            select(ApiKey)
+            .where(ApiKey.user_id == user_id)
+            .order_by(ApiKey.created_at.desc())  # type: ignore[attr-defined]
+        )
+        result = await db.execute(statement)
+        return list(result.scalars().all())
 
     async def get_active_by_user_id(
         self, db: AsyncSession, user_id: int
@@ -59,16 +70,11 @@ class ApiKeyRepository(BaseRepository[ApiKey]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            # Get all keys for user and filter active ones in Python
-            # since is_active is a property, not a database column
-            all_keys = await self.get_by_user_id(db, user_id)
-            return [key for key in all_keys if key.is_active]
-        except SQLAlchemyError as e:
-            logger.error(
-                f"Database error getting active API keys for user {user_id}: {e}"
-            )
-            raise
+        statement = select(ApiKey).where(
+            ApiKey.user_id == user_id, *_active_key_filter()
+        )
+        result = await db.execute(statement)
+        return list(result.scalars().all())
 
     async def get_by_jti(self, db: AsyncSession, jti: str) -> Optional[ApiKey]:
         """
@@ -84,13 +90,29 @@ class ApiKeyRepository(BaseRepository[ApiKey]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = select(ApiKey).where(ApiKey.jti == jti)
-            result = await db.execute(statement)
-            return result.scalars().first()
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting API key by JTI {jti}: {e}")
-            raise
+        statement = select(ApiKey).where(ApiKey.jti == jti)
+        result = await db.execute(statement)
+        return result.scalars().first()
+
+    async def get_by_token_hash(
+        self, db: AsyncSession, token_hash: str
+    ) -> Optional[ApiKey]:
+        """
+        Get an API key by the hash of its token.
+
+        Args:
+            db: Database session
+            token_hash: SHA256 hash of the JWT token
+
+        Returns:
+            ApiKey if found, None otherwise
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        statement = select(ApiKey).where(ApiKey.token_hash == token_hash)
+        result = await db.execute(statement)
+        return result.scalars().first()
 
     async def count_active_by_user_id(self, db: AsyncSession, user_id: int) -> int:
         """
@@ -106,14 +128,13 @@ class ApiKeyRepository(BaseRepository[ApiKey]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            active_keys = await self.get_active_by_user_id(db, user_id)
-            return len(active_keys)
-        except SQLAlchemyError as e:
-            logger.error(
-                f"Database error counting active API keys for user {user_id}: {e}"
-            )
-            raise
+        statement = (
+            select(func.count())
+            .select_from(ApiKey)
+            .where(ApiKey.user_id == user_id, *_active_key_filter())
+        )
+        result = await db.execute(statement)
+        return result.scalar() or 0
 
     async def get_by_user_id_and_key_id(
         self, db: AsyncSession, user_id: int, key_id: int
@@ -132,14 +153,65 @@ class ApiKeyRepository(BaseRepository[ApiKey]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = select(ApiKey).where(
-                ApiKey.id == key_id, ApiKey.user_id == user_id
-            )
-            result = await db.execute(statement)
-            return result.scalars().first()
-        except SQLAlchemyError as e:
-            logger.error(
-                f"Database error getting API key {key_id} for user {user_id}: {e}"
-            )
-            raise
+        statement = select(ApiKey).where(ApiKey.id == key_id, ApiKey.user_id == user_id)
+        result = await db.execute(statement)
+        return result.scalars().first()
+
+    async def get_by_user_id_and_key_ids(
+        self, db: AsyncSession, user_id: int, key_ids: Sequence[int]
+    ) -> Dict[int, ApiKey]:
+        """
+        Get several API keys owned by a user in a single query.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            key_ids: API key IDs to look up
+
+        Returns:
+            Mapping of key ID to ApiKey for the keys found and owned by the user.
+            IDs that do not exist or belong to another user are absent.
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not key_ids:
+            return {}
+        statement = select(ApiKey).where(
+            ApiKey.user_id == user_id,
+            ApiKey.id.in_(set(key_ids)),  # type: ignore[union-attr]
+        )
+        result = await db.execute(statement)
+        return {key.id: key for key in result.scalars().all() if key.id is not None}
+
+    async def bulk_update_last_used(
+        self, db: AsyncSession, last_used: Mapping[int, datetime]
+    ) -> None:
+        """
+        Set ``last_used_at`` for many API keys with a single UPDATE.
+
+        Args:
+            db: Database session
+            last_used: Mapping of key ID to its last-used timestamp
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if not last_used:
+            return
+        rows = values(
+            column("id", Integer),
+            column("last_used_at", DateTime(timezone=True)),
+            name="last_used",
+        ).data(list(last_used.items()))
+        statement = (
+            update(ApiKey)
+            .where(ApiKey.id == rows.c.id)  # type: ignore[arg-type]
+            .values(last_used_at=rows.c.last_used_at)
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(statement)
+        await db.commit()
+
+
+api_key_repository = ApiKeyRepository()
@@ -1,7 +1,21 @@
 """Base repository class providing common database operations."""
 
-from abc import ABC
-from typing import Generic, List, Optional, Type, TypeVar, cast
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    ParamSpec,
+    Type,
+    TypeVar,
+    cast,
+)
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -14,23 +28,171 @@ logger = get_logger(__name__)
 # Generic type for SQLModel entities
 T = TypeVar("T", bound=SQLModel)
 
+P = ParamSpec("P")
+R = TypeVar("R")
 
-class BaseRepository(ABC, Generic[T]):
+# Number of wrapped repository calls on the current task's stack
+_db_call_depth: ContextVar[int] = ContextVar("db_call_depth", default=0)
+
+# Arguments never written to the log (secrets or their hashes)
+_REDACTED_ARG_PARTS = ("token", "password", "hash", "secret")
+
+
+def _describe_args(
+    signature: inspect.Signature, args: tuple[Any, ...], kwargs: Dict[str, Any]
+) -> str:
+    """
+    Format the identifying arguments of a repository call for logging.
+
+    The session and any secret-looking arguments are left out, and entities
+    are reduced to their class name and ID.
+
+    Args:
+        signature: Signature of the repository method
+        args: Positional arguments of the call, including ``self``
+        kwargs: Keyword arguments of the call
+
+    Returns:
+        Comma-separated ``name=value`` pairs
+    """
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError:
+        return ""
+    parts = []
+    for name, value in bound.arguments.items():
+        if name in ("self", "db") or any(p in name for p in _REDACTED_ARG_PARTS):
+            continue
+        if isinstance(value, SQLModel):
+            shown = f"{type(value).__name__}(id={getattr(value, 'id', None)!r})"
+        else:
+            shown = repr(value)
+        parts.append(f"{name}={shown}")
+    return ", ".join(parts)
+
+
+def log_db_errors(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+    """
+    Log and re-raise SQLAlchemy errors raised by a repository coroutine method.
+
+    ``BaseRepository`` applies this to every public coroutine method of each
+    repository class, so individual methods do not need their own try/except.
+    When repository methods call each other, only the outermost call logs,
+    so a single failure produces a single traceback.
+
+    Args:
+        fn: Repository coroutine method to wrap
+
+    Returns:
+        Wrapped coroutine method
+    """
+    if getattr(fn, "__logs_db_errors__", False):
+        return fn
+
+    signature = inspect.signature(fn)
+
+    @functools.wraps(fn)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        depth = _db_call_depth.get()
+        token = _db_call_depth.set(depth + 1)
+        try:
+            return await fn(*args, **kwargs)
+        except SQLAlchemyError:
+            if depth == 0:
+                owner = type(args[0]).__name__ if args else ""
+                logger.exception(
+                    "Database error in %s.%s(%s)",
+                    owner,
+                    fn.__name__,
+                    _describe_args(signature, args, kwargs),
+                )
+            raise
+        finally:
+            _db_call_depth.reset(token)
+
+    wrapper.__logs_db_errors__ = True  # type: ignore[attr-defined]
+    return wrapper
+
+
+def _wrap_db_methods(cls: type) -> None:
+    """Apply ``log_db_errors`` to the public coroutine methods defined on ``cls``."""
+    for name, attr in list(cls.__dict__.items()):
+        if not name.startswith("_") and inspect.iscoroutinefunction(attr):
+            setattr(cls, name, log_db_errors(attr))
+
+
+def _specialize(model: Type[SQLModel]) -> Dict[str, Callable[..., Any]]:
+    """
+    Build read methods with the model class bound as a closure variable.
+
+    The generated methods mirror the generic ones on ``BaseRepository`` but
+    reference ``model`` directly instead of resolving ``self.model`` per call.
+
+    Args:
+        model: The SQLModel class to bind
+
+    Returns:
+        Mapping of method name to specialized function
+    """
+    statement_all = select(model)
+
+    async def get_by_id(self: Any, db: AsyncSession, id: int) -> Optional[Any]:
+        return await db.get(model, id)
+
+    async def get_all(self: Any, db: AsyncSession) -> List[Any]:
+        result = await db.execute(statement_all)
+        return list(result.scalars().all())
+
+    specialized: Dict[str, Callable[..., Any]] = {
+        "get_by_id": get_by_id,
+        "get_all": get_all,
+    }
+    for name, fn in specialized.items():
+        fn.__doc__ = getattr(BaseRepository, name).__doc__
+    return specialized
+
+
+class BaseRepository(Generic[T]):
     """
     Base repository class providing common database operations.
 
     This class implements the Repository pattern to encapsulate database access logic
     and provide a consistent interface for data operations across different entities.
+
+    Concrete repositories bind their model at class definition time::
+
+        class UserRepository(BaseRepository[User], model=User): ...
+
+    Hot read paths (``get_by_id``, ``get_all``) are then specialized for that
+    model so they do not look up ``self.model`` on every call.
+
+    Repositories hold no per-instance state; each module exposes a shared
+    instance (e.g. ``user_repository``) that callers should use instead of
+    constructing their own.
     """
 
-    def __init__(self, model: Type[T]) -> None:
+    model: Type[T]
+
+    def __init_subclass__(
+        cls, model: Optional[Type[SQLModel]] = None, **kwargs: Any
+    ) -> None:
         """
-        Initialize the repository with a specific model type.
+        Bind the managed model, install specialized read methods and wrap
+        the subclass's coroutine methods with ``log_db_errors``.
 
         Args:
             model: The SQLModel class this repository manages
+            **kwargs: Forwarded to ``super().__init_subclass__``
         """
-        self.model = model
+        super().__init_subclass__(**kwargs)
+        if model is not None:
+            cls.model = cast(Type[T], model)
+            for name, fn in _specialize(model).items():
+                # Respect explicit overrides declared on the subclass itself
+                if name not in cls.__dict__:
+                    fn.__qualname__ = f"{cls.__qualname__}.{name}"
+                    setattr(cls, name, fn)
+        _wrap_db_methods(cls)
 
     async def get_by_id(self, db: AsyncSession, id: int) -> Optional[T]:
         """
@@ -46,13 +208,7 @@ class BaseRepository(ABC, Generic[T]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            return await db.get(self.model, id)
-        except SQLAlchemyError as e:
-            logger.error(
-                f"Database error getting {self.model.__name__} by ID {id}: {e}"
-            )
-            raise
+        return await db.get(self.model, id)
 
     async def get_all(self, db: AsyncSession) -> List[T]:
         """
@@ -67,13 +223,9 @@ class BaseRepository(ABC, Generic[T]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = select(self.model)
-            result = await db.execute(statement)
-            return list(result.scalars().all())
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting all {self.model.__name__}: {e}")
-            raise
+        statement = select(self.model)
+        result = await db.execute(statement)
+        return list(result.scalars().all())
 
     async def create(self, db: AsyncSession, entity: T) -> T:
         """
@@ -94,9 +246,8 @@ class BaseRepository(ABC, Generic[T]):
             await db.commit()
             await db.refresh(entity)
             return entity
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             await db.rollback()
-            logger.error(f"Database error creating {self.model.__name__}: {e}")
             raise
 
     async def update(self, db: AsyncSession, entity: T) -> T:
@@ -119,9 +270,8 @@ class BaseRepository(ABC, Generic[T]):
             await db.commit()
             await db.refresh(merged_entity)
             return merged_entity
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             await db.rollback()
-            logger.error(f"Database error updating {self.model.__name__}: {e}")
             raise
 
     async def delete(self, db: AsyncSession, entity: T) -> None:
@@ -139,9 +289,8 @@ class BaseRepository(ABC, Generic[T]):
             # db.delete() is synchronous, not awaitable
             db.delete(entity)  # type: ignore[unused-coroutine]
             await db.commit()
-        except SQLAlchemyError as e:
+        except SQLAlchemyError:
             await db.rollback()
-            logger.error(f"Database error deleting {self.model.__name__}: {e}")
             raise
 
     async def exists_by_id(self, db: AsyncSession, id: int) -> bool:
@@ -158,11 +307,8 @@ class BaseRepository(ABC, Generic[T]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            entity = await self.get_by_id(db, id)
-            return entity is not None
-        except SQLAlchemyError as e:
-            logger.error(
-                f"Database error checking existence of {self.model.__name__} by ID {id}: {e}"
-            )
-            raise
+        entity = await self.get_by_id(db, id)
+        return entity is not None
+
+
+_wrap_db_methods(BaseRepository)
@@ -2,24 +2,19 @@
 
 from typing import Optional
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
 
-from app.core.logging import get_logger
 from app.models.llm_settings import LLMSettings
 
 from .base import BaseRepository
 
-logger = get_logger(__name__)
 
-
-class LLMSettingsRepository(BaseRepository[LLMSettings]):
+class LLMSettingsRepository(BaseRepository[LLMSettings], model=LLMSettings):
     """Repository for LLMSettings entity database operations."""
 
-    def __init__(self) -> None:
-        """Initialize the LLMSettingsRepository."""
-        super().__init__(LLMSettings)
-
     async def get_default_settings(self, db: AsyncSession) -> Optional[LLMSettings]:
         """
         Get the default LLM settings (ID = 1).
@@ -33,11 +28,7 @@ class LLMSettingsRepository(BaseRepository[LLMSettings]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            return await self.get_by_id(db, 1)
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting default LLM settings: {e}")
-            raise
+        return await self.get_by_id(db, 1)
 
     async def create_default_settings(
         self, db: AsyncSession, settings: LLMSettings
@@ -55,20 +46,79 @@ class LLMSettingsRepository(BaseRepository[LLMSettings]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            # Create a new settings object with ID = 1 to avoid modifying the input
-            default_settings = LLMSettings(
-                id=1,
-                provider=settings.provider,
-                openai_model=settings.openai_model,
-                openrouter_model=settings.openrouter_model,
-                bedrock_model=settings.bedrock_model,
-                lmstudio_model=settings.lmstudio_model,
+        # Create a new settings object with ID = 1 to avoid modifying the input
+        default_settings = LLMSettings(
+            id=1,
+            provider=settings.provider,
+            openai_model=settings.openai_model,
+            openrouter_model=settings.openrouter_model,
+            bedrock_model=settings.bedrock_model,
+            lmstudio_model=settings.lmstudio_model,
+        )
+        return await self.create(db, default_settings)
+
+    async def get_or_create_default_settings(
+        self, db: AsyncSession, settings: LLMSettings
+    ) -> LLMSettings:
+        """
+        Create the default LLM settings (ID = 1) unless they already exist.
+
+        On PostgreSQL a single ``INSERT ... ON CONFLICT (id) DO UPDATE ...
+        RETURNING`` returns the row whether this call or a concurrent one
+        created it; the no-op update leaves existing settings unchanged.
+        Other databases insert and, if the row appeared in the meantime,
+        read it back.
+
+        Args:
+            db: Database session
+            settings: LLM settings to create if none exist
+
+        Returns:
+            The stored default LLM settings
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        if db.get_bind().dialect.name != "postgresql":
+            return await self._create_or_get_default_settings(db, settings)
+
+        insert_statement = insert(LLMSettings).values(
+            id=1,
+            provider=settings.provider,
+            openai_model=settings.openai_model,
+            openrouter_model=settings.openrouter_model,
+            bedrock_model=settings.bedrock_model,
+            lmstudio_model=settings.lmstudio_model,
+        )
+        statement = (
+            insert_statement.on_conflict_do_update(
+                index_elements=[col(LLMSettings.id)],
+                set_={"id": insert_statement.excluded.id},
             )
-            return await self.create(db, default_settings)
-        except SQLAlchemyError as e:
-            logger.error(f"Database error creating default LLM settings: {e}")
+            .returning(LLMSettings)
+            .execution_options(populate_existing=True)
+        )
+        try:
+            result = await db.scalars(statement)
+            default_settings = result.one()
+            await db.commit()
+        except SQLAlchemyError:
+            await db.rollback()
             raise
+        return default_settings
+
+    async def _create_or_get_default_settings(
+        self, db: AsyncSession, settings: LLMSettings
+    ) -> LLMSettings:
+        """Insert the default settings, or read them if another session won."""
+        try:
+            return await self.create_default_settings(db, settings)
+        except IntegrityError:
+            # create() has rolled back; the row now exists unless it was removed
+            existing = await self.get_default_settings(db)
+            if existing is None:
+                raise
+            return existing
 
     async def update_default_settings(
         self, db: AsyncSession, settings: LLMSettings
@@ -86,8 +136,7 @@ class LLMSettingsRepository(BaseRepository[LLMSettings]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            return await self.update(db, settings)
-        except SQLAlchemyError as e:
-            logger.error(f"Database error updating default LLM settings: {e}")
-            raise
+        return await self.update(db, settings)
+
+
+llm_settings_repository = LLMSettingsRepository()
@@ -1,27 +1,22 @@
 """Refresh Token repository for encapsulating refresh token database operations."""
 
+from datetime import datetime
 from typing import Optional
 
+from sqlalchemy import update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
-from sqlmodel import select
+from sqlmodel import col, select
 
-from app.core.logging import get_logger
 from app.models.refresh_token import RefreshToken
 
 from .base import BaseRepository
 
-logger = get_logger(__name__)
 
-
-class RefreshTokenRepository(BaseRepository[RefreshToken]):
+class RefreshTokenRepository(BaseRepository[RefreshToken], model=RefreshToken):
     """Repository for RefreshToken entity database operations."""
 
-    def __init__(self) -> None:
-        """Initialize the RefreshTokenRepository."""
-        super().__init__(RefreshToken)
-
     async def get_by_token(
         self, db: AsyncSession, token: str
     ) -> Optional[RefreshToken]:
@@ -38,17 +33,13 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = (
-                select(RefreshToken)
-                .where(RefreshToken.token == token)
-                .options(selectinload(RefreshToken.user))  # type: ignore[arg-type]
-            )
-            result = await db.execute(statement)
-            return result.scalars().first()
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting refresh token by token: {e}")
-            raise
+        statement = (
+            select(RefreshToken)
+            .where(RefreshToken.token == token)
+            .options(selectinload(RefreshToken.user))  # type: ignore[arg-type]
+        )
+        result = await db.execute(statement)
+        return result.scalars().first()
 
     async def get_by_user_id(
         self, db: AsyncSession, user_id: int
@@ -66,15 +57,9 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = select(RefreshToken).where(RefreshToken.user_id == user_id)
-            result = await db.execute(statement)
-            return result.scalars().first()
-        except SQLAlchemyError as e:
-            logger.error(
-                f"Database error getting refresh token by user ID {user_id}: {e}"
-            )
-            raise
+        statement = select(RefreshToken).where(RefreshToken.user_id == user_id)
+        result = await db.execute(statement)
+        return result.scalars().first()
 
     async def delete_by_user_id(self, db: AsyncSession, user_id: int) -> None:
         """
@@ -87,15 +72,9 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            refresh_token = await self.get_by_user_id(db, user_id)
-            if refresh_token:
-                await self.delete(db, refresh_token)
-        except SQLAlchemyError as e:
-            logger.error(
-                f"Database error deleting refresh token for user {user_id}: {e}"
-            )
-            raise
+        refresh_token = await self.get_by_user_id(db, user_id)
+        if refresh_token:
+            await self.delete(db, refresh_token)
 
     async def delete_by_token(self, db: AsyncSession, token: str) -> None:
         """
@@ -105,13 +84,83 @@ class RefreshTokenRepository(BaseRepository[RefreshToken]):
             db: Database session
             token: Token value
 
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        refresh_token = await self.get_by_token(db, token)
+        if refresh_token:
+            await self.delete(db, refresh_token)
+
+    async def insert(self, db: AsyncSession, refresh_token: RefreshToken) -> None:
+        """
+        Store a new refresh token without reloading it afterwards.
+
+        Unlike ``create``, this skips the post-commit ``refresh`` round trip;
+        callers only need the token value they generated.
+
+        Args:
+            db: Database session
+            refresh_token: Token to insert
+
         Raises:
             SQLAlchemyError: If database operation fails
         """
         try:
-            refresh_token = await self.get_by_token(db, token)
-            if refresh_token:
-                await self.delete(db, refresh_token)
-        except SQLAlchemyError as e:
-            logger.error(f"Database error deleting refresh token by token: {e}")
+            db.add(refresh_token)
+            await db.commit()
+        except SQLAlchemyError:
+            await db.rollback()
             raise
+
+    async def rotate(
+        self,
+        db: AsyncSession,
+        old_token: str,
+        replacement: RefreshToken,
+        revoked_at: datetime,
+    ) -> bool:
+        """
+        Revoke a token and store its replacement in one transaction.
+
+        The revoke is a single conditional ``UPDATE ... RETURNING``, so a token
+        that is already revoked, or belongs to another user, is never rotated;
+        this also makes concurrent refreshes with the same token rotate once.
+
+        Args:
+            db: Database session
+            old_token: Token value to revoke
+            replacement: New token to insert for the same user
+            revoked_at: Revocation timestamp for the old token
+
+        Returns:
+            True if the old token was revoked and the replacement stored
+
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        statement = (
+            update(RefreshToken)
+            .where(
+                RefreshToken.token == old_token,  # type: ignore[arg-type]
+                RefreshToken.user_id == replacement.user_id,  # type: ignore[arg-type]
+                RefreshToken.revoked_at.is_(None),  # type: ignore[union-attr]
+            )
+            .values(revoked_at=revoked_at)
+            .returning(col(RefreshToken.id))
+            .execution_options(synchronize_session=False)
+        )
+        result = await db.execute(statement)
+        if result.scalar_one_or_none() is None:
+            await db.rollback()
+            return False
+
+        try:
+            db.add(replacement)
+            await db.commit()
+        except SQLAlchemyError:
+            await db.rollback()
+            raise
+        return True
+
+
+refresh_token_repository = RefreshTokenRepository()
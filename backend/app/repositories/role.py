@@ -2,25 +2,17 @@
 
 from typing import List, Optional
 
-from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
-from app.core.logging import get_logger
 from app.models.role import Role
 
 from .base import BaseRepository
 
-logger = get_logger(__name__)
 
-
-class RoleRepository(BaseRepository[Role]):
+class RoleRepository(BaseRepository[Role], model=Role):
     """Repository for Role entity database operations."""
 
-    def __init__(self) -> None:
-        """Initialize the RoleRepository."""
-        super().__init__(Role)
-
     async def get_by_name(self, db: AsyncSession, name: str) -> Optional[Role]:
         """
         Get a role by name.
@@ -35,13 +27,9 @@ class RoleRepository(BaseRepository[Role]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = select(Role).where(Role.name.ilike(name))  # type: ignore[attr-defined]
-            result = await db.execute(statement)
-            return result.scalars().first()
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting role by name {name}: {e}")
-            raise
+        statement = select(Role).where(Role.name.ilike(name))  # type: ignore[attr-defined]
+        result = await db.execute(statement)
+        return result.scalars().first()
 
     async def get_all_active(self, db: AsyncSession) -> List[Role]:
         """
@@ -56,11 +44,7 @@ class RoleRepository(BaseRepository[Role]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            return await self.get_all(db)
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting all active roles: {e}")
-            raise
+        return await self.get_all(db)
 
     async def name_exists(self, db: AsyncSession, name: str) -> bool:
         """
@@ -76,9 +60,8 @@ class RoleRepository(BaseRepository[Role]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            role = await self.get_by_name(db, name)
-            return role is not None
-        except SQLAlchemyError as e:
-            logger.error(f"Database error checking if role name exists {name}: {e}")
-            raise
+        role = await self.get_by_name(db, name)
+        return role is not None
+
+
+role_repository = RoleRepository()
@@ -4,26 +4,18 @@ from datetime import datetime, timezone
 from typing import List, Optional
 
 from sqlalchemy import func
-from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
-from app.core.logging import get_logger
 from app.models.user import User
 
 from .base import BaseRepository
 
-logger = get_logger(__name__)
 
-
-class UserRepository(BaseRepository[User]):
+class UserRepository(BaseRepository[User], model=User):
     """Repository for User entity database operations."""
 
-    def __init__(self) -> None:
-        """Initialize the UserRepository."""
-        super().__init__(User)
-
     async def get_by_email(self, db: AsyncSession, email: str) -> Optional[User]:
         """
         Get a user by email address.
@@ -38,13 +30,9 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = select(User).where(User.email == email)
-            result = await db.execute(statement)
-            return result.scalars().first()
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting user by email {email}: {e}")
-            raise
+        statement = select(User).where(User.email == email)
+        result = await db.execute(statement)
+        return result.scalars().first()
 
     async def email_exists(self, db: AsyncSession, email: str) -> bool:
         """
@@ -60,12 +48,8 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            user = await self.get_by_email(db, email)
-            return user is not None
-        except SQLAlchemyError as e:
-            logger.error(f"Database error checking if email exists {email}: {e}")
-            raise
+        user = await self.get_by_email(db, email)
+        return user is not None
 
     async def get_by_id_with_role(
         self, db: AsyncSession, user_id: int
@@ -83,15 +67,11 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = (
-                select(User).where(User.id == user_id).options(selectinload(User.role))  # type: ignore[arg-type]
-            )
-            result = await db.execute(statement)
-            return result.scalars().first()
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting user by ID with role {user_id}: {e}")
-            raise
+        statement = (
+            select(User).where(User.id == user_id).options(selectinload(User.role))  # type: ignore[arg-type]
+        )
+        result = await db.execute(statement)
+        return result.scalars().first()
 
     async def get_by_email_with_role(
         self, db: AsyncSession, email: str
@@ -109,15 +89,11 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = (
-                select(User).where(User.email == email).options(selectinload(User.role))  # type: ignore[arg-type]
-            )
-            result = await db.execute(statement)
-            return result.scalars().first()
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting user by email with role {email}: {e}")
-            raise
+        statement = (
+            select(User).where(User.email == email).options(selectinload(User.role))  # type: ignore[arg-type]
+        )
+        result = await db.execute(statement)
+        return result.scalars().first()
 
     async def update_user_role(
         self, db: AsyncSession, user_id: int, role_id: int
@@ -136,18 +112,14 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            user = await self.get_by_id(db, user_id)
-            if not user:
-                return None
+        user = await self.get_by_id(db, user_id)
+        if not user:
+            return None
 
-            user.role_id = role_id
-            user.updated_at = datetime.now(timezone.utc)
+        user.role_id = role_id
+        user.updated_at = datetime.now(timezone.utc)
 
-            return await self.update(db, user)
-        except SQLAlchemyError as e:
-            logger.error(f"Database error updating user role {user_id}: {e}")
-            raise
+        return await self.update(db, user)
 
     async def get_users_with_roles(
         self, db: AsyncSession, limit: int = 100, offset: int = 0
@@ -166,18 +138,14 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = (
-                select(User)
-                .options(selectinload(User.role))  # type: ignore[arg-type]
-                .limit(limit)
-                .offset(offset)
-            )
-            result = await db.execute(statement)
-            return list(result.scalars().all())
-        except SQLAlchemyError as e:
-            logger.error(f"Database error getting users with roles: {e}")
-            raise
+        statement = (
+            select(User)
+            .options(selectinload(User.role))  # type: ignore[arg-type]
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await db.execute(statement)
+        return list(result.scalars().all())
 
     async def search_users_by_email(
         self, db: AsyncSession, email_pattern: str, limit: int = 100
@@ -196,20 +164,14 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = (
-                select(User)
-                .where(User.email.ilike(f"%{email_pattern}%"))  # type: ignore[attr-defined]
-                .options(selectinload(User.role))  # type: ignore[arg-type]
-                .limit(limit)
-            )
-            result = await db.execute(statement)
-            return list(result.scalars().all())
-        except SQLAlchemyError as e:
-            logger.error(
-                f"Database error searching users by email {email_pattern}: {e}"
-            )
-            raise
+        statement = (
+            select(User)
+            .where(User.email.ilike(f"%{email_pattern}%"))  # type: ignore[attr-defined]
+            .options(selectinload(User.role))  # type: ignore[arg-type]
+            .limit(limit)
+        )
+        result = await db.execute(statement)
+        return list(result.scalars().all())
 
     async def count_total_users(self, db: AsyncSession) -> int:
         """
@@ -224,13 +186,9 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = select(func.count()).select_from(User)
-            result = await db.execute(statement)
-            return result.scalar() or 0
-        except SQLAlchemyError as e:
-            logger.error(f"Database error counting total users: {e}")
-            raise
+        statement = select(func.count()).select_from(User)
+        result = await db.execute(statement)
+        return result.scalar() or 0
 
     async def count_users_by_email(self, db: AsyncSession, email_pattern: str) -> int:
         """
@@ -246,19 +204,13 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            statement = (
-                select(func.count())
-                .select_from(User)
-                .where(
-                    User.email.ilike(f"%{email_pattern}%")  # type: ignore[attr-defined]
-                )
-            )
-            result = await db.execute(statement)
-            return result.scalar() or 0
-        except SQLAlchemyError as e:
-            logger.error(f"Database error counting users by email: {e}")
-            raise
+        statement = (
+            select(func.count())
+            .select_from(User)
+            .where(User.email.ilike(f"%{email_pattern}%"))  # type: ignore[attr-defined]
+        )
+        result = await db.execute(statement)
+        return result.scalar() or 0
 
     async def soft_delete_user(self, db: AsyncSession, user_id: int) -> Optional[User]:
         """
@@ -274,18 +226,14 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            user = await self.get_by_id(db, user_id)
-            if not user:
-                return None
+        user = await self.get_by_id(db, user_id)
+        if not user:
+            return None
 
-            user.is_active = False
-            user.updated_at = datetime.now(timezone.utc)
+        user.is_active = False
+        user.updated_at = datetime.now(timezone.utc)
 
-            return await self.update(db, user)
-        except SQLAlchemyError as e:
-            logger.error(f"Database error soft deleting user {user_id}: {e}")
-            raise
+        return await self.update(db, user)
 
     async def activate_user(self, db: AsyncSession, user_id: int) -> Optional[User]:
         """
@@ -301,18 +249,14 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            user = await self.get_by_id(db, user_id)
-            if not user:
-                return None
+        user = await self.get_by_id(db, user_id)
+        if not user:
+            return None
 
-            user.is_active = True
-            user.updated_at = datetime.now(timezone.utc)
+        user.is_active = True
+        user.updated_at = datetime.now(timezone.utc)
 
-            return await self.update(db, user)
-        except SQLAlchemyError as e:
-            logger.error(f"Database error activating user {user_id}: {e}")
-            raise
+        return await self.update(db, user)
 
     async def hard_delete_user(self, db: AsyncSession, user_id: int) -> bool:
         """
@@ -328,13 +272,12 @@ class UserRepository(BaseRepository[User]):
         Raises:
             SQLAlchemyError: If database operation fails
         """
-        try:
-            user = await self.get_by_id(db, user_id)
-            if not user:
-                return False
-
-            await db.delete(user)
-            return True
-        except SQLAlchemyError as e:
-            logger.error(f"Database error hard deleting user {user_id}: {e}")
-            raise
+        user = await self.get_by_id(db, user_id)
+        if not user:
+            return False
+
+        await db.delete(user)
+        return True
+
+
+user_repository = UserRepository()
@@ -0,0 +1,39 @@
+"""Shared string constraints for schema fields (free text and emails)."""
+
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+# Shape-only check for emails that were validated as EmailStr when stored.
+# Read schemas use it to skip email-validator's per-value parsing.
+StoredEmail = Annotated[
+    str,
+    StringConstraints(pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$", max_length=254),
+]
+
+
+def whitelist_pattern(extra: str, *, allow_whitespace: bool = True) -> str:
+    """
+    Build a regex accepting ASCII letters, digits and ``extra`` characters.
+
+    The pattern avoids look-arounds so pydantic-core can run it with its Rust
+    regex engine via ``StringConstraints(pattern=...)``. Use it together with
+    ``strip_whitespace=True``.
+
+    Args:
+        extra: Additional allowed characters (e.g. punctuation)
+        allow_whitespace: Whether whitespace may appear inside the value; two
+            consecutive spaces are still rejected
+
+    Returns:
+        Anchored regular expression
+    """
+    # A trailing hyphen is literal inside a character class
+    chars = "A-Za-z0-9" + extra.replace("-", "") + ("-" if "-" in extra else "")
+    allowed = f"[{chars}]"
+    if not allow_whitespace:
+        return f"^{allowed}+$"
+
+    # Runs of allowed characters or non-space whitespace, joined by single spaces
+    word = rf"(?:{allowed}|[^\S ])+"
+    return rf"^{word}(?: {word})*$"
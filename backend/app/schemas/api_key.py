@@ -4,47 +4,33 @@ Pydantic schemas for Personal API Key management.
 These schemas define the request and response models for API key operations.
 """
 
-import re
 from datetime import datetime
-from typing import List, Optional
+from typing import Annotated, Any, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+
+from ._text_validation import whitelist_pattern
+
+# Alphanumeric, whitespace, hyphens, underscores; no consecutive spaces
+_Label = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True,
+        min_length=1,
+        max_length=128,
+        pattern=whitelist_pattern("-_"),
+    ),
+]
 
 
 class ApiKeyBase(BaseModel):
     """Base schema for API key fields."""
 
-    label: Optional[str] = Field(
+    label: Optional[_Label] = Field(
         None,
-        min_length=1,
-        max_length=128,
         description="Optional user-provided label for the API key (1-128 characters, alphanumeric, spaces, hyphens, underscores)",
     )
 
-    @field_validator("label")
-    @classmethod
-    def validate_label(cls, v: Optional[str]) -> Optional[str]:
-        """Validate label format and content."""
-        if v is not None:
-            # Remove leading/trailing whitespace
-            v = v.strip()
-
-            # Check if empty after stripping
-            if not v:
-                raise ValueError("Label cannot be empty or whitespace only")
-
-            # Check pattern - allow alphanumeric, spaces, hyphens, underscores
-            if not re.match(r"^[a-zA-Z0-9\s\-_]+$", v):
-                raise ValueError(
-                    "Label can only contain letters, numbers, spaces, hyphens, and underscores"
-                )
-
-            # Check for consecutive spaces
-            if "  " in v:
-                raise ValueError("Label cannot contain consecutive spaces")
-
-        return v
-
 
 class ApiKeyCreate(ApiKeyBase):
     """Schema for creating a new API key."""
@@ -107,6 +93,18 @@ class ApiKeyInfo(BaseModel):
         description="Whether the key is active (not revoked and not expired)"
     )
 
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "ApiKeyInfo":
+        """Build from a trusted ORM row without re-running validation."""
+        return cls.model_construct(
+            id=obj.id,
+            label=obj.label,
+            created_at=obj.created_at,
+            expires_at=obj.expires_at,
+            last_used_at=obj.last_used_at,
+            is_active=obj.is_active,
+        )
+
     # Note: We never expose the actual token, jti, or token_hash for security
 
 
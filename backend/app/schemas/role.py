@@ -1,9 +1,9 @@
 """Pydantic schemas for role-related API operations."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RoleBase(BaseModel):
@@ -14,8 +14,12 @@ class RoleBase(BaseModel):
         None, max_length=255, description="Role description"
     )
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "RoleBase":
+        """Build from a trusted ORM row without re-running validation."""
+        return cls.model_construct(name=obj.name, description=obj.description)
 
 
 class RoleCreate(RoleBase):
@@ -31,8 +35,18 @@ class Role(RoleBase):
     created_at: datetime = Field(..., description="Role creation timestamp")
     updated_at: datetime = Field(..., description="Role last update timestamp")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "Role":
+        """Build from a trusted ORM row without re-running validation."""
+        return cls.model_construct(
+            id=obj.id,
+            name=obj.name,
+            description=obj.description,
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+        )
 
 
 class RoleList(BaseModel):
@@ -49,8 +63,7 @@ class UserRoleUpdate(BaseModel):
         ..., min_length=1, max_length=50, description="Role name to assign to user"
     )
 
-    class Config:
-        json_schema_extra = {"example": {"role_name": "admin"}}
+    model_config = ConfigDict(json_schema_extra={"example": {"role_name": "admin"}})
 
 
 class UserWithRole(BaseModel):
@@ -64,8 +77,21 @@ class UserWithRole(BaseModel):
     created_at: datetime = Field(..., description="User creation timestamp")
     updated_at: datetime = Field(..., description="User last update timestamp")
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "UserWithRole":
+        """Build from a trusted ORM row without re-running validation."""
+        role = obj.role
+        return cls.model_construct(
+            id=obj.id,
+            email=obj.email,
+            auth_provider=obj.auth_provider,
+            is_active=obj.is_active,
+            role=RoleBase.from_orm_fast(role) if role is not None else None,
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+        )
 
 
 class UserList(BaseModel):
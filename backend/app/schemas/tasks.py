@@ -19,6 +19,12 @@ class TaskStatus(str, Enum):
     REVOKED = "REVOKED"
 
 
+# Raw Celery state string -> TaskStatus, without going through Enum.__call__
+TASK_STATUS_BY_VALUE: Dict[str, TaskStatus] = {
+    member.value: member for member in TaskStatus
+}
+
+
 class TaskTriggerRequest(BaseModel):
     """Request schema for triggering a simple task."""
 
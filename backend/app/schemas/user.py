@@ -1,11 +1,45 @@
 import re
+import string
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
+from ._text_validation import StoredEmail
 from .role import RoleBase
 
+_PW_UPPER_RE = re.compile(r"[A-Z]")
+_PW_LOWER_RE = re.compile(r"[a-z]")
+_PW_DIGIT_RE = re.compile(r"\d")
+_PW_SPECIAL_RE = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
+# Character-class bit flags for the single-pass password scan
+_PW_UPPER = 1
+_PW_LOWER = 2
+_PW_DIGIT = 4
+_PW_SPECIAL = 8
+_PW_ALL = _PW_UPPER | _PW_LOWER | _PW_DIGIT | _PW_SPECIAL
+
+_PW_CHAR_CLASS: Dict[str, int] = {
+    **dict.fromkeys(string.ascii_uppercase, _PW_UPPER),
+    **dict.fromkeys(string.ascii_lowercase, _PW_LOWER),
+    **dict.fromkeys(string.digits, _PW_DIGIT),
+    **dict.fromkeys('!@#$%^&*(),.?":{}|<>', _PW_SPECIAL),
+}
+
+# Checked in order when the scan misses a class; the regex confirms the miss
+# (``\d`` also matches non-ASCII decimal digits)
+_PW_REQUIREMENTS = (
+    (_PW_UPPER, _PW_UPPER_RE, "Password must contain at least one uppercase letter"),
+    (_PW_LOWER, _PW_LOWER_RE, "Password must contain at least one lowercase letter"),
+    (_PW_DIGIT, _PW_DIGIT_RE, "Password must contain at least one digit"),
+    (
+        _PW_SPECIAL,
+        _PW_SPECIAL_RE,
+        "Password must contain at least one special character",
+    ),
+)
+
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
@@ -26,17 +60,16 @@ class UserCreate(UserBase):
         if len(v) < 8:
             raise ValueError("Password must be at least 8 characters long")
 
-        if not re.search(r"[A-Z]", v):
-            raise ValueError("Password must contain at least one uppercase letter")
-
-        if not re.search(r"[a-z]", v):
-            raise ValueError("Password must contain at least one lowercase letter")
-
-        if not re.search(r"\d", v):
-            raise ValueError("Password must contain at least one digit")
+        # Single scan collecting character classes, stopping once all are seen
+        flags = 0
+        for ch in v:
+            flags |= _PW_CHAR_CLASS.get(ch, 0)
+            if flags == _PW_ALL:
+                return v
 
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
-            raise ValueError("Password must contain at least one special character")
+        for flag, pattern, message in _PW_REQUIREMENTS:
+            if not flags & flag and not pattern.search(v):
+                raise ValueError(message)
 
         return v
 
@@ -55,6 +88,7 @@ class User(UserBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+    email: StoredEmail = Field(..., description="User email address")
     id: int
     auth_provider: str
     is_active: bool
@@ -62,6 +96,20 @@ class User(UserBase):
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_orm_fast(cls, obj: Any) -> "User":
+        """Build from a trusted ORM row without re-running validation."""
+        role = obj.role
+        return cls.model_construct(
+            email=obj.email,
+            id=obj.id,
+            auth_provider=obj.auth_provider,
+            is_active=obj.is_active,
+            role=RoleBase.from_orm_fast(role) if role is not None else None,
+            created_at=obj.created_at,
+            updated_at=obj.updated_at,
+        )
+
 
 class TokenData(BaseModel):
     """Schema for token payload data."""
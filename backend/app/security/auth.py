@@ -17,6 +17,7 @@ from .tokens import (
     create_refresh_token,
     decode_access_token,
     get_refresh_token,
+    invalidate_access_token,
     revoke_refresh_token,
     rotate_refresh_token,
     validate_csrf_token,
@@ -29,6 +30,7 @@ __all__ = [
     # JWT and refresh tokens (re-exported from tokens module)
     "create_access_token",
     "decode_access_token",
+    "invalidate_access_token",
     "create_refresh_token",
     "get_refresh_token",
     "revoke_refresh_token",
@@ -8,12 +8,53 @@ This module extends the existing authentication system to support both:
 
 from typing import Optional, Tuple
 
+from jose import jwt
+from jose.exceptions import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.security.auth import decode_access_token as decode_session_token
-from app.services.api_key import update_api_key_last_used, verify_api_key_by_hash
+from app.security.token_cache import VerifiedTokenCache
+from app.services.api_key import record_api_key_last_used, verify_api_key_by_hash
 from app.utils.jwt_pak import compute_token_hash, verify_api_jwt
 
+# Successful PAK verifications; repeat calls with the same token skip the RSA
+# signature check and the database lookup. Revocation evicts entries via
+# invalidate_pak_cache().
+_pak_cache = VerifiedTokenCache(maxsize=4096, ttl_seconds=30.0)
+
+# Base64url encodings of '{"alg":"<alg>"' and '{"typ":"JWT","alg":"<alg>"', the
+# header layouts python-jose and most other libraries produce
+_ALGORITHM_PREFIXES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("HS256", ("eyJhbGciOiJIUzI1NiI", "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiI")),
+    ("RS256", ("eyJhbGciOiJSUzI1NiI", "eyJ0eXAiOiJKV1QiLCJhbGciOiJSUzI1NiI")),
+)
+
+
+def _token_algorithm(token: str) -> Optional[str]:
+    """
+    Return the ``alg`` from a token's header, recognizing common headers by prefix.
+
+    Only routes the token; the signature check still enforces the algorithm.
+    """
+    for algorithm, prefixes in _ALGORITHM_PREFIXES:
+        if token.startswith(prefixes):
+            return algorithm
+    alg = jwt.get_unverified_header(token).get("alg")
+    return str(alg) if alg is not None else None
+
+
+def invalidate_pak_cache(jti: Optional[str] = None) -> None:
+    """
+    Drop cached PAK verifications.
+
+    Args:
+        jti: Only drop entries for this JWT ID; drops everything if None
+    """
+    if jti is None:
+        _pak_cache.clear()
+    else:
+        _pak_cache.invalidate_tag(jti)
+
 
 async def decode_access_token_enhanced(
     token: str, db: Optional[AsyncSession] = None
@@ -32,14 +73,16 @@ async def decode_access_token_enhanced(
         - email: User email if token is valid, None otherwise
         - is_pak_token: True if this was a PAK token, False if session token
     """
-    from jose import jwt
-    from jose.exceptions import JWTError
+    # Tokens verified within the last few seconds skip RSA and the database
+    if db is not None:
+        cached_email = _pak_cache.get(token)
+        if cached_email is not None:
+            return cached_email, True
 
     try:
         # First, inspect the JWT header to determine the algorithm
         # This prevents algorithm confusion attacks
-        header = jwt.get_unverified_header(token)
-        algorithm = header.get("alg")
+        algorithm = _token_algorithm(token)
 
         if algorithm is None:
             return None, False
@@ -80,9 +123,10 @@ async def decode_access_token_enhanced(
                 if api_key is None:
                     return None, False
 
-                # Update last used timestamp (async, non-blocking)
-                await update_api_key_last_used(db, api_key)
+                # Queue the last used timestamp for the next batched write
+                await record_api_key_last_used(api_key)
 
+                _pak_cache.set(token, email, exp=payload.get("exp"), tag=jti)
                 return email, True  # Valid PAK token
 
             except Exception:
@@ -110,6 +154,9 @@ async def is_pak_token(token: str) -> bool:
     Returns:
         True if token appears to be a PAK token
     """
+    if _pak_cache.get(token) is not None:
+        return True
+
     try:
         payload = verify_api_jwt(token)
         return payload is not None and payload.get("type") == "api_key"
@@ -1,5 +1,7 @@
 """Cookie management for authentication and security."""
 
+from typing import Any, Dict, List, Tuple
+
 from fastapi import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,8 +15,48 @@ __all__ = [
     "create_auth_cookies",
     "create_auth_cookies_with_csrf",
     "clear_auth_cookies",
+    "refresh_settings_cache",
 ]
 
+# Cookie attributes derived from settings, resolved once by refresh_settings_cache()
+_SECURE_COOKIES: bool
+_ACCESS_MAX_AGE: int
+# Attributes shared by every auth cookie, passed as set/delete_cookie kwargs
+_COOKIE_ATTRS: Dict[str, Any]
+# Raw Set-Cookie headers that expire every auth cookie, used on logout
+_CLEAR_COOKIE_HEADERS: List[Tuple[bytes, bytes]]
+
+
+def refresh_settings_cache() -> None:
+    """Re-read the cookie settings cached at import (e.g. after overriding them)."""
+    global _SECURE_COOKIES, _ACCESS_MAX_AGE, _COOKIE_ATTRS, _CLEAR_COOKIE_HEADERS
+    settings = get_settings()
+    _SECURE_COOKIES = settings.ENVIRONMENT == "production"
+    _ACCESS_MAX_AGE = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    _COOKIE_ATTRS = {"secure": _SECURE_COOKIES, "samesite": "lax"}
+    _CLEAR_COOKIE_HEADERS = _build_clear_cookie_headers()
+
+
+def _build_clear_cookie_headers() -> List[Tuple[bytes, bytes]]:
+    """
+    Render the headers that delete the auth cookies.
+
+    Starlette formats them once here, so the cookies are cleared exactly as
+    ``delete_cookie`` would clear them. The expiry date it renders is the
+    build time, which stays in the past.
+
+    Returns:
+        Raw ``(b"set-cookie", value)`` header pairs
+    """
+    scratch = Response()
+    scratch.delete_cookie("access_token", httponly=True, **_COOKIE_ATTRS)
+    scratch.delete_cookie("csrf_token", httponly=False, **_COOKIE_ATTRS)
+    scratch.delete_cookie(REFRESH_TOKEN_COOKIE_NAME, httponly=True, **_COOKIE_ATTRS)
+    return [header for header in scratch.raw_headers if header[0] == b"set-cookie"]
+
+
+refresh_settings_cache()
+
 
 def set_refresh_token_cookie(response: Response, token: str) -> None:
     """
@@ -24,14 +66,12 @@ def set_refresh_token_cookie(response: Response, token: str) -> None:
         response: FastAPI response object
         token: The refresh token string
     """
-    settings = get_settings()
     response.set_cookie(
         key=REFRESH_TOKEN_COOKIE_NAME,
         value=token,
         max_age=30 * 24 * 60 * 60,  # 30 days
         httponly=True,
-        secure=settings.ENVIRONMENT == "production",
-        samesite="lax",
+        **_COOKIE_ATTRS,
     )
 
 
@@ -43,14 +83,12 @@ def create_auth_cookies(response: Response, token: str) -> None:
         response: FastAPI response object
         token: JWT token to store in cookies
     """
-    settings = get_settings()
     response.set_cookie(
         key="access_token",
         value=token,
-        max_age=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        max_age=_ACCESS_MAX_AGE,
         httponly=True,
-        secure=settings.ENVIRONMENT == "production",
-        samesite="lax",
+        **_COOKIE_ATTRS,
     )
 
 
@@ -69,27 +107,26 @@ async def create_auth_cookies_with_csrf(
     Returns:
         Generated CSRF token
     """
-    settings = get_settings()
-
     # Set the main authentication cookie
     create_auth_cookies(response, access_token)
 
-    # Generate and set refresh token
-    if user.id is not None:
-        refresh_token = await create_refresh_token(db, user.id)
-        set_refresh_token_cookie(response, refresh_token)
-
     # Generate and set CSRF token
     csrf_token = create_csrf_token()
     response.set_cookie(
         key="csrf_token",
         value=csrf_token,
-        max_age=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        max_age=_ACCESS_MAX_AGE,
         httponly=False,
-        secure=settings.ENVIRONMENT == "production",
-        samesite="lax",
+        **_COOKIE_ATTRS,
     )
 
+    # Generate and set refresh token; its INSERT is the only database round
+    # trip, done last. If it fails the exception propagates and the response
+    # carrying these cookies is never sent.
+    if user.id is not None:
+        refresh_token = await create_refresh_token(db, user.id)
+        set_refresh_token_cookie(response, refresh_token)
+
     return csrf_token
 
 
@@ -100,22 +137,4 @@ def clear_auth_cookies(response: Response) -> None:
     Args:
         response: FastAPI response object
     """
-    settings = get_settings()
-    response.delete_cookie(
-        "access_token",
-        httponly=True,
-        secure=settings.ENVIRONMENT == "production",
-        samesite="lax",
-    )
-    response.delete_cookie(
-        "csrf_token",
-        httponly=False,
-        secure=settings.ENVIRONMENT == "production",
-        samesite="lax",
-    )
-    response.delete_cookie(
-        REFRESH_TOKEN_COOKIE_NAME,
-        httponly=True,
-        secure=settings.ENVIRONMENT == "production",
-        samesite="lax",
-    )
+    response.raw_headers.extend(_CLEAR_COOKIE_HEADERS)
@@ -0,0 +1,103 @@
+"""Bounded in-process cache of verified tokens."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+__all__ = ["VerifiedTokenCache"]
+
+
+class VerifiedTokenCache:
+    """
+    Remember the subject of recently verified tokens for a short time.
+
+    Entries are keyed by a BLAKE2b digest of the token so raw bearer secrets
+    are not kept in memory, expire after ``ttl_seconds`` or at the token's own
+    ``exp`` (whichever comes first), and the oldest entries are evicted once
+    ``maxsize`` is reached. Only cache tokens after full verification.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl_seconds: float = 60.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached tokens
+            ttl_seconds: Upper bound on how long a verification is reused
+        """
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        # digest -> (subject, tag, monotonic deadline)
+        self._entries: "OrderedDict[bytes, Tuple[str, Optional[str], float]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        """Return the cache key for a token."""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[str]:
+        """
+        Return the cached subject for a token, if still fresh.
+
+        Args:
+            token: The raw token
+
+        Returns:
+            The subject stored with ``set``, or None on a miss
+        """
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            subject, _, deadline = entry
+            if time.monotonic() >= deadline:
+                del self._entries[key]
+                return None
+            return subject
+
+    def set(
+        self, token: str, subject: str, exp: Any = None, tag: Optional[str] = None
+    ) -> None:
+        """
+        Cache a verified token.
+
+        Args:
+            token: The raw token
+            subject: Value returned by later ``get`` calls (e.g. the email)
+            exp: The token's ``exp`` claim as a Unix timestamp, if any
+            tag: Optional label (e.g. a JWT ID) for ``invalidate_tag``
+        """
+        ttl = self.ttl_seconds
+        if exp is not None:
+            ttl = min(ttl, float(exp) - time.time())
+        if ttl <= 0:
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (subject, tag, time.monotonic() + ttl)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, token: str) -> None:
+        """Drop a single token."""
+        with self._lock:
+            self._entries.pop(self._key(token), None)
+
+    def invalidate_tag(self, tag: str) -> None:
+        """Drop every token cached with ``tag``."""
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[1] == tag]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached tokens."""
+        with self._lock:
+            self._entries.clear()
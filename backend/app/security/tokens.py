@@ -4,17 +4,22 @@ import secrets
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
 from app.models.refresh_token import RefreshToken
 from app.models.user import User
-from app.repositories.refresh_token import RefreshTokenRepository
+from app.repositories.refresh_token import refresh_token_repository
+
+from ._entropy_pool import token_pool
+from .token_cache import VerifiedTokenCache
 
 __all__ = [
     "create_access_token",
     "decode_access_token",
+    "invalidate_access_token",
     "create_refresh_token",
     "get_refresh_token",
     "revoke_refresh_token",
@@ -23,12 +28,35 @@ __all__ = [
     "validate_csrf_token",
     "REFRESH_TOKEN_EXPIRE_DAYS",
     "REFRESH_TOKEN_COOKIE_NAME",
+    "refresh_settings_cache",
 ]
 
 # Token constants
 REFRESH_TOKEN_EXPIRE_DAYS = 30
 REFRESH_TOKEN_COOKIE_NAME = "refresh_token"
 
+# Settings used on every request, resolved once by refresh_settings_cache()
+_SIGNING_KEY: Key  # SECRET_KEY prepared by python-jose for _JWT_ALGORITHM
+_JWT_ALGORITHM: str
+_ACCESS_TOKEN_DELTA: timedelta
+
+# Recently decoded access tokens; polling clients resend the same token
+_access_token_cache = VerifiedTokenCache(maxsize=4096, ttl_seconds=60.0)
+
+
+def refresh_settings_cache() -> None:
+    """Re-read the JWT settings cached at import (e.g. after overriding them)."""
+    global _SIGNING_KEY, _JWT_ALGORITHM, _ACCESS_TOKEN_DELTA
+    _access_token_cache.clear()
+    settings = get_settings()
+    _JWT_ALGORITHM = settings.JWT_ALGORITHM
+    # Passing a constructed key skips python-jose's per-call key preparation
+    _SIGNING_KEY = jwk.construct(settings.SECRET_KEY, _JWT_ALGORITHM)
+    _ACCESS_TOKEN_DELTA = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+
+refresh_settings_cache()
+
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
@@ -41,19 +69,13 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     Returns:
         Encoded JWT token
     """
-    settings = get_settings()
     to_encode = data.copy()
 
     now_utc = datetime.now(timezone.utc)
-    if expires_delta:
-        expire = now_utc + expires_delta
-    else:
-        expire = now_utc + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = now_utc + (expires_delta or _ACCESS_TOKEN_DELTA)
 
     to_encode.update({"exp": expire, "iat": now_utc})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=_JWT_ALGORITHM)
     return encoded_jwt
 
 
@@ -67,48 +89,77 @@ def decode_access_token(token: str) -> Optional[str]:
     Returns:
         Email from token if valid, None otherwise
     """
-    settings = get_settings()
+    cached_email = _access_token_cache.get(token)
+    if cached_email is not None:
+        return cached_email
+
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=[_JWT_ALGORITHM])
         email = payload.get("sub")
         if email is None:
             return None
+        _access_token_cache.set(token, str(email), exp=payload.get("exp"))
         return str(email)
     except JWTError:
         return None
 
 
-async def create_refresh_token(db: AsyncSession, user_id: int) -> str:
+def invalidate_access_token(token: str) -> None:
     """
-    Create, store, and return a new refresh token.
+    Forget a cached access token decode (e.g. on logout).
+
+    Args:
+        token: JWT token to drop from the decode cache
+    """
+    _access_token_cache.invalidate(token)
+
+
+def _new_refresh_token(user_id: int, now: datetime) -> RefreshToken:
+    """
+    Build an unsaved refresh token for a user.
 
     Args:
-        db: Async database session
         user_id: The user's ID
+        now: Current UTC time
 
     Returns:
-        The generated refresh token string
+        RefreshToken with a fresh random token value
 
     Raises:
         ValueError: If user_id is not a positive integer
     """
-    # Validate user_id parameter
     if not isinstance(user_id, int) or user_id <= 0:
         raise ValueError("user_id must be a positive integer")
 
-    token = secrets.token_urlsafe(64)
-    expires_at = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-
-    refresh_token_obj = RefreshToken(
-        token=token, user_id=user_id, expires_at=expires_at
+    return RefreshToken(
+        token=token_pool.urlsafe(64),
+        user_id=user_id,
+        expires_at=now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
     )
 
-    refresh_token_repo = RefreshTokenRepository()
-    await refresh_token_repo.create(db, refresh_token_obj)
 
-    return token
+async def create_refresh_token(
+    db: AsyncSession, user_id: int, now: Optional[datetime] = None
+) -> str:
+    """
+    Create, store, and return a new refresh token.
+
+    Args:
+        db: Async database session
+        user_id: The user's ID
+        now: Current UTC time, if the caller already has it
+
+    Returns:
+        The generated refresh token string
+
+    Raises:
+        ValueError: If user_id is not a positive integer
+    """
+    refresh_token_obj = _new_refresh_token(user_id, now or datetime.now(timezone.utc))
+
+    await refresh_token_repository.insert(db, refresh_token_obj)
+
+    return refresh_token_obj.token
 
 
 async def get_refresh_token(db: AsyncSession, token: str) -> Optional[RefreshToken]:
@@ -122,23 +173,24 @@ async def get_refresh_token(db: AsyncSession, token: str) -> Optional[RefreshTok
     Returns:
         The RefreshToken object or None if not found
     """
-    refresh_token_repo = RefreshTokenRepository()
-    return await refresh_token_repo.get_by_token(db, token)
+    return await refresh_token_repository.get_by_token(db, token)
 
 
-async def revoke_refresh_token(db: AsyncSession, token: str) -> None:
+async def revoke_refresh_token(
+    db: AsyncSession, token: str, now: Optional[datetime] = None
+) -> None:
     """
     Revoke a refresh token by setting its `revoked_at` timestamp.
 
     Args:
         db: Async database session
         token: The refresh token string to revoke
+        now: Current UTC time, if the caller already has it
     """
     token_obj = await get_refresh_token(db, token)
     if token_obj:
-        token_obj.revoked_at = datetime.now(timezone.utc)
-        refresh_token_repo = RefreshTokenRepository()
-        await refresh_token_repo.update(db, token_obj)
+        token_obj.revoked_at = now or datetime.now(timezone.utc)
+        await refresh_token_repository.update(db, token_obj)
 
 
 async def rotate_refresh_token(
@@ -147,6 +199,9 @@ async def rotate_refresh_token(
     """
     Revoke an old refresh token and issue a new one.
 
+    Both happen in one transaction; the old token must still be unrevoked and
+    belong to ``user``.
+
     Args:
         db: Async database session
         old_token: The refresh token string to revoke
@@ -155,10 +210,13 @@ async def rotate_refresh_token(
     Returns:
         The new refresh token string, or None if rotation fails
     """
-    await revoke_refresh_token(db, old_token)
     if user.id is None:
         return None
-    return await create_refresh_token(db, user.id)
+    now = datetime.now(timezone.utc)
+    replacement = _new_refresh_token(user.id, now)
+    if not await refresh_token_repository.rotate(db, old_token, replacement, now):
+        return None
+    return replacement.token
 
 
 def create_csrf_token() -> str:
@@ -168,7 +226,7 @@ def create_csrf_token() -> str:
     Returns:
         Random CSRF token
     """
-    return secrets.token_urlsafe(32)
+    return token_pool.urlsafe(32)
 
 
 def validate_csrf_token(token_from_header: str, token_from_cookie: str) -> bool:
@@ -184,4 +242,11 @@ def validate_csrf_token(token_from_header: str, token_from_cookie: str) -> bool:
     """
     if not token_from_header or not token_from_cookie:
         return False
-    return secrets.compare_digest(token_from_header, token_from_cookie)
+    # Issued tokens have a fixed length, so this reveals nothing useful
+    if len(token_from_header) != len(token_from_cookie):
+        return False
+    # Compare raw bytes; UTF-8 also accepts non-ASCII input, which str
+    # arguments to compare_digest reject with a TypeError
+    return secrets.compare_digest(
+        token_from_header.encode(), token_from_cookie.encode()
+    )
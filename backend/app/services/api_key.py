@@ -5,39 +5,45 @@ This is a minimal implementation to get PAK working quickly.
 Can be enhanced later with proper SQLAlchemy syntax.
 """
 
-import hashlib
+import asyncio
+import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional
-from uuid import uuid4
+from typing import Dict, Optional, Sequence
 
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.logging import get_logger
 from app.models.api_key import ApiKey
 from app.models.user import User
-from app.repositories.api_key import ApiKeyRepository
+from app.repositories.api_key import api_key_repository
 from app.schemas.api_key import ApiKeyInfo, ApiKeyList
+from app.security.token_cache import VerifiedTokenCache
 from app.utils.error_handling import (
     raise_bad_request_error,
     raise_internal_server_error,
     raise_not_found_error,
     with_database_error_handling,
 )
-from app.utils.jwt_pak import create_api_key_token
+from app.utils.jwt_pak import compute_token_hash, create_api_key_token
 
 # Initialize logger
 logger = get_logger(__name__)
 
+# Recently rejected (token hash, JTI) pairs; repeat attempts skip the database
+_rejected_api_keys = VerifiedTokenCache(maxsize=2048, ttl_seconds=30.0)
+
 
 class ApiKeyService:
     """Service for managing Personal API Keys with business logic encapsulation."""
 
+    __slots__ = ("api_key_repo",)
+
     MAX_ACTIVE_KEYS_PER_USER = 20
 
     def __init__(self) -> None:
         """Initialize the ApiKeyService with repository."""
-        self.api_key_repo = ApiKeyRepository()
+        self.api_key_repo = api_key_repository
 
     @with_database_error_handling(
         operation="retrieving user API keys",
@@ -58,14 +64,12 @@ class ApiKeyService:
         Raises:
             HTTPException: If database error occurs
         """
+        # Already ordered by created_at descending (newest first)
         user_keys = await self.api_key_repo.get_by_user_id(db, user_id)
 
-        # Sort by created_at descending (newest first)
-        sorted_keys = sorted(user_keys, key=lambda k: k.created_at, reverse=True)
-
-        return ApiKeyList(
-            keys=[ApiKeyInfo.model_validate(key) for key in sorted_keys],
-            total=len(sorted_keys),
+        return ApiKeyList.model_construct(
+            keys=[ApiKeyInfo.from_orm_fast(key) for key in user_keys],
+            total=len(user_keys),
         )
 
     @with_database_error_handling(
@@ -154,6 +158,39 @@ class ApiKeyService:
         # At this point, api_key is guaranteed to be not None
         return api_key
 
+    @with_database_error_handling(
+        operation="verifying API key ownership",
+        custom_message="Failed to verify API key ownership",
+        rollback=False,
+    )
+    async def verify_keys_ownership(
+        self, db: AsyncSession, key_ids: Sequence[int], user_id: int
+    ) -> Dict[int, ApiKey]:
+        """
+        Verify that a user owns every API key in a batch and return them.
+
+        Args:
+            db: Database session
+            key_ids: IDs of the API keys
+            user_id: ID of the user
+
+        Returns:
+            Mapping of key ID to ApiKey for all requested keys
+
+        Raises:
+            HTTPException: If any key is not found or not owned by user
+        """
+        api_keys = await self.api_key_repo.get_by_user_id_and_key_ids(
+            db, user_id, key_ids
+        )
+
+        if len(api_keys) != len(set(key_ids)):
+            raise_not_found_error(
+                "API key", "API key not found or you don't have permission to access it"
+            )
+
+        return api_keys
+
     async def revoke_user_key(
         self, db: AsyncSession, key_id: int, user_id: int
     ) -> bool:
@@ -196,6 +233,29 @@ def get_api_key_service() -> ApiKeyService:
     return api_key_service
 
 
+def _issue_api_key_token(
+    subject: str, jti: str, expires_delta: Optional[timedelta]
+) -> tuple[str, str]:
+    """
+    Sign a new full-access API key token and hash it for storage.
+
+    Args:
+        subject: User email for the token
+        jti: JWT ID for the token
+        expires_delta: Token lifetime (None for no expiry)
+
+    Returns:
+        Tuple of (JWT token string, token hash)
+    """
+    token = create_api_key_token(
+        subject=subject,
+        jti=jti,
+        scopes=["*"],  # Default to full access
+        expires_delta=expires_delta,
+    )
+    return token, compute_token_hash(token)
+
+
 async def create_api_key_simple(
     db: AsyncSession,
     user: User,
@@ -227,19 +287,13 @@ async def create_api_key_simple(
         expires_at = datetime.now(timezone.utc) + expires_delta
 
     # Generate unique JWT ID
-    jti = str(uuid4())
+    jti = secrets.token_hex(16)
 
-    # Create JWT token using the internal function
-    token = create_api_key_token(
-        subject=user.email,
-        jti=jti,
-        scopes=["*"],  # Default to full access
-        expires_delta=expires_delta,
+    # RSA signing takes about a millisecond, so keep it off the event loop
+    token, token_hash = await asyncio.to_thread(
+        _issue_api_key_token, user.email, jti, expires_delta
     )
 
-    # Generate token hash for database storage
-    token_hash = hashlib.sha256(token.encode()).hexdigest()
-
     # Create database record
     api_key = ApiKey(
         user_id=user.id,
@@ -262,16 +316,19 @@ async def create_api_key_simple(
 
 async def get_api_key_by_id(db: AsyncSession, key_id: int) -> Optional[ApiKey]:
     """Get API key by ID."""
-    api_key_repo = ApiKeyRepository()
-    return await api_key_repo.get_by_id(db, key_id)
+    return await api_key_repository.get_by_id(db, key_id)
 
 
 async def revoke_api_key_simple(db: AsyncSession, key_id: int) -> bool:
     """Revoke an API key by ID."""
+    # Imported here: auth_pak depends on this module
+    from app.security.auth_pak import invalidate_pak_cache
+
     api_key = await get_api_key_by_id(db, key_id)
     if api_key and api_key.revoked_at is None:
         api_key.revoked_at = datetime.now(timezone.utc)
         await db.commit()
+        invalidate_pak_cache(api_key.jti)
         return True
     return False
 
@@ -288,8 +345,7 @@ async def get_api_key_by_jti(db: AsyncSession, jti: str) -> Optional[ApiKey]:
         ApiKey if found, None otherwise
     """
     try:
-        api_key_repo = ApiKeyRepository()
-        return await api_key_repo.get_by_jti(db, jti)
+        return await api_key_repository.get_by_jti(db, jti)
     except SQLAlchemyError as e:
         logger.error(f"Database error retrieving API key by JTI {jti}: {e}")
         return None
@@ -299,7 +355,11 @@ async def verify_api_key_by_hash(
     db: AsyncSession, token_hash: str, jti: str
 ) -> Optional[ApiKey]:
     """
-    Verify an API key by its hash and JTI using constant-time comparison.
+    Verify an API key by its token hash and JTI.
+
+    The key is fetched through the unique ``token_hash`` index and the JTI is
+    checked in-process. Rejections are remembered briefly, since a token that
+    is unknown, revoked or expired can never become valid again.
 
     Args:
         db: Database session
@@ -309,29 +369,22 @@ async def verify_api_key_by_hash(
     Returns:
         ApiKey if valid and active, None otherwise
     """
-    import secrets
+    cache_key = f"{token_hash}:{jti}"
+    if _rejected_api_keys.get(cache_key) is not None:
+        return None
 
     try:
-        # Look up key by JTI first
-        api_key = await get_api_key_by_jti(db, jti)
-
-        if api_key is None:
-            return None
-
-        # Check if key is active (not revoked and not expired)
-        if not api_key.is_active:
-            return None
-
-        # Verify hash using constant-time comparison
-        if not secrets.compare_digest(api_key.token_hash, token_hash):
-            return None
-
-        return api_key
-
+        api_key = await api_key_repository.get_by_token_hash(db, token_hash)
     except SQLAlchemyError as e:
         logger.error(f"Database error verifying API key with JTI {jti}: {e}")
         return None
 
+    if api_key is None or api_key.jti != jti or not api_key.is_active:
+        _rejected_api_keys.set(cache_key, jti)
+        return None
+
+    return api_key
+
 
 async def update_api_key_last_used(
     db: AsyncSession, api_key: ApiKey, throttle_minutes: int = 10
@@ -339,6 +392,9 @@ async def update_api_key_last_used(
     """
     Update the last_used_at timestamp for an API key with throttling.
 
+    Commits immediately; request paths use ``record_api_key_last_used``, which
+    batches the write through ``last_used_flusher`` instead.
+
     Args:
         db: Database session
         api_key: API key to update
@@ -358,3 +414,133 @@ async def update_api_key_last_used(
         # Don't fail authentication if last_used update fails
         logger.warning(f"Failed to update last_used_at for API key: {e}")
         await db.rollback()
+
+
+class LastUsedFlusher:
+    """
+    Coalesce API key ``last_used_at`` updates and write them in batches.
+
+    Authentication records usage in memory (latest timestamp per key) and a
+    background task writes everything pending with one UPDATE per interval,
+    so authenticated requests never wait on a commit.
+    """
+
+    def __init__(
+        self, interval_seconds: float = 5.0, max_pending: int = 10_000
+    ) -> None:
+        """
+        Initialize the flusher.
+
+        Args:
+            interval_seconds: Seconds between background flushes
+            max_pending: Pending key count that triggers an immediate flush
+        """
+        self.interval_seconds = interval_seconds
+        self.max_pending = max_pending
+        self._pending: Dict[int, datetime] = {}
+        self._session_factory: Optional[async_sessionmaker[AsyncSession]] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def record(self, api_key_id: int, used_at: datetime) -> None:
+        """
+        Remember that an API key was used.
+
+        Args:
+            api_key_id: ID of the API key
+            used_at: When the key was used
+        """
+        self._pending[api_key_id] = used_at
+        if len(self._pending) >= self.max_pending:
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all pending timestamps to the database.
+
+        Returns:
+            Number of API keys updated
+        """
+        if not self._pending or self._session_factory is None:
+            return 0
+
+        pending, self._pending = self._pending, {}
+        async with self._session_factory() as db:
+            try:
+                await api_key_repository.bulk_update_last_used(db, pending)
+            except SQLAlchemyError as e:
+                # Don't let usage tracking failures affect authentication
+                logger.warning(f"Failed to update last_used_at for API keys: {e}")
+                await db.rollback()
+                self._requeue(pending)
+                return 0
+        return len(pending)
+
+    def _requeue(self, pending: Dict[int, datetime]) -> None:
+        """
+        Put a failed batch back for the next flush.
+
+        Timestamps recorded while the batch was being written are newer and
+        win; nothing is re-queued once ``max_pending`` keys are waiting.
+
+        Args:
+            pending: The batch that could not be written
+        """
+        for api_key_id, used_at in pending.items():
+            if len(self._pending) >= self.max_pending:
+                break
+            self._pending.setdefault(api_key_id, used_at)
+
+    def start(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """
+        Start the background flush task.
+
+        Args:
+            session_factory: Factory for the sessions used to write updates
+        """
+        self._session_factory = session_factory
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and write anything still pending."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    async def _run(self) -> None:
+        """Flush pending updates every ``interval_seconds``."""
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"API key last_used_at flush failed: {e}")
+
+
+last_used_flusher = LastUsedFlusher()
+
+
+async def record_api_key_last_used(api_key: ApiKey, throttle_minutes: int = 10) -> None:
+    """
+    Queue a throttled ``last_used_at`` update for an API key.
+
+    The write happens in the next batch of ``last_used_flusher`` instead of
+    committing on the request path.
+
+    Args:
+        api_key: API key that was used
+        throttle_minutes: Minimum minutes between updates
+    """
+    if api_key.id is None:
+        return
+
+    now = datetime.now(timezone.utc)
+    if api_key.last_used_at is None or now - api_key.last_used_at > timedelta(
+        minutes=throttle_minutes
+    ):
+        await last_used_flusher.record(api_key.id, now)
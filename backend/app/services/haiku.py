@@ -1,5 +1,6 @@
 import logging
 import os
+from functools import lru_cache
 
 import syllables  # type: ignore
 from fastapi import Depends
@@ -18,17 +19,40 @@ logger = logging.getLogger(__name__)
 
 
 # Configuration
+@lru_cache(maxsize=1)
 def get_haiku_model() -> str | None:
     """
     Get the model to use for haiku generation.
 
     Returns None to use the provider's default model, unless HAIKU_MODEL is explicitly set.
+    The variable is read once per process; call ``get_haiku_model.cache_clear()``
+    after changing it at runtime.
     """
     # If HAIKU_MODEL is explicitly set, use it to override the provider's default
     return os.getenv("HAIKU_MODEL")
 
 
+@lru_cache(maxsize=8192)
+def count_syllables(word: str) -> int:
+    """
+    Count the syllables in a word.
+
+    Estimates are memoized, since haiku vocabulary repeats heavily across
+    requests.
+
+    Args:
+        word: A single word
+
+    Returns:
+        Estimated syllable count (at least 1)
+    """
+    count = syllables.estimate(word)
+    return max(count, 1) if count is not None else 1
+
+
 class HaikuService:
+    __slots__ = ("llm_service", "model", "provider")
+
     def __init__(
         self,
         llm_service: LLMService,
@@ -53,28 +77,21 @@ class HaikuService:
                 max_tokens=150,
             )
 
-            lines = [
-                line.strip()
-                for line in response_text.strip().split("\n")
-                if line.strip()
-            ]
+            # Strip, filter and count each line in a single pass
+            lines: list[str] = []
+            syllable_counts: list[int] = []
+            for raw_line in response_text.split("\n"):
+                line = raw_line.strip()
+                if not line:
+                    continue
+                lines.append(line)
+                syllable_counts.append(sum(map(count_syllables, line.split())))
 
             if len(lines) != 3:
                 raise LLMGenerationError(
                     f"LLM returned {len(lines)} lines, expected 3."
                 )
 
-            # Use proper syllable counting library
-            def count_syllables(word: str) -> int:
-                count = syllables.estimate(word)
-                return (
-                    max(count, 1) if count is not None else 1
-                )  # Ensure at least 1 syllable
-
-            syllable_counts = [
-                sum(count_syllables(word) for word in line.split()) for line in lines
-            ]
-
             return HaikuResponse(
                 haiku="\n".join(lines),
                 lines=lines,
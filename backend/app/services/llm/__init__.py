@@ -14,6 +14,10 @@ Usage:
         return {"response": response}
 """
 
+from typing import TYPE_CHECKING, Any
+
+from . import providers
+
 # Configuration
 # Caching
 from .cache import (
@@ -31,6 +35,7 @@ from .dependency_resolver import (
     ensure_llm_settings,
     get_llm_service,
     get_llm_service_with_overrides,
+    preload_llm_service,
 )
 
 # Exceptions
@@ -48,18 +53,16 @@ from .factory import LLMServiceFactory
 # Core interfaces and types
 from .protocol import LLMService
 
-# Provider implementations (for advanced usage)
-from .providers import (
-    BaseLLMProvider,
-    BedrockLLMProvider,
-    LMStudioLLMProvider,
-    OpenAILLMProvider,
-    OpenRouterLLMProvider,
-)
+# Provider implementations (for advanced usage); the concrete classes are
+# loaded on first access, see __getattr__ below
+from .providers import BaseLLMProvider
 
 # Registry for provider management
 from .registry import LLMProviderRegistry, get_provider_registry
 
+# Opt-in similarity cache for structured responses
+from .response_cache import configure_semantic_cache
+
 # Utilities
 from .utils import parse_json_response, retry_on_failure
 
@@ -67,11 +70,42 @@ from .utils import parse_json_response, retry_on_failure
 # This allows existing code to continue working without changes
 DEFAULT_MODEL = "gpt-4o-mini"  # For backward compatibility
 
-# Legacy class names for backward compatibility
-OpenAILLMService = OpenAILLMProvider
-BedrockLLMService = BedrockLLMProvider
-OpenRouterLLMService = OpenRouterLLMProvider
-LMStudioLLMService = LMStudioLLMProvider
+if TYPE_CHECKING:
+    from .providers import (
+        BedrockLLMProvider,
+        LMStudioLLMProvider,
+        OpenAILLMProvider,
+        OpenRouterLLMProvider,
+    )
+
+    # Legacy class names for backward compatibility
+    OpenAILLMService = OpenAILLMProvider
+    BedrockLLMService = BedrockLLMProvider
+    OpenRouterLLMService = OpenRouterLLMProvider
+    LMStudioLLMService = LMStudioLLMProvider
+
+# Lazily exported name -> provider class name, including the legacy aliases
+_LAZY_PROVIDERS = {
+    "OpenAILLMProvider": "OpenAILLMProvider",
+    "OpenRouterLLMProvider": "OpenRouterLLMProvider",
+    "BedrockLLMProvider": "BedrockLLMProvider",
+    "LMStudioLLMProvider": "LMStudioLLMProvider",
+    "OpenAILLMService": "OpenAILLMProvider",
+    "OpenRouterLLMService": "OpenRouterLLMProvider",
+    "BedrockLLMService": "BedrockLLMProvider",
+    "LMStudioLLMService": "LMStudioLLMProvider",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Resolve provider classes on first access without importing their SDKs."""
+    class_name = _LAZY_PROVIDERS.get(name)
+    if class_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider_class = getattr(providers, class_name)
+    globals()[name] = provider_class
+    return provider_class
+
 
 __all__ = [
     # Core interface
@@ -90,6 +124,7 @@ __all__ = [
     "LLMServiceCache",
     "get_llm_settings_cache",
     "get_llm_service_cache",
+    "configure_semantic_cache",
     # Factory and DI
     "LLMServiceFactory",
     "get_llm_service",
@@ -97,6 +132,7 @@ __all__ = [
     "LLMServiceDep",
     "LLMServiceResult",
     "ensure_llm_settings",
+    "preload_llm_service",
     # Registry
     "LLMProviderRegistry",
     "get_provider_registry",
@@ -2,19 +2,22 @@
 
 import asyncio
 import logging
-import threading
-from datetime import datetime, timedelta, timezone
+from collections import OrderedDict
+from functools import cache, lru_cache
+from time import monotonic
 from typing import Any, Callable, Optional
 
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import get_settings
+from app.db.session import async_session_factory
 from app.models import LLMSettings
-from app.repositories.llm_settings import LLMSettingsRepository
+from app.repositories.llm_settings import llm_settings_repository
 
 from .exceptions import LLMConfigurationError
 from .protocol import LLMService
+from .response_cache import get_llm_response_cache
 
 # Type variable for service instances
 
@@ -26,6 +29,7 @@ __all__ = [
     "LLMServiceCache",
     "get_llm_settings_cache",
     "get_llm_service_cache",
+    "reset_caches",
 ]
 
 
@@ -35,6 +39,8 @@ class LLMSettingsCache:
 
     Uses TTL (Time To Live) to ensure settings are refreshed periodically
     while avoiding the performance penalty of database queries on every request.
+    For a second TTL after expiry the stale settings are still served while a
+    single background task refreshes them.
     """
 
     def __init__(self, ttl_seconds: int = 300) -> None:  # 5 minutes default TTL
@@ -46,9 +52,16 @@ class LLMSettingsCache:
         """
         self.ttl_seconds = ttl_seconds
         self._cached_settings: Optional[LLMSettings] = None
-        self._cached_at: Optional[datetime] = None
-        self._lock = asyncio.Lock()
-        self._llm_settings_repo = LLMSettingsRepository()
+        # time.monotonic() deadlines: fresh until _expires_at, then served
+        # stale (while refreshing in the background) until _stale_expires_at
+        self._expires_at: float = 0.0
+        self._stale_expires_at: float = 0.0
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+        # Database fetch shared by every caller that misses while it runs
+        self._inflight: Optional[asyncio.Future[LLMSettings]] = None
+        # Bumped by invalidate_cache so an older in-flight fetch isn't stored
+        self._generation = 0
+        self._llm_settings_repo = llm_settings_repository
 
     async def get_settings(self, db: AsyncSession) -> LLMSettings:
         """
@@ -63,29 +76,121 @@ class LLMSettingsCache:
         Raises:
             LLMConfigurationError: If settings cannot be retrieved
         """
-        async with self._lock:
-            # Check if cache is still valid
-            if self._is_cache_valid() and self._cached_settings is not None:
-                logger.debug("Returning cached LLM settings")
-                return self._cached_settings
+        # Fast path. Readers only ever see a complete (settings, expires_at)
+        # pair because both are set together without an await in between.
+        cached = self._cached_settings
+        if cached is not None:
+            now = monotonic()
+            if now < self._expires_at:
+                return cached
+            if now < self._stale_expires_at:
+                self._schedule_refresh()
+                return cached
+
+        # Cache is invalid or empty, fetch from database
+        return await self._fetch_shared(db)
+
+    async def preload(self, db: AsyncSession) -> LLMSettings:
+        """
+        Warm the cache so the first request doesn't pay for the fetch.
 
-            # Cache is invalid or empty, fetch from database
-            logger.debug("Cache miss or expired, fetching LLM settings from database")
-            settings = await self._fetch_from_database(db)
+        Args:
+            db: Database session
+
+        Returns:
+            LLM settings
+
+        Raises:
+            LLMConfigurationError: If settings cannot be retrieved
+        """
+        return await self.get_settings(db)
 
-            # Update cache
-            self._cached_settings = settings
-            self._cached_at = datetime.now(timezone.utc)
+    def _store(self, settings: LLMSettings) -> None:
+        """Cache freshly fetched settings and reset both deadlines."""
+        now = monotonic()
+        self._cached_settings = settings
+        self._expires_at = now + self.ttl_seconds
+        self._stale_expires_at = now + 2 * self.ttl_seconds
 
+    async def _fetch_shared(self, db: AsyncSession) -> LLMSettings:
+        """
+        Fetch and cache the settings, sharing one fetch between callers.
+
+        No lock is held across the database call: the first caller fetches
+        and publishes the result through a future that concurrent callers
+        await instead of querying themselves. If that caller is cancelled
+        mid-fetch, a waiter takes over and fetches with its own session.
+
+        Args:
+            db: Database session used if this call performs the fetch
+
+        Returns:
+            LLM settings
+
+        Raises:
+            LLMConfigurationError: If settings cannot be retrieved
+        """
+        while (inflight := self._inflight) is not None:
+            try:
+                # Shielded so one waiter's cancellation doesn't fail the others
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # Retry only if the fetching caller was cancelled, not this one
+                task = asyncio.current_task()
+                if not inflight.cancelled() or (task and task.cancelling()):
+                    raise
+                # Another waiter may already have taken over and finished
+                cached = self._cached_settings
+                if cached is not None and monotonic() < self._expires_at:
+                    return cached
+
+        logger.debug("Cache miss or expired, fetching LLM settings from database")
+        inflight = self._inflight = asyncio.get_running_loop().create_future()
+        generation = self._generation
+        try:
+            settings = await self._fetch_from_database(db)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                inflight.set_exception(e)
+                inflight.exception()  # retrieved; waiters (if any) re-raise it
+            else:
+                # Interrupted: waiters see the cancellation and retry
+                inflight.cancel()
+            raise
+        else:
+            if generation == self._generation:
+                self._store(settings)
+            inflight.set_result(settings)
             return settings
+        finally:
+            if self._inflight is inflight:
+                self._inflight = None
+
+    def _schedule_refresh(self) -> None:
+        """Start a background refresh unless one is already running."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+
+    async def _refresh(self) -> None:
+        """
+        Re-fetch the settings outside of any request.
+
+        Uses its own session because the request that triggered the refresh
+        may have finished (and closed its session) by the time this runs.
+        Failures are logged; the stale settings stay in place until their
+        stale deadline, after which requests fetch synchronously again.
+        """
+        if self._is_cache_valid():
+            return
+        try:
+            async with async_session_factory() as db:
+                await self._fetch_shared(db)
+        except LLMConfigurationError as e:
+            logger.warning(f"Background refresh of LLM settings failed: {e}")
 
     def _is_cache_valid(self) -> bool:
         """Check if the cached settings are still valid."""
-        if self._cached_settings is None or self._cached_at is None:
-            return False
-
-        expiry_time = self._cached_at + timedelta(seconds=self.ttl_seconds)
-        return datetime.now(timezone.utc) < expiry_time
+        return self._cached_settings is not None and monotonic() < self._expires_at
 
     async def _fetch_from_database(self, db: AsyncSession) -> LLMSettings:
         """
@@ -142,29 +247,15 @@ class LLMSettingsCache:
                 lmstudio_model=app_settings.LMSTUDIO_MODEL or None,
             )
 
-            settings_row = await self._llm_settings_repo.create_default_settings(
-                db, settings_row
-            )
+            # Returns the existing row if another request created it first
+            repo = self._llm_settings_repo
+            settings_row = await repo.get_or_create_default_settings(db, settings_row)
 
             logger.info(
-                f"Created default LLM settings with provider: {app_settings.LLM_PROVIDER}"
+                f"Default LLM settings ready with provider: {settings_row.provider}"
             )
             return settings_row
 
-        except IntegrityError as e:
-            # Handle race condition - another request might have created settings
-            await db.rollback()
-            fallback_settings = await self._llm_settings_repo.get_default_settings(db)
-            if fallback_settings is not None:
-                logger.info("LLM settings were created by another process")
-                return fallback_settings
-
-            logger.error(
-                f"Failed to create default LLM settings due to integrity error: {e}"
-            )
-            raise LLMConfigurationError(
-                "Failed to create or retrieve LLM settings"
-            ) from e
         except LLMConfigurationError:
             # Re-raise LLM configuration errors without modification
             raise
@@ -185,10 +276,12 @@ class LLMSettingsCache:
 
     async def invalidate_cache(self) -> None:
         """Invalidate the current cache, forcing a fresh fetch on next access."""
-        async with self._lock:
-            self._cached_settings = None
-            self._cached_at = None
-            logger.debug("LLM settings cache invalidated")
+        self._generation += 1
+        self._inflight = None
+        self._cached_settings = None
+        self._expires_at = 0.0
+        self._stale_expires_at = 0.0
+        logger.debug("LLM settings cache invalidated")
 
 
 class LLMServiceCache:
@@ -199,16 +292,76 @@ class LLMServiceCache:
     provider instances (OpenAI clients, Bedrock clients, etc.) on every request.
     """
 
-    def __init__(self, ttl_seconds: int = 900) -> None:  # 15 minutes default TTL
+    # Inserts between sweeps of expired entries
+    SWEEP_INTERVAL = 100
+
+    def __init__(self, ttl_seconds: int = 900, max_entries: int = 64) -> None:
         """
         Initialize the LLM service cache.
 
         Args:
             ttl_seconds: Time to live for cached services in seconds
+                (15 minutes by default)
+            max_entries: Maximum number of cached services; the least recently
+                used one is evicted beyond this
         """
         self.ttl_seconds = ttl_seconds
-        self._cached_services: dict[str, tuple[LLMService, datetime]] = {}
-        self._lock = asyncio.Lock()
+        self.max_entries = max_entries
+        # cache_key -> (service, time.monotonic() deadline), in LRU order
+        self._cached_services: OrderedDict[str, tuple[LLMService, float]] = (
+            OrderedDict()
+        )
+        self._inserts_since_sweep = 0
+        # Per-key locks held only while a missing service is being created
+        self._creation_locks: dict[str, asyncio.Lock] = {}
+        # (settings row, service, deadline) for the configured default service
+        self._default_entry: Optional[tuple[LLMSettings, LLMService, float]] = None
+
+    def get_default_service(self, settings: LLMSettings) -> Optional[LLMService]:
+        """
+        Get the service last resolved for the default settings.
+
+        The entry is keyed on the settings row object itself: the settings
+        cache hands out a new object whenever it refetches or is invalidated,
+        so a changed provider or model never matches a stale entry.
+
+        Args:
+            settings: Current default LLM settings
+
+        Returns:
+            The default service, or None if it must be resolved again
+        """
+        entry = self._default_entry
+        if entry is not None and entry[0] is settings and monotonic() < entry[2]:
+            return entry[1]
+        return None
+
+    def set_default_service(self, settings: LLMSettings, service: LLMService) -> None:
+        """
+        Remember the service resolved for the default settings.
+
+        Args:
+            settings: Default LLM settings the service was resolved from
+            service: The resolved service
+        """
+        self._default_entry = (settings, service, monotonic() + self.ttl_seconds)
+
+    def get_service_or_none(self, cache_key: str) -> Optional[LLMService]:
+        """
+        Get a cached service without creating one on a miss.
+
+        Args:
+            cache_key: Unique key for the service configuration
+
+        Returns:
+            Cached service, or None if it is missing or expired
+        """
+        # Dict lookups are atomic, so a fresh entry needs no lock
+        entry = self._cached_services.get(cache_key)
+        if entry is not None and self._is_cache_valid(entry[1]):
+            self._cached_services.move_to_end(cache_key)
+            return entry[0]
+        return None
 
     async def get_service(
         self, cache_key: str, factory_func: Callable[[], LLMService]
@@ -223,31 +376,78 @@ class LLMServiceCache:
         Returns:
             Cached or newly created service instance
         """
-        async with self._lock:
-            # Check if we have a valid cached service
-            if cache_key in self._cached_services:
-                service, cached_at = self._cached_services[cache_key]
-                if self._is_cache_valid(cached_at):
-                    logger.debug(f"Returning cached LLM service for key: {cache_key}")
-                    return service
-                else:
-                    # Cache expired, remove it
-                    del self._cached_services[cache_key]
-                    logger.debug(f"Expired cache entry removed for key: {cache_key}")
-
-            # Create new service instance
-            logger.debug(f"Creating new LLM service for key: {cache_key}")
-            service = factory_func()
-
-            # Cache the service
-            self._cached_services[cache_key] = (service, datetime.now(timezone.utc))
-
+        service = self.get_service_or_none(cache_key)
+        if service is not None:
             return service
 
-    def _is_cache_valid(self, cached_at: datetime) -> bool:
+        # Misses on the same key create the service once; other keys and
+        # readers are never blocked. setdefault cannot race on the event loop.
+        lock = self._creation_locks.setdefault(cache_key, asyncio.Lock())
+        try:
+            async with lock:
+                # Check if we have a valid cached service
+                if cache_key in self._cached_services:
+                    service, expires_at = self._cached_services[cache_key]
+                    if self._is_cache_valid(expires_at):
+                        logger.debug(
+                            f"Returning cached LLM service for key: {cache_key}"
+                        )
+                        return service
+                    else:
+                        # Cache expired, remove it
+                        del self._cached_services[cache_key]
+                        logger.debug(
+                            f"Expired cache entry removed for key: {cache_key}"
+                        )
+
+                # Create new service instance
+                logger.debug(f"Creating new LLM service for key: {cache_key}")
+                service = factory_func()
+
+                # Cache the service
+                self._insert(cache_key, service)
+
+                return service
+        finally:
+            # Waiters keep their reference and re-check the cache, so the
+            # lock can be dropped to keep the dict from growing
+            if self._creation_locks.get(cache_key) is lock:
+                del self._creation_locks[cache_key]
+
+    def _insert(self, cache_key: str, service: LLMService) -> None:
+        """
+        Cache a service, evicting the least recently used ones over capacity.
+
+        Evicted services are only dropped from the cache; requests that
+        already hold them keep using them.
+
+        Args:
+            cache_key: Unique key for the service configuration
+            service: Service instance to cache
+        """
+        self._inserts_since_sweep += 1
+        if self._inserts_since_sweep >= self.SWEEP_INTERVAL:
+            self._sweep_expired()
+
+        self._cached_services[cache_key] = (
+            service,
+            monotonic() + self.ttl_seconds,
+        )
+        while len(self._cached_services) > self.max_entries:
+            evicted_key, _ = self._cached_services.popitem(last=False)
+            logger.debug(f"Evicted least recently used LLM service: {evicted_key}")
+
+    def _sweep_expired(self) -> None:
+        """Drop every expired entry, not just the ones that are looked up."""
+        self._inserts_since_sweep = 0
+        now = monotonic()
+        for cache_key, (_, expires_at) in list(self._cached_services.items()):
+            if expires_at <= now:
+                del self._cached_services[cache_key]
+
+    def _is_cache_valid(self, expires_at: float) -> bool:
         """Check if a cached service is still valid."""
-        expiry_time = cached_at + timedelta(seconds=self.ttl_seconds)
-        return datetime.now(timezone.utc) < expiry_time
+        return monotonic() < expires_at
 
     async def invalidate_cache(self, cache_key: Optional[str] = None) -> None:
         """
@@ -256,15 +456,34 @@ class LLMServiceCache:
         Args:
             cache_key: Specific cache key to invalidate, or None to clear all
         """
-        async with self._lock:
-            if cache_key is None:
-                # Clear all cached services
-                self._cached_services.clear()
-                logger.debug("All cached LLM services invalidated")
-            elif cache_key in self._cached_services:
-                # Clear specific cached service
-                del self._cached_services[cache_key]
-                logger.debug(f"Cached LLM service invalidated for key: {cache_key}")
+        if cache_key is None:
+            # Clear all cached services
+            self._cached_services.clear()
+            self._default_entry = None
+            logger.debug("All cached LLM services invalidated")
+        elif cache_key in self._cached_services:
+            # Clear specific cached service
+            del self._cached_services[cache_key]
+            logger.debug(f"Cached LLM service invalidated for key: {cache_key}")
+
+    async def aclose(self) -> None:
+        """
+        Close every cached service and clear the cache (e.g. on shutdown).
+
+        Only meant for teardown: requests still holding a service would find
+        its clients closed.
+        """
+        services = {
+            id(service): service for service, _ in self._cached_services.values()
+        }
+        if self._default_entry is not None:
+            services[id(self._default_entry[1])] = self._default_entry[1]
+        await self.invalidate_cache()
+
+        for service in services.values():
+            aclose = getattr(service, "aclose", None)
+            if aclose is not None:
+                await aclose()
 
     def _generate_cache_key(
         self,
@@ -283,14 +502,13 @@ class LLMServiceCache:
         Returns:
             Cache key string
         """
-        # Create a stable cache key from provider, model, and config
-        key_parts = [provider, model]
-
-        # Add sorted config parameters for deterministic key generation
-        for key, value in sorted(config_params.items()):
-            key_parts.append(f"{key}={value}")
-
-        return "|".join(key_parts)
+        # Sorted config parameters give a deterministic key
+        config_items = tuple(sorted(config_params.items()))
+        try:
+            return _build_cache_key(provider, model, config_items)
+        except TypeError:
+            # Unhashable parameter values can't be memoized
+            return _build_cache_key.__wrapped__(provider, model, config_items)
 
     async def get_service_with_config(
         self,
@@ -319,12 +537,28 @@ class LLMServiceCache:
         return await self.get_service(cache_key, factory_func)
 
 
-# Global cache instances
-_llm_settings_cache: Optional[LLMSettingsCache] = None
-_llm_service_cache: Optional[LLMServiceCache] = None
-_cache_lock = threading.Lock()
+@lru_cache(maxsize=256)
+def _build_cache_key(
+    provider: str, model: str, config_items: tuple[tuple[str, Any], ...]
+) -> str:
+    """
+    Join a provider, model and sorted config parameters into a cache key.
+
+    Args:
+        provider: LLM provider name
+        model: Model name
+        config_items: Sorted ``(name, value)`` configuration pairs
+
+    Returns:
+        Cache key string
+    """
+    key_parts = [provider, model]
+    for key, value in config_items:
+        key_parts.append(f"{key}={value}")
+    return "|".join(key_parts)
 
 
+@cache
 def get_llm_settings_cache() -> LLMSettingsCache:
     """
     Get the global LLM settings cache instance.
@@ -332,15 +566,10 @@ def get_llm_settings_cache() -> LLMSettingsCache:
     Returns:
         LLM settings cache instance
     """
-    global _llm_settings_cache
-    if _llm_settings_cache is None:
-        with _cache_lock:
-            # Double-checked locking pattern
-            if _llm_settings_cache is None:
-                _llm_settings_cache = LLMSettingsCache()
-    return _llm_settings_cache
+    return LLMSettingsCache()
 
 
+@cache
 def get_llm_service_cache() -> LLMServiceCache:
     """
     Get the global LLM service cache instance.
@@ -348,10 +577,11 @@ def get_llm_service_cache() -> LLMServiceCache:
     Returns:
         LLM service cache instance
     """
-    global _llm_service_cache
-    if _llm_service_cache is None:
-        with _cache_lock:
-            # Double-checked locking pattern
-            if _llm_service_cache is None:
-                _llm_service_cache = LLMServiceCache()
-    return _llm_service_cache
+    return LLMServiceCache()
+
+
+def reset_caches() -> None:
+    """Drop the global cache instances; the next accessor call creates new ones."""
+    get_llm_settings_cache.cache_clear()
+    get_llm_service_cache.cache_clear()
+    get_llm_response_cache.cache_clear()
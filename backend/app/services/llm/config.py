@@ -1,9 +1,13 @@
 """Configuration management for LLM services."""
 
-from typing import Literal
+from functools import lru_cache
+from types import SimpleNamespace
+from typing import Callable, Literal
 
 from pydantic import BaseModel, Field
 
+from .exceptions import LLMConfigurationError
+
 
 class OpenAIConfig(BaseModel):
     """Configuration for OpenAI LLM provider."""
@@ -77,115 +81,180 @@ class LLMConfig(BaseModel):
     )
 
 
-def load_config(
-    provider: str | None = None, default_model: str | None = None
-) -> LLMConfig:
-    """Load LLM configuration using the given provider and model."""
+def _build_openai_config(settings: SimpleNamespace, default_model: str) -> LLMConfig:
+    """Build the OpenAI configuration."""
+    openai_api_key = settings.OPENAI_API_KEY
+    if not openai_api_key or openai_api_key.strip() == "":
+        raise LLMConfigurationError(
+            "OPENAI_API_KEY secret is required for OpenAI provider"
+        )
 
-    from app.core.config import get_settings
+    openai_config = OpenAIConfig(
+        api_key=openai_api_key,
+        default_model=default_model,
+    )
 
-    from .exceptions import LLMConfigurationError
+    return LLMConfig(
+        provider="openai",
+        default_model=default_model,
+        openai=openai_config,
+        openrouter=None,
+        bedrock=None,
+        lmstudio=None,
+    )
 
-    settings = get_settings()
 
-    resolved_provider = provider or settings.LLM_PROVIDER
-    provider = resolved_provider.lower() if resolved_provider else "openai"
-    default_model = (
-        default_model if default_model is not None else settings.DEFAULT_LLM_MODEL
+def _build_openrouter_config(
+    settings: SimpleNamespace, default_model: str
+) -> LLMConfig:
+    """Build the OpenRouter configuration."""
+    openrouter_api_key = settings.OPENROUTER_API_KEY
+    if not openrouter_api_key or openrouter_api_key.strip() == "":
+        raise LLMConfigurationError(
+            "OPENROUTER_API_KEY secret is required for OpenRouter provider"
+        )
+
+    # Use OPENROUTER_MODEL if available, otherwise fall back to DEFAULT_LLM_MODEL
+    openrouter_model = settings.OPENROUTER_MODEL or default_model
+
+    openrouter_config = OpenRouterConfig(
+        api_key=openrouter_api_key,
+        base_url=settings.OPENROUTER_BASE_URL,
+        default_model=openrouter_model,
     )
 
-    if provider == "openai":
-        openai_api_key = settings.OPENAI_API_KEY
-        if not openai_api_key or openai_api_key.strip() == "":
-            raise LLMConfigurationError(
-                "OPENAI_API_KEY secret is required for OpenAI provider"
-            )
+    return LLMConfig(
+        provider="openrouter",
+        default_model=openrouter_model,
+        openai=None,
+        openrouter=openrouter_config,
+        bedrock=None,
+        lmstudio=None,
+    )
 
-        openai_config = OpenAIConfig(
-            api_key=openai_api_key,
-            default_model=default_model,
-        )
 
-        return LLMConfig(
-            provider=provider,  # type: ignore
-            default_model=default_model,
-            openai=openai_config,
-            openrouter=None,
-            bedrock=None,
-            lmstudio=None,
+def _build_bedrock_config(settings: SimpleNamespace, default_model: str) -> LLMConfig:
+    """Build the Amazon Bedrock configuration."""
+    bedrock_model = settings.BEDROCK_MODEL
+    if not bedrock_model or bedrock_model.strip() == "":
+        raise LLMConfigurationError(
+            "BEDROCK_MODEL environment variable is required for Bedrock provider"
         )
 
-    elif provider == "openrouter":
-        openrouter_api_key = settings.OPENROUTER_API_KEY
-        if not openrouter_api_key or openrouter_api_key.strip() == "":
-            raise LLMConfigurationError(
-                "OPENROUTER_API_KEY secret is required for OpenRouter provider"
-            )
+    bedrock_config = BedrockConfig(
+        region=settings.BEDROCK_REGION,
+        model_id=bedrock_model,
+        access_key_id=settings.AWS_ACCESS_KEY_ID,
+        secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+    )
 
-        # Use OPENROUTER_MODEL if available, otherwise fall back to DEFAULT_LLM_MODEL
-        openrouter_model = settings.OPENROUTER_MODEL or default_model
+    return LLMConfig(
+        provider="bedrock",
+        default_model=bedrock_model,
+        openai=None,
+        openrouter=None,
+        bedrock=bedrock_config,
+        lmstudio=None,
+    )
 
-        openrouter_config = OpenRouterConfig(
-            api_key=openrouter_api_key,
-            base_url=settings.OPENROUTER_BASE_URL,
-            default_model=openrouter_model,
-        )
 
-        return LLMConfig(
-            provider=provider,  # type: ignore
-            default_model=openrouter_model,
-            openai=None,
-            openrouter=openrouter_config,
-            bedrock=None,
-            lmstudio=None,
+def _build_lmstudio_config(settings: SimpleNamespace, default_model: str) -> LLMConfig:
+    """Build the LMStudio configuration."""
+    lmstudio_base_url = settings.LMSTUDIO_BASE_URL
+    if not lmstudio_base_url:
+        raise LLMConfigurationError(
+            "LMSTUDIO_BASE_URL environment variable is required for LMStudio provider"
         )
 
-    elif provider == "bedrock":
-        bedrock_model = settings.BEDROCK_MODEL
-        if not bedrock_model or bedrock_model.strip() == "":
-            raise LLMConfigurationError(
-                "BEDROCK_MODEL environment variable is required for Bedrock provider"
-            )
-
-        bedrock_config = BedrockConfig(
-            region=settings.BEDROCK_REGION,
-            model_id=bedrock_model,
-            access_key_id=settings.AWS_ACCESS_KEY_ID,
-            secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-        )
+    # Use the passed default_model if available, otherwise fall back to LMSTUDIO_MODEL
+    lmstudio_model = default_model or settings.LMSTUDIO_MODEL
 
-        return LLMConfig(
-            provider=provider,  # type: ignore
-            default_model=bedrock_model,
-            openai=None,
-            openrouter=None,
-            bedrock=bedrock_config,
-            lmstudio=None,
-        )
+    lmstudio_config = LMStudioConfig(
+        base_url=lmstudio_base_url,
+        default_model=lmstudio_model,
+    )
 
-    elif provider == "lmstudio":
-        lmstudio_base_url = settings.LMSTUDIO_BASE_URL
-        if not lmstudio_base_url:
-            raise LLMConfigurationError(
-                "LMSTUDIO_BASE_URL environment variable is required for LMStudio provider"
-            )
+    return LLMConfig(
+        provider="lmstudio",
+        default_model=lmstudio_model,
+        openai=None,
+        openrouter=None,
+        bedrock=None,
+        lmstudio=lmstudio_config,
+    )
 
-        # Use the passed default_model if available, otherwise fall back to LMSTUDIO_MODEL
-        lmstudio_model = default_model or settings.LMSTUDIO_MODEL
 
-        lmstudio_config = LMStudioConfig(
-            base_url=lmstudio_base_url,
-            default_model=lmstudio_model,
-        )
+# Per provider: the settings its configuration is built from, and the builder.
+# The settings values are part of the load_config memo key, so changed
+# settings are picked up on the next call.
+_PROVIDER_BUILDERS: dict[
+    str,
+    tuple[tuple[str, ...], Callable[[SimpleNamespace, str], LLMConfig]],
+] = {
+    "openai": (("OPENAI_API_KEY",), _build_openai_config),
+    "openrouter": (
+        ("OPENROUTER_API_KEY", "OPENROUTER_MODEL", "OPENROUTER_BASE_URL"),
+        _build_openrouter_config,
+    ),
+    "bedrock": (
+        (
+            "BEDROCK_MODEL",
+            "BEDROCK_REGION",
+            "AWS_ACCESS_KEY_ID",
+            "AWS_SECRET_ACCESS_KEY",
+        ),
+        _build_bedrock_config,
+    ),
+    "lmstudio": (("LMSTUDIO_BASE_URL", "LMSTUDIO_MODEL"), _build_lmstudio_config),
+}
 
-        return LLMConfig(
-            provider=provider,  # type: ignore
-            default_model=lmstudio_model,
-            openai=None,
-            openrouter=None,
-            bedrock=None,
-            lmstudio=lmstudio_config,
-        )
 
-    else:
+def load_config(
+    provider: str | None = None, default_model: str | None = None
+) -> LLMConfig:
+    """
+    Load LLM configuration using the given provider and model.
+
+    Configurations are memoized per provider, model and the provider's
+    settings values; the returned model is shared and must not be mutated.
+    """
+
+    from app.core.config import get_settings
+
+    settings = get_settings()
+
+    resolved_provider = provider or settings.LLM_PROVIDER
+    provider = resolved_provider.lower() if resolved_provider else "openai"
+    model: str = (
+        default_model if default_model is not None else settings.DEFAULT_LLM_MODEL
+    )
+
+    entry = _PROVIDER_BUILDERS.get(provider)
+    if entry is None:
         raise LLMConfigurationError(f"Unsupported LLM provider: {provider}")
+
+    setting_values = tuple(getattr(settings, name) for name in entry[0])
+    return _load_config_cached(provider, model, setting_values)
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(
+    provider: str, default_model: str, setting_values: tuple
+) -> LLMConfig:
+    """
+    Build the configuration for a provider from its settings values.
+
+    Args:
+        provider: Lowercase provider name (a key of ``_PROVIDER_BUILDERS``)
+        default_model: Requested model, or the settings default
+        setting_values: Values of the provider's settings, in table order
+
+    Returns:
+        LLM configuration
+
+    Raises:
+        LLMConfigurationError: If a required setting is missing
+    """
+    setting_names, builder = _PROVIDER_BUILDERS[provider]
+    settings = SimpleNamespace(**dict(zip(setting_names, setting_values)))
+    return builder(settings, default_model)
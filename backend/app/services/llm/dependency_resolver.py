@@ -1,10 +1,11 @@
 """Dependency resolution and database operations for LLM services."""
 
 import logging
-from typing import Optional
+from functools import partial
+from typing import Final, NamedTuple, Optional
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.db.session import get_db_session
 from app.models import LLMSettings
@@ -17,12 +18,22 @@ from .protocol import LLMService
 
 logger = logging.getLogger(__name__)
 
+# LLMSettings attribute holding each provider's model
+_PROVIDER_MODEL_ATTRS: Final[dict[str, str]] = {
+    "openai": "openai_model",
+    "openrouter": "openrouter_model",
+    "bedrock": "bedrock_model",
+    "lmstudio": "lmstudio_model",
+}
+_SUPPORTED_PROVIDERS: Final[frozenset[str]] = frozenset(_PROVIDER_MODEL_ATTRS)
+
 __all__ = [
     "ensure_llm_settings",
     "get_llm_service",
     "get_llm_service_with_overrides",
     "LLMServiceDep",
     "LLMServiceResult",
+    "preload_llm_service",
 ]
 
 
@@ -60,11 +71,10 @@ def _validate_provider_and_model(provider: str, model: Optional[str]) -> str:
     Raises:
         LLMConfigurationError: If validation fails
     """
-    supported_providers = {"openai", "openrouter", "bedrock", "lmstudio"}
-    if provider not in supported_providers:
+    if provider not in _SUPPORTED_PROVIDERS:
         raise LLMConfigurationError(
             f"Unsupported provider: {provider}. "
-            f"Supported providers: {supported_providers}"
+            f"Supported providers: {set(_SUPPORTED_PROVIDERS)}"
         )
 
     if not model or model.strip() == "":
@@ -87,15 +97,8 @@ def _get_model_for_provider(settings_row: LLMSettings, provider: str) -> str:
     Raises:
         LLMConfigurationError: If model is not configured for the provider
     """
-    # Mapping from provider to its corresponding model attribute
-    provider_model_mapping = {
-        "openai": settings_row.openai_model,
-        "openrouter": settings_row.openrouter_model,
-        "bedrock": settings_row.bedrock_model,
-        "lmstudio": settings_row.lmstudio_model,
-    }
-
-    model = provider_model_mapping.get(provider)
+    model_attr = _PROVIDER_MODEL_ATTRS.get(provider)
+    model = getattr(settings_row, model_attr) if model_attr is not None else None
     if model is None:
         raise LLMConfigurationError(f"Unsupported provider: {provider}")
 
@@ -116,20 +119,59 @@ async def _create_service_with_cache_async(provider: str, model: str) -> LLMServ
     Raises:
         LLMConfigurationError: If service creation fails
     """
-
-    def factory_func() -> LLMService:
-        config = load_config(provider=provider, default_model=model)
-        return LLMServiceFactory.create_service(config)
-
     service_cache = get_llm_service_cache()
-    return await service_cache.get_service_with_config(
-        provider=provider,
-        model=model,
-        config_params={"provider": provider, "model": model},
-        factory_func=factory_func,
+    # Same key get_service_with_config builds when there are no extra params
+    cache_key = f"{provider}|{model}"
+    service = service_cache.get_service_or_none(cache_key)
+    if service is not None:
+        return service
+
+    # The factory is only bound on a miss
+    return await service_cache.get_service(
+        cache_key, partial(_create_service, provider, model)
     )
 
 
+def _create_service(provider: str, model: str) -> LLMService:
+    """
+    Create an uncached LLM service instance.
+
+    Args:
+        provider: Provider name
+        model: Model name
+
+    Returns:
+        LLM service instance
+
+    Raises:
+        LLMConfigurationError: If the configuration is invalid
+    """
+    config = load_config(provider=provider, default_model=model)
+    return LLMServiceFactory.create_service(config)
+
+
+async def preload_llm_service(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    """
+    Warm the settings and service caches for the configured provider.
+
+    Meant to run as a startup background task. Failures are logged rather
+    than raised: the first request will simply try again.
+
+    Args:
+        session_factory: Factory for the session used to read the settings
+    """
+    try:
+        async with session_factory() as db:
+            settings_row = await get_llm_settings_cache().preload(db)
+        model = _get_model_for_provider(settings_row, settings_row.provider)
+        await _create_service_with_cache_async(settings_row.provider, model)
+        logger.info(f"Preloaded LLM service for provider: {settings_row.provider}")
+    except Exception as e:
+        logger.warning(f"Could not preload LLM service: {e}", exc_info=True)
+
+
 async def get_llm_service(
     db: AsyncSession = Depends(get_db_session),
 ) -> LLMService:
@@ -147,26 +189,31 @@ async def get_llm_service(
     """
     try:
         settings_row = await ensure_llm_settings(db)
-        model = _get_model_for_provider(settings_row, settings_row.provider)
-        return await _create_service_with_cache_async(settings_row.provider, model)
+        service_cache = get_llm_service_cache()
+        service = service_cache.get_default_service(settings_row)
+        if service is None:
+            provider = settings_row.provider
+            model = _get_model_for_provider(settings_row, provider)
+            service = await _create_service_with_cache_async(provider, model)
+            service_cache.set_default_service(settings_row, service)
+        return service
     except LLMConfigurationError as e:
         from app.api.utils import handle_llm_error
 
         handle_llm_error(e, "LLM service initialization")
 
 
-class LLMServiceResult:
+class LLMServiceResult(NamedTuple):
     """Result of LLM service creation with provider and model information.
 
     This class provides a structured way to return the LLM service instance
     along with the actual provider and model used, replacing the error-prone
-    tuple return pattern.
+    bare tuple return pattern.
     """
 
-    def __init__(self, service: LLMService, provider: str, model: str) -> None:
-        self.service = service
-        self.provider = provider
-        self.model = model
+    service: LLMService
+    provider: str
+    model: str
 
 
 async def get_llm_service_with_overrides(
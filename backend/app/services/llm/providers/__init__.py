@@ -1,10 +1,20 @@
-"""LLM provider implementations."""
+"""
+LLM provider implementations.
+
+Provider classes are imported on first access (PEP 562): each one pulls in
+its SDK (boto3, openai), and a process usually needs only one of them.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from .base import BaseLLMProvider
-from .bedrock import BedrockLLMProvider
-from .lmstudio import LMStudioLLMProvider
-from .openai import OpenAILLMProvider
-from .openrouter import OpenRouterLLMProvider
+
+if TYPE_CHECKING:
+    from .bedrock import BedrockLLMProvider
+    from .lmstudio import LMStudioLLMProvider
+    from .openai import OpenAILLMProvider
+    from .openrouter import OpenRouterLLMProvider
 
 __all__ = [
     "BaseLLMProvider",
@@ -13,3 +23,21 @@ __all__ = [
     "BedrockLLMProvider",
     "LMStudioLLMProvider",
 ]
+
+# Provider class name -> submodule defining it
+_LAZY = {
+    "BedrockLLMProvider": ".bedrock",
+    "LMStudioLLMProvider": ".lmstudio",
+    "OpenAILLMProvider": ".openai",
+    "OpenRouterLLMProvider": ".openrouter",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import a provider class on first access and cache it on the package."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    provider_class = getattr(import_module(module_name, __name__), name)
+    globals()[name] = provider_class
+    return provider_class
@@ -1,21 +1,155 @@
 """Base class for all LLM providers."""
 
+import asyncio
 import logging
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
-from typing import Any, Type, TypeVar
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import lru_cache, partial
+from typing import Any, Optional, Type, TypeVar, cast
 
 from pydantic import BaseModel
 
+from app.utils import fast_json
 from app.utils.performance import timing_decorator
 
 from ..exceptions import LLMGenerationError
-from ..utils import parse_json_response
+from ..utils import json_schema_for, parse_json_response
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Call kwargs never written to the logs
+_SENSITIVE_KEYS = frozenset(
+    {
+        "api_key",
+        "access_key_id",
+        "secret_access_key",
+        "aws_access_key_id",
+        "aws_secret_access_key",
+    }
+)
+
+
+@lru_cache(maxsize=256)
+def _build_structured_instructions(response_model: Type[BaseModel]) -> str:
+    """Build the instructions requesting JSON that matches a model's schema."""
+    schema = fast_json.dumps(json_schema_for(response_model))
+    return (
+        "Please respond with a valid JSON object that matches this schema:\n"
+        f"{schema}\n\n"
+        "Respond only with the JSON object, no additional text."
+    )
+
+
+@lru_cache(maxsize=256)
+def _structured_prompt_suffix(response_model: Type[BaseModel]) -> str:
+    """Build the JSON instructions appended to structured prompts for a model."""
+    return "\n\n" + _build_structured_instructions(response_model)
+
+
+async def _batched(
+    chunks: AsyncIterator[str], max_chars: int = 64, max_delay_ms: float = 25
+) -> AsyncIterator[str]:
+    """
+    Coalesce streamed text chunks into fewer, larger chunks.
+
+    A batch is yielded once it holds ``max_chars`` characters or its first
+    chunk has waited ``max_delay_ms``; the remainder is yielded when the
+    stream ends. A ``max_chars`` of 1 or less passes chunks through as-is.
+
+    Args:
+        chunks: Stream of text chunks
+        max_chars: Batch size that triggers an immediate flush
+        max_delay_ms: Longest time a chunk is held back
+
+    Yields:
+        Concatenated text chunks
+    """
+    if max_chars <= 1:
+        async for text in chunks:
+            yield text
+        return
+
+    # anext() below returns None at the end of the stream
+    iterator = cast(AsyncIterator[str | None], aiter(chunks))
+
+    loop = asyncio.get_running_loop()
+    max_delay = max_delay_ms / 1000
+    buffer: list[str] = []
+    size = 0
+    deadline = 0.0
+    # The next read is kept across flushes: cancelling it on a timeout would
+    # close the underlying stream
+    pending: asyncio.Future[str | None] | None = None
+    try:
+        while True:
+            if not buffer:
+                # Nothing to flush, so wait without a timer
+                chunk = await (pending or anext(iterator, None))
+                pending = None
+            else:
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(iterator, None))
+                timeout = max(deadline - loop.time(), 0)
+                done, _ = await asyncio.wait((pending,), timeout=timeout)
+                if not done:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    size = 0
+                    continue
+                chunk = pending.result()
+                pending = None
+
+            if chunk is None:
+                break
+            if not buffer:
+                deadline = loop.time() + max_delay
+            buffer.append(chunk)
+            size += len(chunk)
+            if size >= max_chars:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+class _Flight:
+    """A shared request running in its own task, and how many callers await it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future[str]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+def _fresh_exception(error: Exception) -> Optional[Exception]:
+    """
+    Copy an exception so each caller of a shared request raises its own.
+
+    Raising one instance from several tasks would splice their tracebacks
+    together. ``__init__`` isn't re-run, since many SDK errors take required
+    keyword arguments; the copy gets the original's args and attributes.
+
+    Args:
+        error: Exception raised by the shared request
+
+    Returns:
+        The copy, or None if the exception can't be copied this way
+    """
+    try:
+        fresh = type(error).__new__(type(error), *error.args)
+        fresh.__dict__.update(error.__dict__)
+    except Exception:
+        return None
+    return fresh
+
 
 class BaseLLMProvider(ABC):
     """
@@ -33,6 +167,9 @@ class BaseLLMProvider(ABC):
         """
         self.default_model = default_model
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
+        self._provider_name = type(self).__name__.replace("LLMProvider", "")
+        # Deterministic requests currently running, by request key
+        self._inflight: dict[str, _Flight] = {}
 
     @abstractmethod
     async def get_response(
@@ -88,6 +225,61 @@ class BaseLLMProvider(ABC):
         """Stream text responses."""
         ...
 
+    async def aclose(self) -> None:
+        """Release network resources held by the provider (none by default)."""
+
+    async def _singleflight(
+        self, key: Optional[str], call: Callable[[], Awaitable[str]]
+    ) -> str:
+        """
+        Run call once for all concurrent callers sharing a request key.
+
+        The request runs in its own task that every caller with the same key
+        awaits, so cancelling one caller leaves the others waiting. The task
+        is only cancelled once no caller is left; if it is cancelled anyway,
+        a remaining caller starts the request again. A failure is re-raised
+        as a separate copy in each caller, chained to the original.
+
+        Args:
+            key: Request key, or None to always run call (e.g. sampled calls)
+            call: Coroutine function making the request
+
+        Returns:
+            The request's result
+        """
+        if key is None:
+            return await call()
+
+        while True:
+            flight = self._inflight.get(key)
+            if flight is None or flight.task.done():
+                flight = self._inflight[key] = _Flight(asyncio.ensure_future(call()))
+                flight.task.add_done_callback(partial(self._land, key, flight))
+            flight.waiters += 1
+            try:
+                # Shielded so one caller's cancellation doesn't stop the request
+                return await asyncio.shield(flight.task)
+            except asyncio.CancelledError:
+                # Start over only if the request, not this caller, was cancelled
+                task = asyncio.current_task()
+                if not flight.task.cancelled() or (task and task.cancelling()):
+                    raise
+            except Exception as e:
+                fresh = _fresh_exception(e)
+                if fresh is None:
+                    raise
+                raise fresh from e
+            finally:
+                flight.waiters -= 1
+                if not flight.waiters and not flight.task.done():
+                    # Nobody is waiting for the result any more
+                    flight.task.cancel()
+
+    def _land(self, key: str, flight: _Flight, task: asyncio.Future[str]) -> None:
+        """Forget a finished request unless a newer one replaced it."""
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+
     def _get_model(self, model: str | None) -> str:
         """Get the model to use, falling back to default if not specified."""
         resolved_model = model or self.default_model
@@ -105,31 +297,35 @@ class BaseLLMProvider(ABC):
             model: The model being used
             **kwargs: Additional parameters to log
         """
-        # Add relevant kwargs for debugging (excluding sensitive data)
-        safe_kwargs = {
-            k: v
-            for k, v in kwargs.items()
-            if k not in ["api_key", "access_key_id", "secret_access_key"]
-        }
-
-        provider_name = self.__class__.__name__.replace("LLMProvider", "")
-
-        # Build the log message parts to avoid format string issues
-        log_parts = [
-            f"🤖 LLM Call → Provider: {provider_name}",
-            f"Model: {model}",
-            f"Operation: {operation}",
-        ]
-
-        if safe_kwargs:
-            # Format parameters safely by converting to key=value pairs
-            param_parts = [f"{k}={v}" for k, v in safe_kwargs.items()]
-            log_parts.append(f"Parameters: {', '.join(param_parts)}")
-
-        log_message = ", ".join(log_parts)
+        # Called on every request; skip all formatting when INFO is disabled
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
 
-        # Log using structured logging only
-        self.logger.info(log_message)
+        # Add relevant kwargs for debugging (excluding sensitive data)
+        safe_kwargs = (
+            {k: v for k, v in kwargs.items() if k not in _SENSITIVE_KEYS}
+            if kwargs
+            else kwargs
+        )
+
+        if not safe_kwargs:
+            self.logger.info(
+                "🤖 LLM Call → Provider: %s, Model: %s, Operation: %s",
+                self._provider_name,
+                model,
+                operation,
+            )
+            return
+
+        # Format parameters as key=value pairs
+        parameters = ", ".join(f"{k}={v}" for k, v in safe_kwargs.items())
+        self.logger.info(
+            "🤖 LLM Call → Provider: %s, Model: %s, Operation: %s, Parameters: %s",
+            self._provider_name,
+            model,
+            operation,
+            parameters,
+        )
 
     def _format_structured_prompt(self, prompt: str, response_model: Type[T]) -> str:
         """
@@ -142,13 +338,23 @@ class BaseLLMProvider(ABC):
         Returns:
             Formatted prompt requesting JSON output
         """
-        schema = response_model.model_json_schema()
-        return f"""{prompt}
+        return prompt + _structured_prompt_suffix(response_model)
+
+    def _structured_instructions(self, response_model: Type[T]) -> str:
+        """
+        Get instructions requesting JSON output, for use as a system message.
+
+        The text is built once per response model, so it is byte-identical
+        across calls. Sent ahead of the prompt it forms a stable prefix that
+        APIs with automatic prompt caching (e.g. OpenAI) can reuse.
 
-Please respond with a valid JSON object that matches this schema:
-{schema}
+        Args:
+            response_model: Pydantic model for the expected response
 
-Respond only with the JSON object, no additional text."""
+        Returns:
+            Instructions embedding the model's JSON schema
+        """
+        return _build_structured_instructions(response_model)
 
     def _validate_response(self, content: str) -> str:
         """
@@ -163,6 +369,7 @@ Respond only with the JSON object, no additional text."""
         Raises:
             LLMGenerationError: If content is empty or invalid
         """
-        if not content or not content.strip():
+        stripped = content.strip() if content else ""
+        if not stripped:
             raise LLMGenerationError("Received an empty response from LLM provider")
-        return content.strip()
+        return stripped
@@ -1,10 +1,16 @@
 """Amazon Bedrock LLM provider implementation."""
 
 import asyncio
-from collections.abc import AsyncIterator
+import contextvars
+import threading
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from functools import lru_cache, partial
 from typing import Any, Type, TypeVar
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 from pydantic import BaseModel
 
@@ -12,10 +18,169 @@ from app.utils.performance import timing_decorator
 
 from ..config import BedrockConfig
 from ..exceptions import LLMGenerationError, LLMProviderError
-from ..utils import parse_json_response, retry_on_failure
-from .base import BaseLLMProvider
+from ..utils import json_schema_for, parse_json_response, retry_on_failure
+from .base import BaseLLMProvider, _batched
 
 T = TypeVar("T", bound=BaseModel)
+E = TypeVar("E")
+R = TypeVar("R")
+
+# Blocking boto3 calls run here rather than in the loop's default executor,
+# so long generations and streams can't starve other to_thread users such as
+# password hashing. Threads are only started when needed.
+BEDROCK_MAX_WORKERS = 32
+_executor = ThreadPoolExecutor(
+    max_workers=BEDROCK_MAX_WORKERS, thread_name_prefix="bedrock"
+)
+
+# Marks the end of the events pumped by _iterate_in_thread
+_END = object()
+
+
+@lru_cache(maxsize=8)
+def _bedrock_client(
+    region: str,
+    access_key_id: str | None,
+    secret_access_key: str | None,
+    timeout: int,
+    max_retries: int,
+) -> Any:  # noqa: ANN401
+    """
+    Get the bedrock-runtime client for a region and credential pair.
+
+    boto3 clients are expensive to build and each holds its own connection
+    pool, so providers with the same settings share one client and reuse
+    its keep-alive connections.
+
+    Args:
+        region: AWS region
+        access_key_id: AWS access key ID, or None for the default chain
+        secret_access_key: AWS secret access key, or None for the default chain
+        timeout: Read timeout in seconds
+        max_retries: Retries after the first attempt
+
+    Returns:
+        A boto3 bedrock-runtime client
+    """
+    client_kwargs: dict[str, Any] = {"region_name": region}
+    if access_key_id and secret_access_key:
+        client_kwargs["aws_access_key_id"] = access_key_id
+        client_kwargs["aws_secret_access_key"] = secret_access_key
+
+    config = Config(
+        read_timeout=timeout,
+        # One connection per executor thread that can be calling Bedrock
+        max_pool_connections=BEDROCK_MAX_WORKERS,
+        retries={"mode": "standard", "max_attempts": max_retries},
+        tcp_keepalive=True,
+    )
+    return boto3.client("bedrock-runtime", config=config, **client_kwargs)
+
+
+@lru_cache(maxsize=256)
+def _bedrock_tool_config(response_model: Type[BaseModel]) -> dict[str, Any]:
+    """
+    Build the converse toolConfig that asks for output matching a model.
+
+    The dict is shared by every request for the model and must not be
+    mutated.
+
+    Args:
+        response_model: Pydantic model describing the expected JSON schema
+
+    Returns:
+        toolConfig for the converse API
+    """
+    return {
+        "tools": [
+            {
+                "toolSpec": {
+                    "name": "json_extractor",
+                    "description": "Extracts structured data in JSON format",
+                    "inputSchema": {"json": json_schema_for(response_model)},
+                }
+            }
+        ]
+    }
+
+
+async def _run_blocking(
+    func: Callable[..., R], /, *args: Any, **kwargs: Any  # noqa: ANN401
+) -> R:
+    """
+    Run a blocking boto3 call on the Bedrock executor.
+
+    Like ``asyncio.to_thread``, the call sees the caller's context variables.
+
+    Args:
+        func: Blocking callable
+        *args: Positional arguments for ``func``
+        **kwargs: Keyword arguments for ``func``
+
+    Returns:
+        The result of ``func``
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_executor, call)
+
+
+async def _iterate_in_thread(events: Iterable[E]) -> AsyncGenerator[E, None]:
+    """
+    Iterate a blocking iterable from a worker thread.
+
+    botocore's EventStream reads the socket while iterating, so iterating it
+    directly would block the event loop between chunks. A worker thread
+    drains it into a queue instead; closing this generator stops the worker
+    and closes the stream.
+
+    Args:
+        events: Blocking iterable to drain
+
+    Yields:
+        Items of ``events`` in order
+
+    Raises:
+        Exception: Whatever iterating ``events`` raised
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue()
+    stop = threading.Event()
+
+    def put(item: Any, error: BaseException | None = None) -> None:  # noqa: ANN401
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, (item, error))
+        except RuntimeError:
+            # The loop has closed; nobody is left to read the queue
+            stop.set()
+
+    def pump() -> None:
+        try:
+            for event in events:
+                if stop.is_set():
+                    return
+                put(event)
+        except Exception as e:
+            put(_END, e)
+        else:
+            put(_END)
+
+    worker = loop.run_in_executor(_executor, pump)
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is _END:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        if not worker.done():
+            close = getattr(events, "close", None)
+            if close is not None:
+                close()
 
 
 class BedrockLLMProvider(BaseLLMProvider):
@@ -30,6 +195,14 @@ class BedrockLLMProvider(BaseLLMProvider):
     MESSAGE_STOP = "messageStop"
     TOOL_USE = "toolUse"
 
+    # Keyword argument -> converse API inferenceConfig key
+    _INFERENCE_KEY_MAP = (
+        ("max_tokens", "maxTokens"),
+        ("temperature", "temperature"),
+        ("top_p", "topP"),
+        ("stop_sequences", "stopSequences"),
+    )
+
     def __init__(self, config: BedrockConfig) -> None:
         """
         Initialize the Bedrock provider.
@@ -39,28 +212,16 @@ class BedrockLLMProvider(BaseLLMProvider):
         """
         super().__init__(config.model_id)
 
-        # Build client configuration
-        client_kwargs = {"region_name": config.region}
-        if config.access_key_id and config.secret_access_key:
-            client_kwargs["aws_access_key_id"] = config.access_key_id
-            client_kwargs["aws_secret_access_key"] = config.secret_access_key
-
-        self.client = boto3.client("bedrock-runtime", **client_kwargs)
+        self.client = _bedrock_client(
+            config.region,
+            config.access_key_id,
+            config.secret_access_key,
+            config.timeout,
+            config.max_retries,
+        )
         self.model_id = config.model_id
         self.max_retries = config.max_retries
 
-    def _convert_prompt_to_messages(self, prompt: str) -> list:
-        """
-        Convert a simple prompt to the messages format required by the converse API.
-
-        Args:
-            prompt: The input prompt
-
-        Returns:
-            List of message dictionaries in converse API format
-        """
-        return [{"role": "user", "content": [{"text": prompt.strip()}]}]
-
     def _build_converse_params(
         self, prompt: str, model: str, **kwargs: Any  # noqa: ANN401
     ) -> dict[str, Any]:
@@ -75,24 +236,18 @@ class BedrockLLMProvider(BaseLLMProvider):
         Returns:
             Dictionary of parameters for the converse API
         """
-        # Convert prompt to messages format
-        messages = self._convert_prompt_to_messages(prompt)
-
         # Build inference config
-        inference_config = {}
-        if "max_tokens" in kwargs:
-            inference_config["maxTokens"] = kwargs.pop("max_tokens")
-        if "temperature" in kwargs:
-            inference_config["temperature"] = kwargs.pop("temperature")
-        if "top_p" in kwargs:
-            inference_config["topP"] = kwargs.pop("top_p")
-        if "stop_sequences" in kwargs:
-            inference_config["stopSequences"] = kwargs.pop("stop_sequences")
+        inference_config = {
+            bedrock_key: kwargs.pop(key)
+            for key, bedrock_key in self._INFERENCE_KEY_MAP
+            if key in kwargs
+        }
 
         # Build request parameters
         params = {
             "modelId": model,
-            "messages": messages,
+            # The prompt as a single user message in converse API format
+            "messages": [{"role": "user", "content": [{"text": prompt.strip()}]}],
             "inferenceConfig": inference_config,
         }
 
@@ -113,20 +268,13 @@ class BedrockLLMProvider(BaseLLMProvider):
         Returns:
             The extracted text content
         """
-        try:
-            output = response.get("output", {})
-            message = output.get("message", {})
-            content = message.get("content", [])
-
-            # Extract text from content blocks
-            text_parts = []
-            for item in content:
-                if isinstance(item, dict) and "text" in item:
-                    text_parts.append(item["text"])
-
-            return "\n".join(text_parts).strip()
-        except (KeyError, TypeError) as e:
-            raise LLMGenerationError(f"Failed to extract text from response: {e}")
+        # Malformed responses raise here and are reported by the caller
+        content = response.get("output", {}).get("message", {}).get("content", ())
+        return "\n".join(
+            item["text"]
+            for item in content
+            if isinstance(item, dict) and "text" in item
+        ).strip()
 
     @retry_on_failure(max_retries=3)
     @timing_decorator
@@ -156,7 +304,7 @@ class BedrockLLMProvider(BaseLLMProvider):
 
         try:
             # Use the converse API
-            response = await asyncio.to_thread(self.client.converse, **params)
+            response = await _run_blocking(self.client.converse, **params)
 
             # Extract text from response
             content = self._extract_text_from_response(response)
@@ -178,16 +326,26 @@ class BedrockLLMProvider(BaseLLMProvider):
             self.logger.error(f"Unexpected Bedrock error: {e}")
             raise LLMGenerationError(f"Unexpected error with Bedrock API: {e}") from e
 
-    @timing_decorator
-    async def stream_response(  # type: ignore[override,misc]
-        self, prompt: str, model: str | None = None, **kwargs: Any  # noqa: ANN401
+    async def stream_response(  # type: ignore[override]
+        self,
+        prompt: str,
+        model: str | None = None,
+        *,
+        stream_batch_chars: int = 64,
+        stream_batch_ms: float = 25,
+        **kwargs: Any,  # noqa: ANN401
     ) -> AsyncIterator[str]:
         """
         Stream text responses from Bedrock using the converse stream API.
 
+        Deltas are coalesced into batches to cut per-token overhead; pass
+        ``stream_batch_chars=1`` to receive every delta as it arrives.
+
         Args:
             prompt: The input prompt
             model: Optional model override
+            stream_batch_chars: Characters to accumulate before yielding
+            stream_batch_ms: Longest time a delta is held back, in milliseconds
             **kwargs: Additional Bedrock parameters
 
         Yields:
@@ -204,18 +362,29 @@ class BedrockLLMProvider(BaseLLMProvider):
 
         try:
             # Use the converse stream API
-            response = await asyncio.to_thread(self.client.converse_stream, **params)
+            response = await _run_blocking(self.client.converse_stream, **params)
 
             # Process the streaming response
             stream = response.get("stream", [])
-            for event in stream:
-                if self.CONTENT_BLOCK_DELTA in event:
-                    delta = event[self.CONTENT_BLOCK_DELTA].get("delta", {})
-                    if "text" in delta:
-                        yield delta["text"]
-                elif self.MESSAGE_STOP in event:
-                    # End of stream
-                    break
+
+            async def deltas() -> AsyncIterator[str]:
+                # Runs once per token: bind the event keys to locals and do a
+                # single lookup for the common delta case
+                content_block_delta = self.CONTENT_BLOCK_DELTA
+                message_stop = self.MESSAGE_STOP
+                async with aclosing(_iterate_in_thread(stream)) as events:
+                    async for event in events:
+                        block = event.get(content_block_delta)
+                        if block is not None:
+                            text = block.get("delta", {}).get("text")
+                            if text:
+                                yield text
+                        elif message_stop in event:
+                            # End of stream
+                            break
+
+            async for text in _batched(deltas(), stream_batch_chars, stream_batch_ms):
+                yield text
 
         except (BotoCoreError, ClientError) as e:
             self.logger.error(f"Bedrock streaming error with model {model_key}: {e}")
@@ -235,6 +404,8 @@ class BedrockLLMProvider(BaseLLMProvider):
         prompt: str,
         response_model: Type[T],
         model: str | None = None,
+        *,
+        trust_tool_output: bool = False,
         **kwargs: Any,  # noqa: ANN401
     ) -> T:
         """
@@ -244,6 +415,9 @@ class BedrockLLMProvider(BaseLLMProvider):
             prompt: The input prompt
             response_model: Pydantic model describing the expected JSON schema
             model: Optional model override
+            trust_tool_output: Build the result from the tool input without
+                validation. Only safe for flat models whose schema the model
+                reliably follows; nested models are left as plain dicts.
             **kwargs: Additional parameters
 
         Returns:
@@ -259,37 +433,30 @@ class BedrockLLMProvider(BaseLLMProvider):
         params = self._build_converse_params(prompt, model_key, **kwargs)
 
         # Add tool configuration for structured output using the model schema
-        tool_config = {
-            "tools": [
-                {
-                    "toolSpec": {
-                        "name": "json_extractor",
-                        "description": "Extracts structured data in JSON format",
-                        "inputSchema": {"json": response_model.model_json_schema()},
-                    }
-                }
-            ]
-        }
-        params["toolConfig"] = tool_config
+        params["toolConfig"] = _bedrock_tool_config(response_model)
 
         try:
             # Use the converse API with tools
-            response = await asyncio.to_thread(self.client.converse, **params)
-
-            # Extract structured data from tool use
-            output = response.get("output", {})
-            message = output.get("message", {})
-            content = message.get("content", [])
+            response = await _run_blocking(self.client.converse, **params)
 
+            # One pass over the content: the first tool call with input wins,
+            # text blocks are collected in case there is none
+            content = response.get("output", {}).get("message", {}).get("content", ())
+            text_parts: list[str] = []
             for item in content:
-                if isinstance(item, dict) and self.TOOL_USE in item:
-                    tool_use = item.get(self.TOOL_USE, {})
-                    tool_input = tool_use.get("input", {})
+                if not isinstance(item, dict):
+                    continue
+                if self.TOOL_USE in item:
+                    tool_input = item[self.TOOL_USE].get("input")
                     if tool_input:
+                        if trust_tool_output:
+                            return response_model.model_construct(**tool_input)
                         return response_model.model_validate(tool_input)
+                elif "text" in item:
+                    text_parts.append(item["text"])
 
-            # Fallback to regular text extraction and JSON parsing
-            text_content = self._extract_text_from_response(response)
+            # Fallback to JSON parsing of the text content
+            text_content = "\n".join(text_parts).strip()
             return parse_json_response(text_content, response_model)
 
         except (BotoCoreError, ClientError) as e:
@@ -1,21 +1,76 @@
 """LMStudio LLM provider implementation."""
 
+import re
 from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any, List, Type, TypeVar
 
 import httpx
-from openai import APIError, AsyncOpenAI, RateLimitError
+from openai import (
+    APIError,
+    AsyncOpenAI,
+    BadRequestError,
+    RateLimitError,
+    UnprocessableEntityError,
+)
 from pydantic import BaseModel
 
+from app.utils import fast_json
 from app.utils.performance import timing_decorator
 
 from ..config import LMStudioConfig
 from ..exceptions import LLMGenerationError, LLMProviderError, LLMRateLimitError
-from ..utils import retry_on_failure
-from .base import BaseLLMProvider
+from ..utils import json_schema_for, retry_on_failure
+from .base import BaseLLMProvider, _batched
 
 T = TypeVar("T", bound=BaseModel)
 
+# Plain JSON mode, for models that can't follow a schema
+_JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+
+@lru_cache(maxsize=256)
+def _json_schema_format(response_model: Type[BaseModel]) -> dict[str, Any]:
+    """
+    Build a ``json_schema`` response_format constraining output to a model.
+
+    The dict is shared by every request for the model and must not be
+    mutated.
+
+    Args:
+        response_model: Pydantic model for the expected response
+
+    Returns:
+        OpenAI-compatible response_format
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            # Names are limited to letters, digits, "_" and "-"
+            "name": re.sub(r"[^a-zA-Z0-9_-]", "_", response_model.__name__),
+            "schema": json_schema_for(response_model),
+            "strict": True,
+        },
+    }
+
+
+def _rejects_response_format(error: APIError) -> bool:
+    """
+    Check whether a 4xx error from the server is about the response_format.
+
+    Errors caused by the request itself, such as an overlong prompt, must not
+    be mistaken for an unsupported format.
+
+    Args:
+        error: Error raised by the OpenAI client
+
+    Returns:
+        True if the error refers to the response_format parameter
+    """
+    if error.param == "response_format":
+        return True
+    return "response_format" in error.message or "json_schema" in error.message
+
 
 class LMStudioLLMProvider(BaseLLMProvider):
     """
@@ -41,6 +96,20 @@ class LMStudioLLMProvider(BaseLLMProvider):
         )
         self.base_url = config.base_url
         self.max_retries = config.max_retries
+        # (model, response model) -> type of the response_format the server
+        # accepted for it, so later calls skip the negotiation
+        self._response_format_types: dict[tuple[str, type[BaseModel]], str] = {}
+        # Kept for the provider's lifetime so model listings reuse connections
+        self._http = httpx.AsyncClient(
+            base_url=config.base_url,
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+
+    async def aclose(self) -> None:
+        """Close the HTTP clients held by the provider."""
+        await self._http.aclose()
+        await self.client.close()
 
     async def get_available_models(self) -> List[str]:
         """
@@ -53,13 +122,12 @@ class LMStudioLLMProvider(BaseLLMProvider):
             LLMProviderError: If models endpoint fails
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{self.base_url}/models")
-                response.raise_for_status()
+            response = await self._http.get("/models")
+            response.raise_for_status()
 
-                data = response.json()
-                models = data.get("data", [])
-                return [model.get("id", "") for model in models if model.get("id")]
+            data = fast_json.loads(response.content)
+            models = data.get("data", [])
+            return [model.get("id", "") for model in models if model.get("id")]
 
         except httpx.HTTPError as e:
             self.logger.error(f"Failed to fetch LMStudio models: {e}")
@@ -129,8 +197,12 @@ class LMStudioLLMProvider(BaseLLMProvider):
         """
         Generate a structured response using LMStudio.
 
-        Note: Some local models may not support JSON mode, so we fall back to
-        the base implementation that uses prompt engineering.
+        Unless the caller passes a ``response_format``, schema-constrained
+        output is requested first, then plain JSON mode if the server rejects
+        it. Some local models support neither, so we finally fall back to the
+        base implementation that uses prompt engineering. The accepted format
+        is remembered per model and response model, so the negotiation
+        happens once. Errors that aren't about the format are re-raised.
 
         Args:
             prompt: The input prompt
@@ -148,21 +220,51 @@ class LMStudioLLMProvider(BaseLLMProvider):
         model_key = self._get_model(model)
         self._log_llm_call("get_structured_response", model_key, **kwargs)
 
-        try:
-            # Try JSON mode first (some local models support it)
-            if "response_format" not in kwargs:
-                kwargs["response_format"] = {"type": "json_object"}
-
-            response = await self.client.chat.completions.create(
-                model=model_key,
-                messages=[{"role": "user", "content": json_prompt}],
-                **kwargs,
-            )
-            content = response.choices[0].message.content
-            validated_content = self._validate_response(content or "")
+        if "response_format" in kwargs:
+            response_formats = [kwargs.pop("response_format")]
+            negotiable = False
+        else:
+            response_formats = [
+                _json_schema_format(response_model),
+                _JSON_OBJECT_FORMAT,
+            ]
+            negotiable = True
+            accepted = self._response_format_types.get((model_key, response_model))
+            if accepted is not None:
+                response_formats = [
+                    f for f in response_formats if f["type"] == accepted
+                ]
 
-            # Parse and validate the JSON response
-            return response_model.model_validate_json(validated_content)
+        try:
+            for response_format in response_formats:
+                try:
+                    response = await self.client.chat.completions.create(
+                        model=model_key,
+                        messages=[{"role": "user", "content": json_prompt}],
+                        response_format=response_format,
+                        **kwargs,
+                    )
+                except (BadRequestError, UnprocessableEntityError) as e:
+                    if not negotiable or not _rejects_response_format(e):
+                        raise
+                    # The server or model doesn't support this format
+                    self.logger.warning(
+                        "LMStudio rejected response_format %s for model %s: %s",
+                        response_format["type"],
+                        model_key,
+                        e,
+                    )
+                    continue
+
+                if negotiable:
+                    self._response_format_types[(model_key, response_model)] = (
+                        response_format["type"]
+                    )
+                content = response.choices[0].message.content
+                validated_content = self._validate_response(content or "")
+
+                # Parse and validate the JSON response
+                return response_model.model_validate_json(validated_content)
 
         except (RateLimitError, APIError):
             # Re-raise API errors without modification
@@ -171,8 +273,7 @@ class LMStudioLLMProvider(BaseLLMProvider):
             self.logger.warning(
                 f"JSON validation failed for LMStudio model {model_key}: {e}"
             )
-            # Remove response_format and try again with base implementation
-            kwargs.pop("response_format", None)
+            # Try again with base implementation
             return await super().get_structured_response(
                 prompt, response_model, model, **kwargs
             )
@@ -181,25 +282,35 @@ class LMStudioLLMProvider(BaseLLMProvider):
             self.logger.warning(
                 f"JSON mode failed for LMStudio model {model_key}, falling back to prompt engineering: {e}"
             )
-            # Remove response_format and try again with base implementation
-            kwargs.pop("response_format", None)
             return await super().get_structured_response(
                 prompt, response_model, model, **kwargs
             )
 
-    @timing_decorator
-    async def stream_response(  # type: ignore[override,misc]
+        # No response format was accepted; fall back to prompt engineering
+        return await super().get_structured_response(
+            prompt, response_model, model, **kwargs
+        )
+
+    async def stream_response(  # type: ignore[override]
         self,
         prompt: str,
         model: str | None = None,
+        *,
+        stream_batch_chars: int = 64,
+        stream_batch_ms: float = 25,
         **kwargs: Any,  # noqa: ANN401
     ) -> AsyncIterator[str]:
         """
         Stream text responses from LMStudio.
 
+        Deltas are coalesced into batches to cut per-token overhead; pass
+        ``stream_batch_chars=1`` to receive every delta as it arrives.
+
         Args:
             prompt: The input prompt
             model: Optional model override
+            stream_batch_chars: Characters to accumulate before yielding
+            stream_batch_ms: Longest time a delta is held back, in milliseconds
             **kwargs: Additional OpenAI-compatible parameters
 
         Yields:
@@ -218,9 +329,14 @@ class LMStudioLLMProvider(BaseLLMProvider):
                 stream=True,
                 **kwargs,
             )
-            async for chunk in stream:
-                if chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
+
+            async def deltas() -> AsyncIterator[str]:
+                async for chunk in stream:
+                    if chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+
+            async for text in _batched(deltas(), stream_batch_chars, stream_batch_ms):
+                yield text
 
         except (RateLimitError, APIError) as e:
             self.logger.error(f"LMStudio streaming error with model {model_key}: {e}")
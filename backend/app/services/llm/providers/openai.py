@@ -1,21 +1,95 @@
 """OpenAI LLM provider implementation."""
 
+import asyncio
+import weakref
+from collections import OrderedDict
 from collections.abc import AsyncIterator
-from typing import Any, Type, TypeVar
+from typing import Any, Optional, Type, TypeVar
 
-from openai import APIError, AsyncOpenAI, RateLimitError
+from openai import DEFAULT_MAX_RETRIES, APIError, AsyncOpenAI, RateLimitError
+from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from app.utils.performance import timing_decorator
 
 from ..config import OpenAIConfig
 from ..exceptions import LLMGenerationError, LLMRateLimitError
+from ..response_cache import (
+    LLMResponseCache,
+    SemanticCache,
+    get_llm_response_cache,
+    get_semantic_cache,
+)
 from ..utils import retry_on_failure
 from .base import BaseLLMProvider
 
 T = TypeVar("T", bound=BaseModel)
 
 
+# Shared clients per event loop, least recently used first. An httpx pool
+# belongs to the loop that first used it, so clients are never shared
+# across loops; a loop's clients are dropped along with the loop.
+_LoopClients = OrderedDict[tuple[Any, ...], AsyncOpenAI]
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopClients] = (
+    weakref.WeakKeyDictionary()
+)
+_MAX_CLIENTS_PER_LOOP = 32
+# Close() calls of evicted clients, referenced until they finish
+_closing: set[asyncio.Task[None]] = set()
+
+
+def _get_client(
+    api_key: str,
+    base_url: Optional[str] = None,
+    timeout: float = 60,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> AsyncOpenAI:
+    """
+    Get the shared OpenAI-compatible client for a set of connection settings.
+
+    Providers are created per model and settings change, and every
+    ``AsyncOpenAI`` owns an httpx connection pool; sharing one client per
+    configuration keeps connections (and their TLS sessions) alive across
+    providers. The SDK's default pool limits (100 keep-alive, 1000 total)
+    are kept. Clients are shared within the running event loop only; the
+    least recently used one is closed once a loop holds more than
+    ``_MAX_CLIENTS_PER_LOOP``. Outside a running loop a new, unshared
+    client is returned.
+
+    Args:
+        api_key: API key
+        base_url: API base URL, or None for api.openai.com
+        timeout: Request timeout in seconds
+        max_retries: Retries performed by the SDK itself
+
+    Returns:
+        Client instance
+    """
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return AsyncOpenAI(
+            api_key=api_key, base_url=base_url, timeout=timeout, max_retries=max_retries
+        )
+
+    clients = _clients.setdefault(loop, OrderedDict())
+    key = (api_key, base_url, timeout, max_retries)
+    client = clients.get(key)
+    if client is not None:
+        clients.move_to_end(key)
+        return client
+
+    client = clients[key] = AsyncOpenAI(
+        api_key=api_key, base_url=base_url, timeout=timeout, max_retries=max_retries
+    )
+    if len(clients) > _MAX_CLIENTS_PER_LOOP:
+        _, evicted = clients.popitem(last=False)
+        task = loop.create_task(evicted.close())
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+    return client
+
+
 class OpenAILLMProvider(BaseLLMProvider):
     """
     OpenAI implementation of the LLM service.
@@ -24,15 +98,30 @@ class OpenAILLMProvider(BaseLLMProvider):
     and better error handling with retry logic.
     """
 
-    def __init__(self, config: OpenAIConfig) -> None:
+    def __init__(
+        self,
+        config: OpenAIConfig,
+        cache: Optional[LLMResponseCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+    ) -> None:
         """
         Initialize the OpenAI provider.
 
         Args:
             config: OpenAI configuration
+            cache: Cache for deterministic (temperature=0) responses; defaults
+                to the global response cache
+            semantic_cache: Cache replaying deterministic structured responses
+                for similar prompts; defaults to the global semantic cache, if
+                one is configured
         """
         super().__init__(config.default_model)
-        self.client = AsyncOpenAI(api_key=config.api_key, timeout=config.timeout)
+        self.cache = cache if cache is not None else get_llm_response_cache()
+        self.semantic_cache = (
+            semantic_cache if semantic_cache is not None else get_semantic_cache()
+        )
+        self.client = _get_client(config.api_key, timeout=config.timeout)
+        self.base_url = str(self.client.base_url)
         self.max_retries = config.max_retries
 
     @retry_on_failure(max_retries=3)
@@ -61,14 +150,32 @@ class OpenAILLMProvider(BaseLLMProvider):
         model_key = self._get_model(model)
         self._log_llm_call("get_response", model_key, **kwargs)
 
-        try:
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "user", "content": prompt}
+        ]
+        cache_key = self.cache.key_for(
+            self._provider_name, self.base_url, model_key, messages, kwargs
+        )
+        if cache_key is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return self._validate_response(cached)
+
+        async def complete() -> str:
             response = await self.client.chat.completions.create(
                 model=model_key,
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 **kwargs,
             )
-            content = response.choices[0].message.content
-            return self._validate_response(content or "")
+            content = response.choices[0].message.content or ""
+            validated_content = self._validate_response(content)
+            if cache_key is not None:
+                await self.cache.set(cache_key, content)
+            return validated_content
+
+        try:
+            # Identical deterministic calls already running share one request
+            return await self._singleflight(cache_key, complete)
 
         except RateLimitError as e:
             self.logger.error(f"OpenAI rate limit exceeded with model {model_key}: {e}")
@@ -100,23 +207,55 @@ class OpenAILLMProvider(BaseLLMProvider):
         Raises:
             LLMGenerationError: If response generation fails
         """
-        # Use JSON mode for better structured responses
-        json_prompt = self._format_structured_prompt(prompt, response_model)
+        # Use JSON mode for better structured responses. The schema goes in a
+        # leading system message so calls for one model share a cacheable prefix
+        instructions = self._structured_instructions(response_model)
         model_key = self._get_model(model)
         self._log_llm_call("get_structured_response", model_key, **kwargs)
 
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "system", "content": instructions},
+            {"role": "user", "content": prompt},
+        ]
+        params = {"response_format": {"type": "json_object"}, **kwargs}
+        cache_key = self.cache.key_for(
+            self._provider_name, self.base_url, model_key, messages, params
+        )
+
         try:
+            cached = None if cache_key is None else await self.cache.get(cache_key)
+            if cached is not None:
+                return response_model.model_validate_json(
+                    self._validate_response(cached)
+                )
+
+            # Similar prompts only stand in for deterministic calls too
+            semantic_cache = self.semantic_cache if cache_key is not None else None
+            semantic_key = f"{model_key}|{response_model.__qualname__}"
+            embedding = None
+            if semantic_cache is not None:
+                embedding = await semantic_cache.embed(prompt)
+            if semantic_cache is not None and embedding is not None:
+                similar = await semantic_cache.lookup(semantic_key, embedding)
+                if similar is not None:
+                    try:
+                        return response_model.model_validate_json(similar)
+                    except ValueError:
+                        pass  # Doesn't fit this schema; ask the model
+
             response = await self.client.chat.completions.create(
-                model=model_key,
-                messages=[{"role": "user", "content": json_prompt}],
-                response_format={"type": "json_object"},
-                **kwargs,
+                model=model_key, messages=messages, **params
             )
-            content = response.choices[0].message.content
-            validated_content = self._validate_response(content or "")
+            content = response.choices[0].message.content or ""
+            validated_content = self._validate_response(content)
 
             # Parse and validate the JSON response
-            return response_model.model_validate_json(validated_content)
+            result = response_model.model_validate_json(validated_content)
+            if cache_key is not None:
+                await self.cache.set(cache_key, content)
+            if semantic_cache is not None and embedding is not None:
+                await semantic_cache.add(semantic_key, embedding, validated_content)
+            return result
 
         except (RateLimitError, APIError) as e:
             self.logger.error(
@@ -130,7 +269,6 @@ class OpenAILLMProvider(BaseLLMProvider):
             self.logger.error(f"Structured response parsing failed: {e}")
             raise LLMGenerationError(f"Failed to parse structured response: {e}") from e
 
-    @timing_decorator
     async def stream_response(  # type: ignore[override,misc]
         self,
         prompt: str,
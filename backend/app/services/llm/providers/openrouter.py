@@ -1,17 +1,20 @@
 """OpenRouter LLM provider implementation."""
 
 from collections.abc import AsyncIterator
-from typing import Any, Type, TypeVar
+from typing import Any, Optional, Type, TypeVar
 
-from openai import APIError, AsyncOpenAI, RateLimitError
+from openai import APIError, RateLimitError
+from openai.types.chat import ChatCompletionMessageParam
 from pydantic import BaseModel
 
 from app.utils.performance import timing_decorator
 
 from ..config import OpenRouterConfig
 from ..exceptions import LLMGenerationError, LLMRateLimitError
+from ..response_cache import LLMResponseCache, get_llm_response_cache
 from ..utils import retry_on_failure
 from .base import BaseLLMProvider
+from .openai import _get_client
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -19,20 +22,23 @@ T = TypeVar("T", bound=BaseModel)
 class OpenRouterLLMProvider(BaseLLMProvider):
     """OpenRouter implementation of the LLM service."""
 
-    def __init__(self, config: OpenRouterConfig) -> None:
+    def __init__(
+        self, config: OpenRouterConfig, cache: Optional[LLMResponseCache] = None
+    ) -> None:
         """
         Initialize the OpenRouter provider.
 
         Args:
             config: OpenRouter configuration
+            cache: Cache for deterministic (temperature=0) responses; defaults
+                to the global response cache
         """
         super().__init__(config.default_model)
-        self.client = AsyncOpenAI(
-            api_key=config.api_key,
-            base_url=config.base_url,
-            timeout=config.timeout,
-            max_retries=config.max_retries,
+        self.cache = cache if cache is not None else get_llm_response_cache()
+        self.client = _get_client(
+            config.api_key, config.base_url, config.timeout, config.max_retries
         )
+        self.base_url = str(self.client.base_url)
         self.max_retries = config.max_retries
 
     @retry_on_failure(max_retries=3)
@@ -61,14 +67,32 @@ class OpenRouterLLMProvider(BaseLLMProvider):
         model_key = self._get_model(model)
         self._log_llm_call("get_response", model_key, **kwargs)
 
-        try:
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "user", "content": prompt}
+        ]
+        cache_key = self.cache.key_for(
+            self._provider_name, self.base_url, model_key, messages, kwargs
+        )
+        if cache_key is not None:
+            cached = await self.cache.get(cache_key)
+            if cached is not None:
+                return self._validate_response(cached)
+
+        async def complete() -> str:
             response = await self.client.chat.completions.create(
                 model=model_key,
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 **kwargs,
             )
-            content = response.choices[0].message.content
-            return self._validate_response(content or "")
+            content = response.choices[0].message.content or ""
+            validated_content = self._validate_response(content)
+            if cache_key is not None:
+                await self.cache.set(cache_key, content)
+            return validated_content
+
+        try:
+            # Identical deterministic calls already running share one request
+            return await self._singleflight(cache_key, complete)
 
         except RateLimitError as e:
             self.logger.error(
@@ -102,23 +126,39 @@ class OpenRouterLLMProvider(BaseLLMProvider):
         Raises:
             LLMGenerationError: If response generation fails
         """
-        # Use JSON mode for better structured responses
-        json_prompt = self._format_structured_prompt(prompt, response_model)
+        # Use JSON mode for better structured responses. The schema goes in a
+        # leading system message so calls for one model share a cacheable prefix
+        instructions = self._structured_instructions(response_model)
         model_key = self._get_model(model)
         self._log_llm_call("get_structured_response", model_key, **kwargs)
 
+        messages: list[ChatCompletionMessageParam] = [
+            {"role": "system", "content": instructions},
+            {"role": "user", "content": prompt},
+        ]
+        params = {"response_format": {"type": "json_object"}, **kwargs}
+        cache_key = self.cache.key_for(
+            self._provider_name, self.base_url, model_key, messages, params
+        )
+
         try:
+            cached = None if cache_key is None else await self.cache.get(cache_key)
+            if cached is not None:
+                return response_model.model_validate_json(
+                    self._validate_response(cached)
+                )
+
             response = await self.client.chat.completions.create(
-                model=model_key,
-                messages=[{"role": "user", "content": json_prompt}],
-                response_format={"type": "json_object"},
-                **kwargs,
+                model=model_key, messages=messages, **params
             )
-            content = response.choices[0].message.content
-            validated_content = self._validate_response(content or "")
+            content = response.choices[0].message.content or ""
+            validated_content = self._validate_response(content)
 
             # Parse and validate the JSON response
-            return response_model.model_validate_json(validated_content)
+            result = response_model.model_validate_json(validated_content)
+            if cache_key is not None:
+                await self.cache.set(cache_key, content)
+            return result
 
         except (RateLimitError, APIError) as e:
             self.logger.error(
@@ -132,7 +172,6 @@ class OpenRouterLLMProvider(BaseLLMProvider):
             self.logger.error(f"Structured response parsing failed: {e}")
             raise LLMGenerationError(f"Failed to parse structured response: {e}") from e
 
-    @timing_decorator
     async def stream_response(  # type: ignore[override,misc]
         self, prompt: str, model: str | None = None, **kwargs: Any  # noqa: ANN401
     ) -> AsyncIterator[str]:
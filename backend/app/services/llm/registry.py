@@ -1,17 +1,12 @@
 """LLM provider registry and management."""
 
 import logging
-from typing import Any, Callable, Type
+from typing import Any, Callable, Type, cast
 
+from . import providers
 from .config import LLMConfig
 from .exceptions import LLMConfigurationError
 from .protocol import LLMService
-from .providers import (
-    BedrockLLMProvider,
-    LMStudioLLMProvider,
-    OpenAILLMProvider,
-    OpenRouterLLMProvider,
-)
 from .providers.base import BaseLLMProvider
 
 logger = logging.getLogger(__name__)
@@ -29,25 +24,37 @@ class LLMProviderRegistry:
         # Registry of provider name to provider class
         self._providers: dict[str, Type[BaseLLMProvider]] = {}
 
+        # Built-in providers not imported yet: name -> class name in .providers
+        self._lazy_providers: dict[str, str] = {}
+
         # Mapping of provider names to their configuration attribute getter
         self._provider_configs: dict[str, Callable[[LLMConfig], Any]] = {}
 
+        # Provider name -> function building that provider from an LLMConfig,
+        # resolved on first use so create_provider does a single lookup
+        self._factories: dict[str, Callable[[LLMConfig], LLMService]] = {}
+
         # Register default providers
         self._register_default_providers()
 
     def _register_default_providers(self) -> None:
-        """Register the default built-in LLM providers."""
-        self.register_provider(
-            "openai", OpenAILLMProvider, lambda config: config.openai
-        )
-        self.register_provider(
-            "openrouter", OpenRouterLLMProvider, lambda config: config.openrouter
-        )
-        self.register_provider(
-            "bedrock", BedrockLLMProvider, lambda config: config.bedrock
+        """
+        Register the default built-in LLM providers.
+
+        Their classes are only imported when first requested, so a process
+        using one provider never loads the others' SDKs.
+        """
+        self._lazy_providers.update(
+            openai="OpenAILLMProvider",
+            openrouter="OpenRouterLLMProvider",
+            bedrock="BedrockLLMProvider",
+            lmstudio="LMStudioLLMProvider",
         )
-        self.register_provider(
-            "lmstudio", LMStudioLLMProvider, lambda config: config.lmstudio
+        self._provider_configs.update(
+            openai=lambda config: config.openai,
+            openrouter=lambda config: config.openrouter,
+            bedrock=lambda config: config.bedrock,
+            lmstudio=lambda config: config.lmstudio,
         )
 
     def register_provider(
@@ -65,6 +72,8 @@ class LLMProviderRegistry:
             config_getter: Function to extract provider config from LLMConfig
         """
         self._providers[name] = provider_class
+        self._lazy_providers.pop(name, None)
+        self._factories.pop(name, None)
         if config_getter:
             self._provider_configs[name] = config_getter
         logger.info(f"Registered LLM provider: {name}")
@@ -82,12 +91,21 @@ class LLMProviderRegistry:
         Raises:
             LLMConfigurationError: If provider is not registered
         """
-        if name not in self._providers:
-            available = list(self._providers.keys())
+        provider_class = self._providers.get(name)
+        if provider_class is not None:
+            return provider_class
+
+        class_name = self._lazy_providers.get(name)
+        if class_name is None:
+            available = self.list_providers()
             raise LLMConfigurationError(
                 f"Unsupported LLM provider: {name}. Available: {available}"
             )
-        return self._providers[name]
+        # Imports the provider module on first use
+        provider_class = cast(Type[BaseLLMProvider], getattr(providers, class_name))
+        self._providers[name] = provider_class
+        del self._lazy_providers[name]
+        return provider_class
 
     def get_config_getter(self, name: str) -> Callable[[LLMConfig], Any]:
         """
@@ -109,6 +127,30 @@ class LLMProviderRegistry:
             )
         return config_getter
 
+    def _build_factory(self, name: str) -> Callable[[LLMConfig], LLMService]:
+        """
+        Bind a provider's class and configuration getter into one function.
+
+        Args:
+            name: Provider name
+
+        Returns:
+            Function creating the provider from an LLMConfig
+
+        Raises:
+            LLMConfigurationError: If the provider or its config getter is unknown
+        """
+        provider_class = self.get_provider_class(name)
+        config_getter = self.get_config_getter(name)
+
+        def factory(config: LLMConfig) -> LLMService:
+            provider_config = config_getter(config)
+            if provider_config is None:
+                raise LLMConfigurationError(f"{name.title()} configuration is missing")
+            return provider_class(provider_config)
+
+        return factory
+
     def create_provider(self, name: str, config: LLMConfig) -> LLMService:
         """
         Create a provider instance with the given configuration.
@@ -124,17 +166,13 @@ class LLMProviderRegistry:
             LLMConfigurationError: If provider creation fails
         """
         provider_name = name.lower()
-        provider_class = self.get_provider_class(provider_name)
-        config_getter = self.get_config_getter(provider_name)
+        factory = self._factories.get(provider_name)
+        if factory is None:
+            factory = self._build_factory(provider_name)
+            self._factories[provider_name] = factory
 
         try:
-            provider_config = config_getter(config)
-            if provider_config is None:
-                raise LLMConfigurationError(
-                    f"{provider_name.title()} configuration is missing"
-                )
-
-            return provider_class(provider_config)
+            return factory(config)
 
         except TypeError as e:
             logger.error(
@@ -165,7 +203,7 @@ class LLMProviderRegistry:
         Returns:
             List of provider names
         """
-        return list(self._providers.keys())
+        return [*self._lazy_providers, *self._providers]
 
 
 # Global registry instance
@@ -0,0 +1,470 @@
+"""Exact-match cache for deterministic LLM completions."""
+
+import asyncio
+import hashlib
+import logging
+import math
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Callable, Mapping, Sequence
+from functools import cache
+from time import monotonic
+from typing import TYPE_CHECKING, Any, Optional, Protocol
+
+import orjson
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "CacheBackend",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "LLMResponseCache",
+    "SemanticCache",
+    "configure_semantic_cache",
+    "get_llm_response_cache",
+    "get_semantic_cache",
+]
+
+# Turns a prompt into an embedding vector, e.g. SentenceTransformer.encode
+EmbeddingFunction = Callable[[str], Sequence[float]]
+
+
+class CacheBackend(Protocol):
+    """Storage used by LLMResponseCache."""
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the value stored under key, or None on a miss."""
+        ...
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Store value under key, expiring after ttl seconds if given."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove key if present."""
+        ...
+
+
+class InMemoryCacheBackend:
+    """In-process LRU backend with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        """
+        Initialize the in-memory backend.
+
+        Args:
+            max_entries: Maximum number of entries kept before evicting the
+                least recently used one
+        """
+        self.max_entries = max_entries
+        # key -> (value, time.monotonic() deadline or None)
+        self._entries: OrderedDict[str, tuple[str, Optional[float]]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Return a live entry and mark it as recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        Store an entry, evicting the least recently used one when full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until the entry expires, or None to keep it until evicted
+        """
+        expires_at = monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove an entry if present.
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+
+class RedisCacheBackend:
+    """Backend storing entries in Redis, shared across worker processes."""
+
+    def __init__(self, client: "Redis", prefix: str = "llm:response:") -> None:
+        """
+        Initialize the Redis backend.
+
+        Args:
+            client: ``redis.asyncio`` client
+            prefix: Prefix added to every key
+        """
+        self.client = client
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Return the value stored under key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value, or None on a miss
+        """
+        value = await self.client.get(self.prefix + key)
+        if value is None:
+            return None
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    async def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl: Seconds until the entry expires, or None for no expiry
+        """
+        expire_ms = int(ttl * 1000) if ttl is not None else None
+        await self.client.set(self.prefix + key, value, px=expire_ms)
+
+    async def delete(self, key: str) -> None:
+        """
+        Remove key if present.
+
+        Args:
+            key: Cache key
+        """
+        await self.client.delete(self.prefix + key)
+
+
+class LLMResponseCache:
+    """
+    Exact-match cache of raw completion text for deterministic calls.
+
+    Only calls made with ``temperature=0`` are cached; any other sampling
+    setting can legitimately return a different answer each time. Entries
+    hold the raw completion, so callers still validate (and parse) a hit.
+    Backend failures are logged and treated as misses.
+    """
+
+    def __init__(
+        self, backend: Optional[CacheBackend] = None, ttl: Optional[float] = 3600.0
+    ) -> None:
+        """
+        Initialize the response cache.
+
+        Args:
+            backend: Storage backend (defaults to an in-process LRU)
+            ttl: Seconds a cached completion stays valid, or None for no expiry
+        """
+        self.backend: CacheBackend = backend or InMemoryCacheBackend()
+        self.ttl = ttl
+
+    def key_for(
+        self,
+        provider: str,
+        base_url: str,
+        model: str,
+        messages: Sequence[Mapping[str, Any]],
+        params: Mapping[str, Any],
+    ) -> Optional[str]:
+        """
+        Build the cache key for a call, if the call is cacheable.
+
+        Args:
+            provider: Provider name
+            base_url: API endpoint the call goes to, so providers pointed at
+                different servers don't share entries
+            model: Resolved model name
+            messages: Chat messages sent to the model
+            params: Remaining request parameters (temperature, response_format...)
+
+        Returns:
+            Hex SHA-256 of the request, or None if the call isn't deterministic
+            or its parameters can't be serialized to JSON
+        """
+        if params.get("temperature") != 0:
+            return None
+        try:
+            payload = orjson.dumps(
+                {
+                    "provider": provider,
+                    "base_url": base_url,
+                    "model": model,
+                    "messages": messages,
+                    "params": params,
+                },
+                option=orjson.OPT_SORT_KEYS,
+            )
+        except TypeError as e:
+            # A repr() isn't a reliable identity for arbitrary objects
+            logger.debug(f"Not caching LLM call with unserializable params: {e}")
+            return None
+        return hashlib.sha256(payload).hexdigest()
+
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached completion.
+
+        Args:
+            key: Key from ``key_for``
+
+        Returns:
+            Raw completion text, or None on a miss
+        """
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"LLM response cache read failed: {e}")
+            return None
+
+    async def set(self, key: str, content: str) -> None:
+        """
+        Store a completion under key for ``ttl`` seconds.
+
+        Args:
+            key: Key from ``key_for``
+            content: Raw completion text
+        """
+        try:
+            await self.backend.set(key, content, ttl=self.ttl)
+        except Exception as e:
+            logger.warning(f"LLM response cache write failed: {e}")
+
+
+class _Cluster:
+    """Prompts whose embeddings are close to a shared centroid."""
+
+    __slots__ = ("total", "entries")
+
+    def __init__(self, dimensions: int) -> None:
+        # Sum of the member vectors; its direction is the centroid
+        self.total = [0.0] * dimensions
+        self.entries: deque[tuple[list[float], str]] = deque()
+
+    def similarity(self, vector: list[float]) -> float:
+        """Cosine similarity between the centroid and a normalized vector."""
+        norm = math.sqrt(_dot(self.total, self.total))
+        return _dot(self.total, vector) / norm if norm else -1.0
+
+    def add(self, vector: list[float], content: str, max_entries: int) -> None:
+        """Add an entry, dropping the oldest one once the cluster is full."""
+        self.entries.append((vector, content))
+        self.total = [t + v for t, v in zip(self.total, vector)]
+        if len(self.entries) > max_entries:
+            old_vector, _ = self.entries.popleft()
+            self.total = [t - v for t, v in zip(self.total, old_vector)]
+
+
+class SemanticCache:
+    """
+    Approximate cache of structured responses, matched by prompt similarity.
+
+    Prompts are embedded by a caller-supplied function (for example a local
+    SentenceTransformer's ``encode``) and grouped into clusters per namespace.
+    A lookup compares the prompt against each cluster centroid, then only
+    against the entries of the closest cluster, instead of every entry.
+    Embedding and the similarity math run in worker threads, off the event
+    loop, and any failure is logged and treated as a miss.
+    A hit is a different prompt's answer, so callers must validate it and
+    fall back to a real call when it doesn't fit.
+    """
+
+    def __init__(
+        self,
+        embed: EmbeddingFunction,
+        threshold: float = 0.92,
+        cluster_threshold: float = 0.8,
+        max_clusters: int = 256,
+        max_cluster_entries: int = 64,
+    ) -> None:
+        """
+        Initialize the semantic cache.
+
+        Args:
+            embed: Function returning the embedding of a prompt
+            threshold: Minimum cosine similarity for a hit
+            cluster_threshold: Minimum centroid similarity to join a cluster
+                instead of starting a new one
+            max_clusters: Clusters kept per namespace; the oldest is dropped
+            max_cluster_entries: Entries kept per cluster; the oldest is dropped
+        """
+        self._embed = embed
+        self.threshold = threshold
+        self.cluster_threshold = cluster_threshold
+        self.max_clusters = max_clusters
+        self.max_cluster_entries = max_cluster_entries
+        self._clusters: dict[str, list[_Cluster]] = {}
+        # Lookups and adds run in worker threads
+        self._lock = threading.Lock()
+
+    async def embed(self, text: str) -> Optional[list[float]]:
+        """
+        Embed text and L2-normalize the result.
+
+        Args:
+            text: Prompt to embed
+
+        Returns:
+            Unit-length embedding vector, or None if embedding failed
+        """
+        try:
+            return await asyncio.to_thread(self._embed_normalized, text)
+        except Exception as e:
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None
+
+    async def lookup(
+        self, namespace: str, vector: list[float], threshold: Optional[float] = None
+    ) -> Optional[str]:
+        """
+        Find the stored response whose prompt is most similar to vector.
+
+        Args:
+            namespace: Partition to search, e.g. provider, model and schema
+            vector: Normalized prompt embedding from ``embed``
+            threshold: Minimum similarity for a hit (defaults to ``threshold``)
+
+        Returns:
+            Stored response content, or None if nothing is similar enough
+        """
+        try:
+            return await asyncio.to_thread(self._lookup, namespace, vector, threshold)
+        except Exception as e:
+            logger.warning(f"Semantic cache lookup failed: {e}")
+            return None
+
+    async def add(self, namespace: str, vector: list[float], content: str) -> None:
+        """
+        Store a validated response under a prompt embedding.
+
+        Args:
+            namespace: Partition to store in
+            vector: Normalized prompt embedding from ``embed``
+            content: Response content to replay on a hit
+        """
+        try:
+            await asyncio.to_thread(self._add, namespace, vector, content)
+        except Exception as e:
+            logger.warning(f"Semantic cache write failed: {e}")
+
+    def _embed_normalized(self, text: str) -> list[float]:
+        """Embed text and scale the vector to unit length."""
+        vector = [float(x) for x in self._embed(text)]
+        norm = math.sqrt(_dot(vector, vector))
+        return [x / norm for x in vector] if norm else vector
+
+    def _lookup(
+        self, namespace: str, vector: list[float], threshold: Optional[float]
+    ) -> Optional[str]:
+        """Search the nearest cluster for the most similar entry."""
+        with self._lock:
+            cluster = self._nearest_cluster(namespace, vector)[0]
+            if cluster is None:
+                return None
+            entries = list(cluster.entries)
+        min_similarity = self.threshold if threshold is None else threshold
+        best_similarity, best_content = min_similarity, None
+        for entry_vector, content in entries:
+            similarity = _dot(entry_vector, vector)
+            if similarity >= best_similarity:
+                best_similarity, best_content = similarity, content
+        return best_content
+
+    def _add(self, namespace: str, vector: list[float], content: str) -> None:
+        """Add an entry to the nearest cluster, or start a new one."""
+        with self._lock:
+            cluster, similarity = self._nearest_cluster(namespace, vector)
+            if cluster is None or similarity < self.cluster_threshold:
+                clusters = self._clusters.setdefault(namespace, [])
+                cluster = _Cluster(len(vector))
+                clusters.append(cluster)
+                if len(clusters) > self.max_clusters:
+                    clusters.pop(0)
+            cluster.add(vector, content, self.max_cluster_entries)
+
+    def _nearest_cluster(
+        self, namespace: str, vector: list[float]
+    ) -> tuple[Optional[_Cluster], float]:
+        """Return the cluster whose centroid is closest to vector."""
+        nearest, best = None, -1.0
+        for cluster in self._clusters.get(namespace, ()):
+            similarity = cluster.similarity(vector)
+            if similarity > best:
+                nearest, best = cluster, similarity
+        return nearest, best
+
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    """Dot product of two equal-length vectors."""
+    return math.fsum(x * y for x, y in zip(a, b))
+
+
+@cache
+def get_llm_response_cache() -> LLMResponseCache:
+    """
+    Get the global LLM response cache instance.
+
+    Returns:
+        LLM response cache instance
+    """
+    return LLMResponseCache()
+
+
+# Set by configure_semantic_cache; semantic caching is off until then
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def configure_semantic_cache(
+    embed: Optional[EmbeddingFunction], **options: Any  # noqa: ANN401
+) -> Optional[SemanticCache]:
+    """
+    Enable or disable the global semantic cache.
+
+    Call this at startup, before LLM services are created; providers built
+    afterwards use the cache for deterministic structured responses.
+
+    Args:
+        embed: Function returning the embedding of a prompt, or None to
+            disable semantic caching
+        **options: Tuning options passed to ``SemanticCache``
+
+    Returns:
+        The new global semantic cache, or None if it was disabled
+    """
+    global _semantic_cache
+    _semantic_cache = None if embed is None else SemanticCache(embed, **options)
+    return _semantic_cache
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """
+    Get the global semantic cache instance.
+
+    Returns:
+        Semantic cache, or None if ``configure_semantic_cache`` wasn't called
+    """
+    return _semantic_cache
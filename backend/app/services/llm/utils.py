@@ -4,7 +4,11 @@ import asyncio
 import functools
 import json
 import logging
-from typing import Any, Callable, Type, TypeVar
+import random
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional, Type, TypeVar
 
 from pydantic import BaseModel, ValidationError
 
@@ -14,6 +18,25 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# First non-whitespace character of a response, found without copying it
+_FIRST_NON_SPACE = re.compile(r"\S")
+
+
+@functools.lru_cache(maxsize=256)
+def json_schema_for(response_model: Type[BaseModel]) -> dict[str, Any]:
+    """
+    Get the JSON schema of a response model, generated once per class.
+
+    The returned dict is shared between callers and must not be mutated.
+
+    Args:
+        response_model: Pydantic model class
+
+    Returns:
+        The model's JSON schema
+    """
+    return response_model.model_json_schema()
+
 
 def parse_json_response(content: str, response_model: Type[T]) -> T:
     """
@@ -30,8 +53,9 @@ def parse_json_response(content: str, response_model: Type[T]) -> T:
         LLMValidationError: If parsing or validation fails
     """
     try:
-        # Try to parse as JSON first
-        if content.strip().startswith("{") or content.strip().startswith("["):
+        # Try to parse as JSON first; pydantic skips surrounding whitespace
+        first_char = _FIRST_NON_SPACE.search(content)
+        if first_char is not None and first_char.group() in "{[":
             return response_model.model_validate_json(content)
         else:
             # If not JSON, try to extract JSON from the content
@@ -51,93 +75,201 @@ def parse_json_response(content: str, response_model: Type[T]) -> T:
         ) from e
 
 
-def _is_retryable_error(exception: Exception) -> bool:
+def _check_api_error(exception: Exception) -> bool:
+    """Retry OpenAI API errors on 5xx/429 statuses and connection timeouts."""
+    # Retry on server errors (5xx) and rate limits, but not client errors (4xx)
+    # Try to get status code from various possible locations
+    status_code = getattr(exception, "status_code", None)
+    if status_code is None:
+        # Try to get from response attribute if it exists
+        response = getattr(exception, "response", None)
+        if response is not None:
+            status_code = getattr(response, "status_code", None)
+
+    if status_code is not None:
+        # Retry on server errors (500-599) and rate limit (429)
+        if status_code >= 500 or status_code == 429:
+            return True
+
+    # Also check for timeout-related errors in the message
+    error_msg = str(exception).lower()
+    return any(
+        keyword in error_msg for keyword in ["timeout", "timed out", "connection"]
+    )
+
+
+# Bedrock error codes worth retrying: throttling and server errors
+_RETRYABLE_CLIENT_ERROR_CODES = frozenset(
+    {
+        "ThrottlingException",
+        "ServiceUnavailableException",
+        "InternalServerException",
+        "TooManyRequestsException",
+        "RequestTimeoutException",
+    }
+)
+
+
+def _check_client_error(exception: Exception) -> bool:
+    """Retry AWS client errors on throttling and server error codes."""
+    error = getattr(exception, "response", {}).get("Error", {})
+    return error.get("Code", "") in _RETRYABLE_CLIENT_ERROR_CODES
+
+
+def _check_botocore_error(exception: Exception) -> bool:
+    """Retry botocore errors caused by connection and timeout problems."""
+    error_msg = str(exception).lower()
+    return any(keyword in error_msg for keyword in ["timeout", "connection", "network"])
+
+
+def _always_retry(exception: Exception) -> bool:
+    """Retry unconditionally."""
+    return True
+
+
+@functools.cache
+def _retry_handlers() -> dict[type, Callable[[Exception], bool]]:
     """
-    Determine if an exception represents a transient error that should be retried.
+    Map exception classes to the check deciding whether to retry them.
 
-    Args:
-        exception: The exception to check
+    Built on first use rather than at import so the SDKs (and boto3 in
+    particular) are only imported by processes that call an LLM. An SDK
+    that isn't installed simply contributes no entries.
 
     Returns:
-        True if the error is transient and should be retried, False otherwise
+        Exception class to retry check
     """
-    # Import here to avoid circular imports
+    handlers: dict[type, Callable[[Exception], bool]] = {
+        # Always retry on our custom rate limit error
+        LLMRateLimitError: _always_retry,
+        # Standard Python exceptions that might be transient; this covers
+        # asyncio.TimeoutError, TimeoutError and ConnectionError
+        OSError: _always_retry,
+    }
     try:
-        from botocore.exceptions import BotoCoreError, ClientError
         from openai import APIError
         from openai import RateLimitError as OpenAIRateLimitError
+
+        handlers[OpenAIRateLimitError] = _always_retry
+        handlers[APIError] = _check_api_error
     except ImportError:
-        # If imports fail, be conservative and don't retry
-        return False
-
-    # Always retry on our custom rate limit error
-    if isinstance(exception, LLMRateLimitError):
-        return True
-
-    # OpenAI specific errors
-    if isinstance(exception, OpenAIRateLimitError):
-        return True
-
-    if isinstance(exception, APIError):
-        # Retry on server errors (5xx) and rate limits, but not client errors (4xx)
-        # Try to get status code from various possible locations
-        status_code = getattr(exception, "status_code", None)
-        if status_code is None:
-            # Try to get from response attribute if it exists
-            response = getattr(exception, "response", None)
-            if response is not None:
-                status_code = getattr(response, "status_code", None)
-
-        if status_code is not None:
-            # Retry on server errors (500-599) and rate limit (429)
-            if status_code >= 500 or status_code == 429:
-                return True
-
-        # Also check for timeout-related errors in the message
-        error_msg = str(exception).lower()
-        if any(
-            keyword in error_msg for keyword in ["timeout", "timed out", "connection"]
-        ):
-            return True
-        return False
-
-    # Bedrock/AWS specific errors
-    if isinstance(exception, ClientError):
-        error_code = exception.response.get("Error", {}).get("Code", "")
-        # Retry on throttling and server errors, but not on client errors
-        retryable_codes = {
-            "ThrottlingException",
-            "ServiceUnavailableException",
-            "InternalServerException",
-            "TooManyRequestsException",
-            "RequestTimeoutException",
-        }
-        if error_code in retryable_codes:
-            return True
-        return False
-
-    if isinstance(exception, BotoCoreError):
-        # Retry on connection and timeout errors
-        error_msg = str(exception).lower()
-        if any(
-            keyword in error_msg for keyword in ["timeout", "connection", "network"]
-        ):
-            return True
-        return False
+        pass
+    try:
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        handlers[ClientError] = _check_client_error
+        handlers[BotoCoreError] = _check_botocore_error
+    except ImportError:
+        pass
+    return handlers
+
 
-    # Standard Python exceptions that might be transient
-    if isinstance(exception, (asyncio.TimeoutError, TimeoutError)):
-        return True
+# Exception class -> its retry check (or None), filled in by _retry_handler
+_handler_by_type: dict[type, Optional[Callable[[Exception], bool]]] = {}
 
-    if isinstance(exception, (ConnectionError, OSError)):
-        return True
 
+def _retry_handler(exception_type: type) -> Optional[Callable[[Exception], bool]]:
+    """
+    Find the retry check for an exception class.
+
+    The class's MRO is walked once per class, so the most specific
+    registered base wins (e.g. OpenAI's RateLimitError before its APIError
+    base), and the result is memoized in ``_handler_by_type``.
+
+    Args:
+        exception_type: Class of the raised exception
+
+    Returns:
+        The retry check, or None if the class is never retried
+    """
+    if exception_type in _handler_by_type:
+        return _handler_by_type[exception_type]
+    handlers = _retry_handlers()
+    handler = next(
+        (handlers[cls] for cls in exception_type.__mro__ if cls in handlers), None
+    )
+    _handler_by_type[exception_type] = handler
+    return handler
+
+
+def _is_retryable_error(exception: Exception) -> bool:
+    """
+    Determine if an exception represents a transient error that should be retried.
+
+    Args:
+        exception: The exception to check
+
+    Returns:
+        True if the error is transient and should be retried, False otherwise
+    """
+    handler = _retry_handler(type(exception))
     # Don't retry on other exceptions (validation errors, access denied, etc.)
-    return False
+    return handler is not None and handler(exception)
+
+
+def _retry_after_seconds(exception: BaseException) -> Optional[float]:
+    """
+    Get the wait a rate-limited API asked for, if the error carries one.
+
+    Providers re-raise SDK errors as ``LLM*Error ... from e``, so the cause
+    chain is followed to the error holding the HTTP response.
+
+    Args:
+        exception: The exception raised by the wrapped call
+
+    Returns:
+        Seconds to wait, or None if no usable ``retry-after`` header was sent
+    """
+    current: Optional[BaseException] = exception
+    for _ in range(5):  # Cause chains are short; don't follow cycles
+        if current is None:
+            return None
+        headers = getattr(getattr(current, "response", None), "headers", None)
+        if headers is not None:
+            return _parse_retry_after(
+                headers.get("retry-after-ms"), headers.get("retry-after")
+            )
+        current = current.__cause__
+    return None
+
+
+def _parse_retry_after(
+    retry_after_ms: Optional[str], retry_after: Optional[str]
+) -> Optional[float]:
+    """
+    Parse ``retry-after-ms`` or ``retry-after`` (seconds or an HTTP date).
+
+    Args:
+        retry_after_ms: Value of the ``retry-after-ms`` header
+        retry_after: Value of the ``retry-after`` header
+
+    Returns:
+        Seconds to wait, or None if neither header is usable
+    """
+    for value, scale in ((retry_after_ms, 1000), (retry_after, 1)):
+        if value is not None:
+            try:
+                return max(float(value) / scale, 0.0)
+            except ValueError:
+                pass
+    if retry_after is None:
+        return None
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        # "-0000" and obsolete zones parse as naive; RFC 5322 treats them as UTC
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
 
 
 def retry_on_failure(
-    max_retries: int = 3, delay: float = 1.0, backoff: float = 2.0
+    max_retries: int = 3,
+    delay: float = 1.0,
+    backoff: float = 2.0,
+    jitter: float = 1.0,
+    max_retry_after: float = 60.0,
 ) -> Callable[[Callable], Callable]:
     """
     Decorator to retry async functions on transient failures with exponential backoff.
@@ -145,10 +277,17 @@ def retry_on_failure(
     Only retries on transient errors like timeouts, rate limits, and temporary network issues.
     Does not retry on permanent errors like validation errors, access denied, etc.
 
+    Each wait adds a random ``[0, jitter)`` seconds, so callers that failed
+    together (e.g. on a throttling burst) don't all retry at the same moment.
+    When the API sends a ``retry-after`` header (as OpenAI does on 429s), that
+    wait replaces the backoff delay.
+
     Args:
         max_retries: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
         backoff: Multiplier for delay on each retry
+        jitter: Upper bound of the random delay added to each wait, in seconds
+        max_retry_after: Longest ``retry-after`` wait honored, in seconds
     """
 
     def decorator(func: Callable) -> Callable:
@@ -184,11 +323,18 @@ def retry_on_failure(
                         raise e
 
                     if attempt < max_retries:
+                        retry_after = _retry_after_seconds(e)
+                        wait = (
+                            current_delay
+                            if retry_after is None
+                            else min(retry_after, max_retry_after)
+                        )
+                        wait += random.uniform(0, jitter)
                         logger.warning(
                             f"Retryable error in {func.__name__} (attempt {attempt + 1}): {e}. "
-                            f"Retrying in {current_delay}s..."
+                            f"Retrying in {wait:.2f}s..."
                         )
-                        await asyncio.sleep(current_delay)
+                        await asyncio.sleep(wait)
                         current_delay *= backoff
                     else:
                         logger.error(
@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import Settings, get_settings
 from app.core.logging import get_logger
 from app.models.llm_settings import LLMSettings
-from app.repositories.llm_settings import LLMSettingsRepository
+from app.repositories.llm_settings import llm_settings_repository
 from app.schemas.llm_settings import (
     LLMSettingsCreateSchema,
     LLMSettingsSchema,
@@ -28,13 +28,21 @@ class LLMSettingsService:
     def __init__(self, settings: Optional[Settings] = None) -> None:
         """Initialize LLM settings service with optional settings override."""
         self.settings = settings or get_settings()
-        self.llm_settings_repo = LLMSettingsRepository()
+        self.llm_settings_repo = llm_settings_repository
         self._provider_model_mapping = {
             "openai": ("openai_model", self.settings.DEFAULT_LLM_MODEL),
             "openrouter": ("openrouter_model", self.settings.OPENROUTER_MODEL),
             "bedrock": ("bedrock_model", self.settings.BEDROCK_MODEL),
             "lmstudio": ("lmstudio_model", self.settings.LMSTUDIO_MODEL),
         }
+        # Created on first use and reused, so model listings keep connections
+        self._lmstudio_provider: Optional[LMStudioLLMProvider] = None
+
+    async def aclose(self) -> None:
+        """Close the LMStudio provider used for model listings, if any."""
+        if self._lmstudio_provider is not None:
+            await self._lmstudio_provider.aclose()
+            self._lmstudio_provider = None
 
     async def get_settings(self, db: AsyncSession) -> LLMSettingsSchema:
         """
@@ -64,7 +72,7 @@ class LLMSettingsService:
                 "LLM settings retrieved successfully",
                 extra={"provider": settings.provider},
             )
-            return LLMSettingsSchema.model_validate(settings)
+            return LLMSettingsSchema.from_orm_fast(settings)
 
         except SQLAlchemyError as e:
             logger.error(
@@ -334,12 +342,15 @@ class LLMSettingsService:
         logger.info("Fetching available LMStudio models")
 
         try:
-            lmstudio_config = LMStudioConfig(
-                base_url=self.settings.LMSTUDIO_BASE_URL,
-                default_model=self.settings.LMSTUDIO_MODEL,
-            )
+            provider = self._lmstudio_provider
+            if provider is None:
+                lmstudio_config = LMStudioConfig(
+                    base_url=self.settings.LMSTUDIO_BASE_URL,
+                    default_model=self.settings.LMSTUDIO_MODEL,
+                )
+                provider = LMStudioLLMProvider(lmstudio_config)
+                self._lmstudio_provider = provider
 
-            provider = LMStudioLLMProvider(lmstudio_config)
             models = await provider.get_available_models()
 
             if not models:
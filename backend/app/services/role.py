@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
 from app.models.role import Role
-from app.repositories.role import RoleRepository
+from app.repositories.role import role_repository
 from app.utils.error_handling import with_database_error_handling
 
 logger = get_logger(__name__)
@@ -17,7 +17,7 @@ class RoleService:
 
     def __init__(self) -> None:
         """Initialize role service."""
-        self.role_repo = RoleRepository()
+        self.role_repo = role_repository
 
     @with_database_error_handling("get role by name")
     async def get_role_by_name(self, db: AsyncSession, name: str) -> Optional[Role]:
@@ -1,11 +1,14 @@
+import asyncio
+import secrets
 from datetime import datetime, timezone
 from typing import List, Optional
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
-from app.repositories.role import RoleRepository
-from app.repositories.user import UserRepository
+from app.repositories.role import role_repository
+from app.repositories.user import user_repository
 from app.schemas.user import UserCreate
 from app.security.auth import get_password_hash, verify_password
 from app.utils.error_handling import with_database_error_handling
@@ -25,10 +28,8 @@ async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
     Raises:
         ValueError: If user with email already exists
     """
-    from sqlalchemy.exc import IntegrityError
-
-    # Create user
-    hashed_password = get_password_hash(user_create.password)
+    # Create user (bcrypt runs in a worker thread to keep the event loop free)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_create.password)
     user = User(
         email=user_create.email,
         hashed_password=hashed_password,
@@ -37,12 +38,9 @@ async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
         updated_at=datetime.now(timezone.utc),
     )
 
-    user_repo = UserRepository()
-    role_repo = RoleRepository()
-
     try:
         # Get default role
-        default_role = await role_repo.get_by_name(db, "user")
+        default_role = await role_repository.get_by_name(db, "user")
         if not default_role:
             raise ValueError("Default 'user' role not found")
 
@@ -50,7 +48,7 @@ async def create_user(db: AsyncSession, user_create: UserCreate) -> User:
         user.role_id = default_role.id
 
         # Create user
-        created_user = await user_repo.create(db, user)
+        created_user = await user_repository.create(db, user)
         return created_user
 
     except IntegrityError as e:
@@ -84,12 +82,10 @@ async def create_oauth_user(
     Raises:
         ValueError: If user with email already exists
     """
-    import secrets
-
-    from sqlalchemy.exc import IntegrityError
-
     # Generate a secure random hash
-    secure_random_hash = get_password_hash(secrets.token_urlsafe(64))
+    secure_random_hash = await asyncio.to_thread(
+        get_password_hash, secrets.token_urlsafe(64)
+    )
 
     user = User(
         email=email,
@@ -99,12 +95,9 @@ async def create_oauth_user(
         updated_at=datetime.now(timezone.utc),
     )
 
-    user_repo = UserRepository()
-    role_repo = RoleRepository()
-
     try:
         # Get default role
-        default_role = await role_repo.get_by_name(db, "user")
+        default_role = await role_repository.get_by_name(db, "user")
         if not default_role:
             raise ValueError("Default 'user' role not found")
 
@@ -112,7 +105,7 @@ async def create_oauth_user(
         user.role_id = default_role.id
 
         # Create user
-        created_user = await user_repo.create(db, user)
+        created_user = await user_repository.create(db, user)
         return created_user
 
     except IntegrityError as e:
@@ -137,8 +130,7 @@ async def get_user_by_email(db: AsyncSession, email: str) -> Optional[User]:
     Returns:
         User if found, None otherwise
     """
-    user_repo = UserRepository()
-    return await user_repo.get_by_email(db, email)
+    return await user_repository.get_by_email(db, email)
 
 
 async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
@@ -152,8 +144,7 @@ async def get_user_by_id(db: AsyncSession, user_id: int) -> Optional[User]:
     Returns:
         User if found, None otherwise
     """
-    user_repo = UserRepository()
-    return await user_repo.get_by_id(db, user_id)
+    return await user_repository.get_by_id(db, user_id)
 
 
 async def authenticate_user(
@@ -182,7 +173,7 @@ async def authenticate_user(
     if user.auth_provider != "email":
         return None
 
-    if not verify_password(password, user.hashed_password):
+    if not await asyncio.to_thread(verify_password, password, user.hashed_password):
         return None
 
     return user
@@ -200,8 +191,7 @@ async def get_user_by_email_with_role(db: AsyncSession, email: str) -> Optional[
     Returns:
         User with role if found, None otherwise
     """
-    user_repo = UserRepository()
-    return await user_repo.get_by_email_with_role(db, email)
+    return await user_repository.get_by_email_with_role(db, email)
 
 
 @with_database_error_handling("assign user role")
@@ -222,16 +212,14 @@ async def assign_user_role(
     Raises:
         ValueError: If role not found
     """
-    user_repo = UserRepository()
-    role_repo = RoleRepository()
 
     # Get role by name
-    role = await role_repo.get_by_name(db, role_name)
+    role = await role_repository.get_by_name(db, role_name)
     if not role or role.id is None:
         raise ValueError(f"Role '{role_name}' not found")
 
     # Update user role
-    return await user_repo.update_user_role(db, user_id, role.id)
+    return await user_repository.update_user_role(db, user_id, role.id)
 
 
 @with_database_error_handling("get users with roles")
@@ -249,8 +237,7 @@ async def get_users_with_roles(
     Returns:
         List of users with roles
     """
-    user_repo = UserRepository()
-    return await user_repo.get_users_with_roles(db, limit, offset)
+    return await user_repository.get_users_with_roles(db, limit, offset)
 
 
 @with_database_error_handling("search users by email")
@@ -268,8 +255,7 @@ async def search_users_by_email(
     Returns:
         List of users matching the email pattern
     """
-    user_repo = UserRepository()
-    return await user_repo.search_users_by_email(db, email_pattern, limit)
+    return await user_repository.search_users_by_email(db, email_pattern, limit)
 
 
 @with_database_error_handling("count total users")
@@ -283,8 +269,7 @@ async def count_total_users(db: AsyncSession) -> int:
     Returns:
         Total number of users
     """
-    user_repo = UserRepository()
-    return await user_repo.count_total_users(db)
+    return await user_repository.count_total_users(db)
 
 
 @with_database_error_handling("count users by email")
@@ -299,8 +284,7 @@ async def count_users_by_email(db: AsyncSession, email_pattern: str) -> int:
     Returns:
         Number of users matching the email pattern
     """
-    user_repo = UserRepository()
-    return await user_repo.count_users_by_email(db, email_pattern)
+    return await user_repository.count_users_by_email(db, email_pattern)
 
 
 @with_database_error_handling("disable user")
@@ -315,8 +299,7 @@ async def disable_user(db: AsyncSession, user_id: int) -> Optional[User]:
     Returns:
         Updated user if successful, None if user not found
     """
-    user_repo = UserRepository()
-    return await user_repo.soft_delete_user(db, user_id)
+    return await user_repository.soft_delete_user(db, user_id)
 
 
 @with_database_error_handling("enable user")
@@ -331,8 +314,7 @@ async def enable_user(db: AsyncSession, user_id: int) -> Optional[User]:
     Returns:
         Updated user if successful, None if user not found
     """
-    user_repo = UserRepository()
-    return await user_repo.activate_user(db, user_id)
+    return await user_repository.activate_user(db, user_id)
 
 
 @with_database_error_handling("delete user")
@@ -350,12 +332,11 @@ async def delete_user(db: AsyncSession, user_id: int) -> bool:
     Raises:
         ValueError: If attempting to delete own account
     """
-    user_repo = UserRepository()
 
     # Get user to check if exists
-    user = await user_repo.get_by_id(db, user_id)
+    user = await user_repository.get_by_id(db, user_id)
     if not user:
         return False
 
     # Hard delete the user
-    return await user_repo.hard_delete_user(db, user_id)
+    return await user_repository.hard_delete_user(db, user_id)
@@ -152,10 +152,8 @@ class TestAdminEndpoints:
         # Create proper User model instance
         mock_user = create_mock_user(MockUserData.get_default_user())
 
-        with patch("app.repositories.user.UserRepository") as mock_repo_class:
-            mock_repo = Mock()
+        with patch("app.api.v1.endpoints.admin.user_repository") as mock_repo:
             mock_repo.get_by_id_with_role = AsyncMock(return_value=mock_user)
-            mock_repo_class.return_value = mock_repo
 
             response = admin_authenticated_client.get("/api/v1/admin/users/1")
             assert response.status_code == 200
@@ -168,10 +166,8 @@ class TestAdminEndpoints:
 
     def test_get_user_not_found(self, admin_authenticated_client: TestClient):
         """Test user retrieval when user doesn't exist."""
-        with patch("app.repositories.user.UserRepository") as mock_repo_class:
-            mock_repo = Mock()
+        with patch("app.api.v1.endpoints.admin.user_repository") as mock_repo:
             mock_repo.get_by_id_with_role = AsyncMock(return_value=None)
-            mock_repo_class.return_value = mock_repo
 
             response = admin_authenticated_client.get("/api/v1/admin/users/999")
             assert response.status_code == 404
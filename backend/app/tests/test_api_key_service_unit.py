@@ -6,7 +6,7 @@ Tests the updated API key service with RSA-based token creation.
 
 import os
 from datetime import datetime, timedelta, timezone
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import uuid4
 
 import pytest
@@ -15,9 +15,11 @@ from fastapi import HTTPException
 from app.models.api_key import ApiKey
 from app.models.user import User
 from app.services.api_key import (
+    LastUsedFlusher,
     create_api_key_simple,
     get_api_key_by_id,
     get_api_key_by_jti,
+    record_api_key_last_used,
     revoke_api_key_simple,
     update_api_key_last_used,
     verify_api_key_by_hash,
@@ -296,10 +298,11 @@ class TestApiKeyService:
 
         # Use new mock database session
         async for db_mock in create_mock_db_session():
-            # Mock get_api_key_by_jti
-            with patch("app.services.api_key.get_api_key_by_jti") as mock_get_jti:
-                mock_get_jti.return_value = api_key
-
+            with patch(
+                "app.services.api_key.api_key_repository.get_by_token_hash",
+                new_callable=AsyncMock,
+                return_value=api_key,
+            ):
                 result = await verify_api_key_by_hash(db_mock, token_hash, jti)
 
                 assert result == api_key
@@ -326,10 +329,11 @@ class TestApiKeyService:
 
         # Use new mock database session
         async for db_mock in create_mock_db_session():
-            # Mock get_api_key_by_jti
-            with patch("app.services.api_key.get_api_key_by_jti") as mock_get_jti:
-                mock_get_jti.return_value = api_key
-
+            with patch(
+                "app.services.api_key.api_key_repository.get_by_token_hash",
+                new_callable=AsyncMock,
+                return_value=None,
+            ):
                 result = await verify_api_key_by_hash(db_mock, wrong_hash, jti)
 
                 assert result is None
@@ -355,14 +359,42 @@ class TestApiKeyService:
 
         # Use new mock database session
         async for db_mock in create_mock_db_session():
-            # Mock get_api_key_by_jti
-            with patch("app.services.api_key.get_api_key_by_jti") as mock_get_jti:
-                mock_get_jti.return_value = api_key
-
+            with patch(
+                "app.services.api_key.api_key_repository.get_by_token_hash",
+                new_callable=AsyncMock,
+                return_value=api_key,
+            ):
                 result = await verify_api_key_by_hash(db_mock, token_hash, jti)
 
                 assert result is None
 
+    @pytest.mark.asyncio
+    async def test_verify_api_key_by_hash_jti_mismatch_is_cached(self):
+        """Test a rejected hash/JTI pair is not looked up again."""
+        token_hash = "test_hash"
+
+        api_key = ApiKey(
+            id=1,
+            user_id=1,
+            jti=str(uuid4()),
+            token_hash=token_hash,
+            scopes=["*"],
+            created_at=datetime.now(timezone.utc),
+        )
+
+        async for db_mock in create_mock_db_session():
+            with patch(
+                "app.services.api_key.api_key_repository.get_by_token_hash",
+                new_callable=AsyncMock,
+                return_value=api_key,
+            ) as mock_get_hash:
+                jti = str(uuid4())
+
+                for _ in range(2):
+                    result = await verify_api_key_by_hash(db_mock, token_hash, jti)
+                    assert result is None
+                mock_get_hash.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_update_api_key_last_used_success(self):
         """Test successful API key last used update."""
@@ -435,6 +467,83 @@ class TestApiKeyService:
 
             db_mock.rollback.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_last_used_flusher_batches_pending_updates(self):
+        """Test the flusher writes the latest timestamp per key in one batch."""
+        first = datetime.now(timezone.utc) - timedelta(seconds=10)
+        latest = datetime.now(timezone.utc)
+
+        async for db_mock in create_mock_db_session():
+            session_cm = MagicMock()
+            session_cm.__aenter__ = AsyncMock(return_value=db_mock)
+            session_cm.__aexit__ = AsyncMock(return_value=None)
+
+            flusher = LastUsedFlusher()
+            flusher._session_factory = Mock(return_value=session_cm)
+
+            await flusher.record(1, first)
+            await flusher.record(2, first)
+            await flusher.record(1, latest)
+
+            with patch(
+                "app.services.api_key.api_key_repository.bulk_update_last_used",
+                new_callable=AsyncMock,
+            ) as mock_bulk_update:
+                assert await flusher.flush() == 2
+                assert await flusher.flush() == 0
+
+                mock_bulk_update.assert_called_once_with(db_mock, {1: latest, 2: first})
+
+    @pytest.mark.asyncio
+    async def test_last_used_flusher_requeues_failed_batch(self):
+        """Test a failed flush keeps its timestamps for the next attempt."""
+        from sqlalchemy.exc import SQLAlchemyError
+
+        used_at = datetime.now(timezone.utc)
+
+        async for db_mock in create_mock_db_session():
+            session_cm = MagicMock()
+            session_cm.__aenter__ = AsyncMock(return_value=db_mock)
+            session_cm.__aexit__ = AsyncMock(return_value=None)
+
+            flusher = LastUsedFlusher()
+            flusher._session_factory = Mock(return_value=session_cm)
+            await flusher.record(1, used_at)
+
+            with patch(
+                "app.services.api_key.api_key_repository.bulk_update_last_used",
+                new_callable=AsyncMock,
+                side_effect=[SQLAlchemyError("Database error"), None],
+            ) as mock_bulk_update:
+                assert await flusher.flush() == 0
+                assert await flusher.flush() == 1
+
+                mock_bulk_update.assert_called_with(db_mock, {1: used_at})
+
+    @pytest.mark.asyncio
+    async def test_record_api_key_last_used_throttled(self):
+        """Test recently used keys are not queued again."""
+        api_key = ApiKey(
+            id=1,
+            user_id=1,
+            jti=str(uuid4()),
+            token_hash="test_hash",
+            scopes=["*"],
+            created_at=datetime.now(timezone.utc),
+            last_used_at=datetime.now(timezone.utc) - timedelta(minutes=5),
+        )
+
+        with patch(
+            "app.services.api_key.last_used_flusher.record", new_callable=AsyncMock
+        ) as mock_record:
+            await record_api_key_last_used(api_key, throttle_minutes=10)
+            mock_record.assert_not_called()
+
+            api_key.last_used_at = None
+            await record_api_key_last_used(api_key)
+            mock_record.assert_called_once()
+            assert mock_record.call_args.args[0] == 1
+
     @pytest.fixture
     def service(self):
         """Create ApiKeyService instance for testing."""
@@ -457,39 +566,31 @@ class TestApiKeyService:
         """Test key limit validation when under limit."""
         db = AsyncMock()
 
-        # Mock keys - create 5 active keys (under limit of 20)
-        mock_keys = []
-        for i in range(5):
-            key = Mock()
-            key.is_active = True
-            mock_keys.append(key)
+        # 5 active keys (under limit of 20)
+        with patch.object(
+            service.api_key_repo, "count_active_by_user_id", new_callable=AsyncMock
+        ) as mock_count:
+            mock_count.return_value = 5
 
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = mock_keys
-        db.execute.return_value = mock_result
+            # Should not raise exception
+            await service.validate_user_key_limit(db, mock_user.id)
 
-        # Should not raise exception
-        await service.validate_user_key_limit(db, mock_user.id)
+            mock_count.assert_called_once_with(db, mock_user.id)
 
     @pytest.mark.asyncio
     async def test_validate_user_key_limit_at_limit(self, service, mock_user):
         """Test key limit validation when at limit."""
         db = AsyncMock()
 
-        # Mock keys - create 20 active keys (at limit)
-        mock_keys = []
-        for i in range(20):
-            key = Mock()
-            key.is_active = True
-            mock_keys.append(key)
-
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = mock_keys
-        db.execute.return_value = mock_result
+        # 20 active keys (at limit)
+        with patch.object(
+            service.api_key_repo, "count_active_by_user_id", new_callable=AsyncMock
+        ) as mock_count:
+            mock_count.return_value = 20
 
-        # Should raise exception
-        with pytest.raises(HTTPException) as exc_info:
-            await service.validate_user_key_limit(db, mock_user.id)
+            # Should raise exception
+            with pytest.raises(HTTPException) as exc_info:
+                await service.validate_user_key_limit(db, mock_user.id)
 
         assert exc_info.value.status_code == 400
         assert "Maximum number of active API keys (20) reached" in exc_info.value.detail
@@ -499,37 +600,30 @@ class TestApiKeyService:
         """Test key limit validation with mix of active and inactive keys."""
         db = AsyncMock()
 
-        # Mock keys - 15 active, 10 inactive (total 25, but only 15 active)
-        mock_keys = []
-        for i in range(15):
-            key = Mock()
-            key.is_active = True
-            mock_keys.append(key)
-        for i in range(10):
-            key = Mock()
-            key.is_active = False
-            mock_keys.append(key)
-
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = mock_keys
-        db.execute.return_value = mock_result
+        # 15 active, 10 inactive: the repository only counts the active ones
+        with patch.object(
+            service.api_key_repo, "count_active_by_user_id", new_callable=AsyncMock
+        ) as mock_count:
+            mock_count.return_value = 15
 
-        # Should not raise exception (only 15 active keys)
-        await service.validate_user_key_limit(db, mock_user.id)
+            # Should not raise exception (only 15 active keys)
+            await service.validate_user_key_limit(db, mock_user.id)
 
     @pytest.mark.asyncio
     async def test_create_api_key_success(self, service, mock_user):
         """Test successful API key creation with limit validation."""
         db = AsyncMock()
 
-        # Mock key limit validation (under limit)
-        mock_keys = [Mock(is_active=True) for _ in range(5)]  # 5 active keys
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = mock_keys
-        db.execute.return_value = mock_result
-
-        # Mock create_api_key_simple
-        with patch("app.services.api_key.create_api_key_simple") as mock_create:
+        # Mock key limit validation (under limit) and create_api_key_simple
+        with (
+            patch.object(
+                service.api_key_repo,
+                "count_active_by_user_id",
+                new_callable=AsyncMock,
+                return_value=5,
+            ),
+            patch("app.services.api_key.create_api_key_simple") as mock_create,
+        ):
             mock_key = Mock()
             mock_token = "test-token"
             mock_create.return_value = (mock_key, mock_token)
@@ -558,13 +652,14 @@ class TestApiKeyService:
         db = AsyncMock()
 
         # Mock key limit validation (at limit)
-        mock_keys = [Mock(is_active=True) for _ in range(20)]  # 20 active keys
-        mock_result = Mock()
-        mock_result.scalars.return_value.all.return_value = mock_keys
-        db.execute.return_value = mock_result
-
-        with pytest.raises(HTTPException) as exc_info:
-            await service.create_api_key(db, mock_user, "Test Key", 30)
+        with patch.object(
+            service.api_key_repo,
+            "count_active_by_user_id",
+            new_callable=AsyncMock,
+            return_value=20,
+        ):
+            with pytest.raises(HTTPException) as exc_info:
+                await service.create_api_key(db, mock_user, "Test Key", 30)
 
         assert exc_info.value.status_code == 400
         assert "Maximum number of active API keys (20) reached" in exc_info.value.detail
@@ -631,6 +726,40 @@ class TestApiKeyService:
             assert exc_info.value.status_code == 404
             assert "API key not found" in exc_info.value.detail
 
+    @pytest.mark.asyncio
+    async def test_verify_keys_ownership_success(self, service, mock_user):
+        """Test batch ownership verification returns keys keyed by ID."""
+        db = AsyncMock()
+
+        key_one = Mock(id=1, user_id=mock_user.id)
+        key_two = Mock(id=2, user_id=mock_user.id)
+
+        with patch.object(
+            service.api_key_repo, "get_by_user_id_and_key_ids", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = {1: key_one, 2: key_two}
+
+            result = await service.verify_keys_ownership(db, [1, 2, 2], mock_user.id)
+
+            assert result == {1: key_one, 2: key_two}
+            mock_get.assert_called_once_with(db, mock_user.id, [1, 2, 2])
+
+    @pytest.mark.asyncio
+    async def test_verify_keys_ownership_missing_key(self, service, mock_user):
+        """Test batch ownership verification fails if any key is not owned."""
+        db = AsyncMock()
+
+        with patch.object(
+            service.api_key_repo, "get_by_user_id_and_key_ids", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = {1: Mock(id=1, user_id=mock_user.id)}
+
+            with pytest.raises(HTTPException) as exc_info:
+                await service.verify_keys_ownership(db, [1, 2], mock_user.id)
+
+            assert exc_info.value.status_code == 404
+            assert "API key not found" in exc_info.value.detail
+
     @pytest.mark.asyncio
     async def test_revoke_user_key_success(self, service, mock_user):
         """Test successful key revocation."""
@@ -392,6 +392,25 @@ class TestTasksAPI:
         data = response.json()
         assert "not found" in data["detail"].lower()
 
+    @patch("app.api.v1.endpoints.tasks.AsyncResult")
+    def test_get_task_result_non_dict_result(
+        self, mock_async_result, authenticated_client: TestClient
+    ):
+        """Test a task result that isn't a dict is reported as invalid."""
+        mock_result = Mock()
+        mock_result.status = "SUCCESS"
+        mock_result.successful.return_value = True
+        mock_result.failed.return_value = False
+        mock_result.result = ["not", "a", "dict"]
+        mock_result.date_done = None
+
+        mock_async_result.return_value = mock_result
+
+        response = authenticated_client.get("/api/v1/tasks/test-task-id")
+
+        assert response.status_code == 404
+        assert "invalid" in response.json()["detail"].lower()
+
     @patch("app.api.v1.endpoints.tasks.AsyncResult")
     def test_get_task_result_invalid_task_id(
         self, mock_async_result, authenticated_client: TestClient
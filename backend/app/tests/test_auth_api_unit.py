@@ -195,3 +195,38 @@ async def test_refresh_token_generates_csrf_token():
             secure=False,  # development environment
             samesite="lax",
         )
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_lost_rotation_race_is_unauthorized():
+    """Test a token rotated by a concurrent refresh returns 401, not 500."""
+    from app.api.v1.endpoints.auth import refresh_access_token
+    from app.models.refresh_token import RefreshToken
+    from app.models.user import User
+
+    mock_user = MagicMock(spec=User)
+    mock_user.is_active = True
+    mock_refresh_token = MagicMock(spec=RefreshToken)
+    mock_refresh_token.user = mock_user
+    mock_refresh_token.is_revoked = False
+    mock_refresh_token.is_expired = False
+    mock_response = MagicMock()
+
+    with (
+        patch(
+            "app.api.v1.endpoints.auth.get_refresh_token",
+            return_value=mock_refresh_token,
+        ),
+        # The other request revoked the token between the read and the rotate
+        patch("app.api.v1.endpoints.auth.rotate_refresh_token", return_value=None),
+        patch("app.api.v1.endpoints.auth.clear_auth_cookies") as mock_clear_cookies,
+    ):
+        with pytest.raises(HTTPException) as exc_info:
+            await refresh_access_token(
+                response=mock_response,
+                refresh_token="old_refresh_token",
+                db=AsyncMock(),
+            )
+
+    assert exc_info.value.status_code == 401
+    mock_clear_cookies.assert_called_once_with(mock_response)
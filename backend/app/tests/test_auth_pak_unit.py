@@ -12,8 +12,12 @@ from uuid import uuid4
 import pytest
 
 from app.models.api_key import ApiKey
-from app.security.auth_pak import decode_access_token_enhanced, is_pak_token
-from app.utils.jwt_pak import create_api_key_token
+from app.security.auth_pak import (
+    decode_access_token_enhanced,
+    invalidate_pak_cache,
+    is_pak_token,
+)
+from app.utils.jwt_pak import create_api_key_token, verify_api_jwt
 from app.utils.rsa_keys import clear_key_cache
 
 
@@ -21,12 +25,14 @@ class TestAuthPAK:
     """Test PAK authentication functions."""
 
     def setup_method(self):
-        """Clear key cache before each test."""
+        """Clear key and verification caches before each test."""
         clear_key_cache()
+        invalidate_pak_cache()
 
     def teardown_method(self):
-        """Clear key cache after each test."""
+        """Clear key and verification caches after each test."""
         clear_key_cache()
+        invalidate_pak_cache()
 
     @patch.dict(os.environ, {"ENVIRONMENT": "test"})
     def test_create_api_key_token_success(self):
@@ -136,7 +142,7 @@ class TestAuthPAK:
                     mock_verify.return_value = api_key
 
                     with patch(
-                        "app.security.auth_pak.update_api_key_last_used"
+                        "app.security.auth_pak.record_api_key_last_used"
                     ) as mock_update:
                         mock_update.return_value = None
 
@@ -144,7 +150,59 @@ class TestAuthPAK:
 
                         assert result == (subject, True)
                         mock_verify.assert_called_once()
-                        mock_update.assert_called_once_with(db_mock, api_key)
+                        mock_update.assert_called_once_with(api_key)
+
+    @patch.dict(os.environ, {"ENVIRONMENT": "test"})
+    @pytest.mark.asyncio
+    async def test_decode_access_token_enhanced_pak_token_cached(self):
+        """Test repeat PAK decoding is served from cache until invalidated."""
+        from app.tests.mocks import create_mock_db_session
+
+        subject = "test@example.com"
+        jti = str(uuid4())
+        token = create_api_key_token(subject, jti, ["*"])
+        api_key = ApiKey(
+            id=1,
+            user_id=1,
+            jti=jti,
+            token_hash="test_hash",
+            scopes=["*"],
+            created_at=datetime.now(timezone.utc),
+        )
+
+        async for db_mock in create_mock_db_session():
+            with (
+                patch(
+                    "app.security.auth_pak.verify_api_key_by_hash",
+                    return_value=api_key,
+                ) as mock_verify,
+                patch("app.security.auth_pak.record_api_key_last_used"),
+                patch(
+                    "app.security.auth_pak.verify_api_jwt",
+                    wraps=verify_api_jwt,
+                ) as mock_verify_jwt,
+            ):
+                assert await decode_access_token_enhanced(token, db_mock) == (
+                    subject,
+                    True,
+                )
+                assert await decode_access_token_enhanced(token, db_mock) == (
+                    subject,
+                    True,
+                )
+                assert await is_pak_token(token) is True
+
+                mock_verify.assert_called_once()
+                mock_verify_jwt.assert_called_once()
+
+                # Revocation evicts the cached verification
+                invalidate_pak_cache(jti)
+                mock_verify.return_value = None
+
+                assert await decode_access_token_enhanced(token, db_mock) == (
+                    None,
+                    False,
+                )
 
     @patch.dict(os.environ, {"ENVIRONMENT": "test"})
     @pytest.mark.asyncio
@@ -234,6 +292,26 @@ class TestAuthPAK:
 
         assert result is False
 
+    @patch.dict(os.environ, {"ENVIRONMENT": "test"})
+    def test_token_algorithm_matches_header(self):
+        """Test prefix-based routing agrees with parsing the header."""
+        from jose import jwt
+
+        from app.security.auth import create_access_token
+        from app.security.auth_pak import _token_algorithm
+
+        tokens = [
+            create_access_token({"sub": "test@example.com"}),
+            create_api_key_token("test@example.com", str(uuid4()), ["*"]),
+            # Header layout without a known prefix falls back to parsing
+            jwt.encode({"sub": "x"}, "secret", headers={"kid": "k1"}),
+            jwt.encode({"sub": "x"}, "secret", algorithm="HS384"),
+        ]
+
+        for token in tokens:
+            expected = jwt.get_unverified_header(token)["alg"]
+            assert _token_algorithm(token) == expected
+
     @patch.dict(os.environ, {"ENVIRONMENT": "test"})
     @pytest.mark.asyncio
     async def test_is_pak_token_session_token(self):
@@ -4,16 +4,19 @@ Unit tests for authentication security utilities and user service.
 These tests cover:
 - Password hashing and verification
 - JWT access token creation and decoding (including expiration handling)
+- Refresh token rotation
 - Authentication cookie helpers
 - CSRF token generation
 - User service create_user functionality
 """
 
 from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import Response
 
+from app.models.user import User
 from app.schemas.user import UserCreate
 from app.security import auth as auth_utils
 from app.services.user import create_user
@@ -62,6 +65,70 @@ def test_access_token_expired_token_returns_none():
     assert decoded is None
 
 
+def test_access_token_decoding_with_orjson_parser():
+    """Tokens should round-trip after python-jose is switched to orjson."""
+    from jose import jws, jwt
+
+    from app.utils.fast_json import install_jose_json
+
+    install_jose_json()
+    token = auth_utils.create_access_token({"sub": "orjson@example.com"})
+    auth_utils.invalidate_access_token(token)
+
+    assert auth_utils.decode_access_token(token) == "orjson@example.com"
+    assert jwt.get_unverified_header(token)["alg"] == "HS256"
+    assert jws.json is jwt.json
+
+
+# ---------------------------------------------------------------------------
+# Refresh tokens
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_token_single_transaction():
+    """Rotation revokes with one UPDATE and commits the replacement once."""
+    db = AsyncMock()
+    db.add = MagicMock()
+    db.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=1))
+    user = User(id=1, email="user@example.com", hashed_password="x")
+
+    new_token = await auth_utils.rotate_refresh_token(db, "old-token", user)
+
+    assert new_token is not None and new_token != "old-token"
+    db.execute.assert_awaited_once()
+    added = db.add.call_args.args[0]
+    assert added.token == new_token and added.user_id == 1
+    db.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_rotate_refresh_token_already_revoked():
+    """A token that was not revoked by the UPDATE is not replaced."""
+    db = AsyncMock()
+    db.add = MagicMock()
+    db.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=None))
+    user = User(id=1, email="user@example.com", hashed_password="x")
+
+    assert await auth_utils.rotate_refresh_token(db, "old-token", user) is None
+    db.add.assert_not_called()
+    db.commit.assert_not_awaited()
+    db.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_refresh_token_skips_reload():
+    """A new refresh token is inserted with one commit and no refresh SELECT."""
+    db = AsyncMock()
+    db.add = MagicMock()
+
+    token = await auth_utils.create_refresh_token(db, 1)
+
+    assert db.add.call_args.args[0].token == token
+    db.commit.assert_awaited_once()
+    db.refresh.assert_not_awaited()
+
+
 # ---------------------------------------------------------------------------
 # Cookie helpers
 # ---------------------------------------------------------------------------
@@ -93,6 +160,20 @@ def test_create_and_clear_auth_cookies():
     )
 
 
+def test_clear_auth_cookies_clears_every_cookie():
+    """Logout should expire the access, CSRF and refresh cookies."""
+    response = Response()
+    auth_utils.clear_auth_cookies(response)
+    headers = response.headers.getlist("set-cookie")
+
+    assert [header.split("=", 1)[0] for header in headers] == [
+        "access_token",
+        "csrf_token",
+        "refresh_token",
+    ]
+    assert all("Max-Age=0" in header for header in headers)
+
+
 # ---------------------------------------------------------------------------
 # CSRF helpers
 # ---------------------------------------------------------------------------
@@ -108,6 +189,29 @@ def test_csrf_token_generation_is_random():
     assert len(t2) >= 10
 
 
+def test_validate_csrf_token():
+    """Matching tokens validate; mismatched or non-ASCII tokens do not raise."""
+    token = auth_utils.create_csrf_token()
+
+    assert auth_utils.validate_csrf_token(token, token) is True
+    assert auth_utils.validate_csrf_token(token, token[:-1]) is False
+    assert auth_utils.validate_csrf_token(token[:-1] + "é", token) is False
+    assert auth_utils.validate_csrf_token("", token) is False
+
+
+def test_token_pool_refills_without_reusing_bytes():
+    """Tokens drawn across pool refills should be unique and correctly sized."""
+    from app.security._entropy_pool import TokenPool
+
+    pool = TokenPool(chunk=100)
+    tokens = [pool.urlsafe(32) for _ in range(20)]
+
+    assert len(set(tokens)) == len(tokens)
+    # Same length as secrets.token_urlsafe(32)
+    assert all(len(token) == 43 for token in tokens)
+    assert len(pool.token_bytes(200)) == 200
+
+
 # ---------------------------------------------------------------------------
 # User service
 # ---------------------------------------------------------------------------
@@ -0,0 +1,163 @@
+"""Tests for the Amazon Bedrock LLM provider."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import BaseModel
+
+from app.services.llm.config import BedrockConfig
+from app.services.llm.providers.bedrock import (
+    BedrockLLMProvider,
+    _bedrock_client,
+    _bedrock_tool_config,
+)
+
+
+class Haiku(BaseModel):
+    """Response model used in the structured response tests."""
+
+    lines: list[str]
+
+
+@pytest.fixture
+def bedrock_provider():
+    """Create a Bedrock provider with a mocked runtime client."""
+    provider = BedrockLLMProvider(
+        BedrockConfig(model_id="test-model", region="us-east-1")
+    )
+    provider.client = Mock()
+    return provider
+
+
+def tool_use_response(tool_input):
+    """Build a converse response holding a single tool call."""
+    return {
+        "output": {
+            "message": {"content": [{"toolUse": {"input": tool_input}}]},
+        }
+    }
+
+
+def test_providers_share_a_client_per_region_and_credentials():
+    """Test the boto3 client is built once and reused across providers."""
+    _bedrock_client.cache_clear()
+    with patch("app.services.llm.providers.bedrock.boto3.client") as make_client:
+        make_client.side_effect = lambda *args, **kwargs: Mock()
+        first = BedrockLLMProvider(BedrockConfig(model_id="a", region="us-east-1"))
+        second = BedrockLLMProvider(BedrockConfig(model_id="b", region="us-east-1"))
+        other = BedrockLLMProvider(BedrockConfig(model_id="a", region="eu-west-1"))
+
+    assert first.client is second.client
+    assert other.client is not first.client
+    assert make_client.call_count == 2
+    config = make_client.call_args.kwargs["config"]
+    assert config.retries == {"mode": "standard", "max_attempts": 3}
+    _bedrock_client.cache_clear()
+
+
+class TestBedrockStructuredResponse:
+    """Test cases for Bedrock structured responses."""
+
+    @pytest.mark.asyncio
+    async def test_tool_output_is_validated_by_default(self, bedrock_provider):
+        """Test tool input is validated against the response model."""
+        bedrock_provider.client.converse.return_value = tool_use_response(
+            {"lines": ["a", "b", "c"]}
+        )
+
+        result = await bedrock_provider.get_structured_response("Haiku", Haiku)
+
+        assert result == Haiku(lines=["a", "b", "c"])
+        tool_config = bedrock_provider.client.converse.call_args.kwargs["toolConfig"]
+        assert tool_config is _bedrock_tool_config(Haiku)
+        tool_spec = tool_config["tools"][0]["toolSpec"]
+        assert tool_spec["inputSchema"]["json"] == Haiku.model_json_schema()
+
+    @pytest.mark.asyncio
+    async def test_trusted_tool_output_skips_validation(self, bedrock_provider):
+        """Test trusted tool input is used as-is."""
+        bedrock_provider.client.converse.return_value = tool_use_response(
+            {"lines": ("a", "b", "c")}
+        )
+
+        result = await bedrock_provider.get_structured_response(
+            "Haiku", Haiku, trust_tool_output=True
+        )
+
+        # Validation would have converted the tuple to a list
+        assert result.lines == ("a", "b", "c")
+
+    @pytest.mark.asyncio
+    async def test_text_content_is_parsed_without_tool_call(self, bedrock_provider):
+        """Test JSON text is parsed when the model skipped the tool call."""
+        bedrock_provider.client.converse.return_value = {
+            "output": {
+                "message": {
+                    "content": [
+                        {"toolUse": {"input": {}}},
+                        {"text": '{"lines": ["a", "b", "c"]}'},
+                    ]
+                }
+            }
+        }
+
+        result = await bedrock_provider.get_structured_response("Haiku", Haiku)
+
+        assert result == Haiku(lines=["a", "b", "c"])
+
+
+class TestBedrockStreamResponse:
+    """Test cases for Bedrock streaming."""
+
+    @pytest.mark.asyncio
+    async def test_stream_is_read_off_the_event_loop(self, bedrock_provider):
+        """Test stream events are read on the Bedrock executor until messageStop."""
+        reader_threads = []
+
+        def events():
+            for text in ["Hello", " from", " Bedrock"]:
+                reader_threads.append(threading.current_thread().name)
+                yield {"contentBlockDelta": {"delta": {"text": text}}}
+            yield {"messageStop": {}}
+            yield {"contentBlockDelta": {"delta": {"text": "ignored"}}}
+
+        bedrock_provider.client.converse_stream.return_value = {"stream": events()}
+
+        chunks = [
+            chunk
+            async for chunk in bedrock_provider.stream_response(
+                "Hello", stream_batch_chars=1
+            )
+        ]
+
+        assert chunks == ["Hello", " from", " Bedrock"]
+        assert all(name.startswith("bedrock") for name in reader_threads)
+
+
+def test_extract_text_joins_text_blocks(bedrock_provider):
+    """Test text blocks are joined and non-text blocks are skipped."""
+    response = {
+        "output": {
+            "message": {
+                "content": [{"text": " first"}, {"toolUse": {}}, {"text": "second "}]
+            }
+        }
+    }
+
+    assert bedrock_provider._extract_text_from_response(response) == "first\nsecond"
+    assert bedrock_provider._extract_text_from_response({}) == ""
+
+
+def test_converse_params_map_inference_settings(bedrock_provider):
+    """Test OpenAI-style settings are renamed into the inference config."""
+    params = bedrock_provider._build_converse_params(
+        " Hello ", "test-model", max_tokens=10, top_p=0.5, system="Be brief"
+    )
+
+    assert params == {
+        "modelId": "test-model",
+        "messages": [{"role": "user", "content": [{"text": "Hello"}]}],
+        "inferenceConfig": {"maxTokens": 10, "topP": 0.5},
+        "system": [{"text": "Be brief"}],
+    }
@@ -94,6 +94,22 @@ def test_load_config_missing_api_key_raises_error(mock_read_secret):
         load_config(provider="openai")
 
 
+@patch("app.core.secrets.read_secret")
+def test_load_config_is_memoized_per_settings(mock_read_secret):
+    """Test load_config reuses configs until a relevant setting changes."""
+    mock_read_secret.side_effect = lambda key: {"openai_api_key": "key-1"}.get(key)
+
+    first = load_config(provider="openai", default_model="gpt-4")
+    assert load_config(provider="openai", default_model="gpt-4") is first
+
+    mock_read_secret.side_effect = lambda key: {"openai_api_key": "key-2"}.get(key)
+    rotated = load_config(provider="openai", default_model="gpt-4")
+
+    assert rotated is not first
+    assert rotated.openai is not None
+    assert rotated.openai.api_key == "key-2"
+
+
 def test_load_config_unsupported_provider_raises_error():
     """Test that unsupported providers raise configuration errors."""
     with pytest.raises(LLMConfigurationError, match="Unsupported LLM provider"):
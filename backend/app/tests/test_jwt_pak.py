@@ -38,7 +38,7 @@ class TestJWTPAK:
         assert isinstance(token, str)
         assert len(token) > 0
         assert isinstance(jti, str)
-        assert len(jti) == 36  # UUID4 length
+        assert len(jti) == 32  # 128-bit hex JTI
         assert isinstance(token_hash, str)
         assert len(token_hash) == 64  # SHA256 hex length
 
@@ -164,3 +164,19 @@ class TestJWTPAK:
         assert token1 != token2
         assert jti1 != jti2
         assert hash1 != hash2
+
+    @patch.dict(os.environ, {"ENVIRONMENT": "test"})
+    def test_prepared_keys_follow_key_cache(self):
+        """Test prepared jose keys are reused and rebuilt after a key reload."""
+        from app.utils.jwt_pak import _get_signing_key, _get_verification_key
+
+        signing_key = _get_signing_key()
+        verification_key = _get_verification_key()
+        assert _get_signing_key() is signing_key
+        assert _get_verification_key() is verification_key
+
+        clear_key_cache()
+        assert _get_signing_key() is not signing_key
+
+        token, _, _ = create_api_jwt("test@example.com")
+        assert verify_api_jwt(token) is not None
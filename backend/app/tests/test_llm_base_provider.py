@@ -0,0 +1,268 @@
+"""Tests for the shared LLM provider behaviour in BaseLLMProvider."""
+
+import asyncio
+import json
+
+import pytest
+from pydantic import BaseModel
+
+from app.services.llm.exceptions import LLMGenerationError
+from app.services.llm.providers.base import BaseLLMProvider, _batched
+from app.services.llm.utils import json_schema_for
+
+
+class Haiku(BaseModel):
+    """Response model used in the structured prompt tests."""
+
+    lines: list[str]
+
+
+class DummyProvider(BaseLLMProvider):
+    """Minimal provider exposing the base helpers."""
+
+    def __init__(self):
+        super().__init__("dummy-model")
+
+    async def get_response(self, prompt: str, model: str | None = None, **kwargs):
+        return prompt
+
+    async def stream_response(self, prompt: str, model: str | None = None, **kwargs):
+        yield prompt
+
+
+def test_json_schema_is_generated_once_per_model():
+    """Test the schema helper returns the same cached dict for a model."""
+    assert json_schema_for(Haiku) is json_schema_for(Haiku)
+    assert json_schema_for(Haiku) == Haiku.model_json_schema()
+
+
+def test_structured_prompt_embeds_json_schema():
+    """Test structured prompts append the model's schema as JSON."""
+    prompt = DummyProvider()._format_structured_prompt("Write a haiku", Haiku)
+
+    lines = prompt.split("\n")
+    assert lines[0] == "Write a haiku"
+    assert lines[2].startswith("Please respond with a valid JSON object")
+    assert json.loads(lines[3]) == Haiku.model_json_schema()
+    assert lines[-1] == "Respond only with the JSON object, no additional text."
+
+
+def test_structured_instructions_are_shared_per_model():
+    """Test the system instructions are one cached string per model."""
+    provider = DummyProvider()
+
+    instructions = provider._structured_instructions(Haiku)
+
+    assert instructions is provider._structured_instructions(Haiku)
+    assert instructions.startswith("Please respond with a valid JSON object")
+    assert provider._format_structured_prompt("Write a haiku", Haiku) == (
+        "Write a haiku\n\n" + instructions
+    )
+
+
+async def collect(chunks):
+    """Drain an async iterator into a list."""
+    return [chunk async for chunk in chunks]
+
+
+async def stream_of(*chunks, pause=0.0):
+    """Yield chunks, optionally sleeping before each one."""
+    for chunk in chunks:
+        await asyncio.sleep(pause)
+        yield chunk
+
+
+@pytest.mark.asyncio
+async def test_batched_coalesces_up_to_max_chars():
+    """Test chunks are joined until the batch reaches max_chars."""
+    batches = await collect(_batched(stream_of("ab", "cd", "ef", "g"), max_chars=4))
+
+    assert batches == ["abcd", "efg"]
+
+
+@pytest.mark.asyncio
+async def test_batched_flushes_after_max_delay():
+    """Test a slow stream is flushed on the timer instead of held back."""
+    batches = await collect(
+        _batched(stream_of("a", "b", pause=0.05), max_chars=64, max_delay_ms=10)
+    )
+
+    assert batches == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_batched_passes_through_when_disabled():
+    """Test max_chars of 1 yields every chunk unchanged."""
+    batches = await collect(_batched(stream_of("a", "b", "c"), max_chars=1))
+
+    assert batches == ["a", "b", "c"]
+
+
+def test_log_llm_call_formats_parameters(caplog):
+    """Test calls are logged with the provider name and non-secret parameters."""
+    provider = DummyProvider()
+
+    with caplog.at_level("INFO", logger=provider.logger.name):
+        provider._log_llm_call(
+            "get_response", "m", temperature=0.2, api_key="s", aws_secret_access_key="s"
+        )
+
+    assert caplog.messages == [
+        "🤖 LLM Call → Provider: DummyProvider, Model: m, Operation: get_response, "
+        "Parameters: temperature=0.2"
+    ]
+
+
+def test_log_llm_call_is_skipped_above_info(caplog):
+    """Test nothing is formatted or logged when INFO is disabled."""
+    provider = DummyProvider()
+
+    with caplog.at_level("WARNING", logger=provider.logger.name):
+        provider._log_llm_call("get_response", "m", temperature=0.2)
+
+    assert caplog.messages == []
+
+
+def test_validate_response_strips_and_rejects_blank_content():
+    """Test content is returned stripped and blank content raises."""
+    provider = DummyProvider()
+
+    assert provider._validate_response("  text \n") == "text"
+    for blank in ("", "  \n", None):
+        with pytest.raises(LLMGenerationError):
+            provider._validate_response(blank)
+
+
+@pytest.mark.asyncio
+async def test_singleflight_shares_one_call_between_concurrent_callers():
+    """Test concurrent callers with the same key wait on a single call."""
+    provider = DummyProvider()
+    release = asyncio.Event()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "answer"
+
+    callers = [
+        asyncio.create_task(provider._singleflight("key", call)) for _ in range(5)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*callers) == ["answer"] * 5
+    assert calls == 1
+    assert provider._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_singleflight_failure_reaches_every_waiter():
+    """Test a failed shared call raises its own copy in every caller."""
+    provider = DummyProvider()
+    release = asyncio.Event()
+    error = LLMGenerationError("boom")
+
+    async def call():
+        await release.wait()
+        raise error
+
+    callers = [
+        asyncio.create_task(provider._singleflight("key", call)) for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*callers, return_exceptions=True)
+    assert all(isinstance(result, LLMGenerationError) for result in results)
+    assert len({id(result) for result in results}) == 3
+    assert all(result.__cause__ is error for result in results)
+    assert provider._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_singleflight_survives_first_caller_cancellation():
+    """Test cancelling the caller that started the call doesn't stop it."""
+    provider = DummyProvider()
+    release = asyncio.Event()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "answer"
+
+    first = asyncio.create_task(provider._singleflight("key", call))
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(provider._singleflight("key", call)) for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["answer"] * 2
+    assert first.cancelled()
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_singleflight_restarts_a_cancelled_call():
+    """Test waiters run the call again if the shared request is cancelled."""
+    provider = DummyProvider()
+    release = asyncio.Event()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "answer"
+
+    callers = [
+        asyncio.create_task(provider._singleflight("key", call)) for _ in range(3)
+    ]
+    while not calls:
+        await asyncio.sleep(0)
+    provider._inflight["key"].task.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*callers) == ["answer"] * 3
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_singleflight_cancels_call_nobody_awaits():
+    """Test the shared request is cancelled once every caller has gone."""
+    provider = DummyProvider()
+    started = asyncio.Event()
+
+    async def call():
+        started.set()
+        await asyncio.Event().wait()
+        return "never"
+
+    caller = asyncio.create_task(provider._singleflight("key", call))
+    await started.wait()
+    task = provider._inflight["key"].task
+    caller.cancel()
+    await asyncio.gather(caller, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert task.cancelled()
+    assert provider._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_singleflight_without_key_always_calls():
+    """Test calls without a key (sampled requests) are never shared."""
+    provider = DummyProvider()
+
+    direct = await provider._singleflight(None, lambda: asyncio.sleep(0, "direct"))
+
+    assert direct == "direct"
+    assert provider._inflight == {}
@@ -0,0 +1,405 @@
+"""
+Unit tests for the LLM settings and service caches.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import pytest
+
+from app.services.llm.cache import LLMServiceCache, LLMSettingsCache
+from app.services.llm.exceptions import LLMConfigurationError
+
+
+class TestLLMSettingsCache:
+    """Test LLMSettingsCache behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_cached_settings_are_not_refetched(self):
+        """Test a fresh entry is returned without fetching again."""
+        cache = LLMSettingsCache()
+        settings_row = Mock()
+        cache._fetch_from_database = AsyncMock(return_value=settings_row)
+
+        assert await cache.get_settings(AsyncMock()) is settings_row
+        assert await cache.get_settings(AsyncMock()) is settings_row
+
+        cache._fetch_from_database.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self):
+        """Test concurrent misses wait on a single database fetch."""
+        cache = LLMSettingsCache()
+        settings_row = Mock()
+        release = asyncio.Event()
+
+        async def slow_fetch(db):
+            await release.wait()
+            return settings_row
+
+        cache._fetch_from_database = AsyncMock(side_effect=slow_fetch)
+        callers = [
+            asyncio.create_task(cache.get_settings(AsyncMock())) for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert all(result is settings_row for result in await asyncio.gather(*callers))
+        cache._fetch_from_database.assert_awaited_once()
+        assert cache._inflight is None
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_reaches_every_waiter(self):
+        """Test a failed shared fetch raises in every caller and isn't cached."""
+        cache = LLMSettingsCache()
+        release = asyncio.Event()
+
+        async def failing_fetch(db):
+            await release.wait()
+            raise LLMConfigurationError("boom")
+
+        cache._fetch_from_database = AsyncMock(side_effect=failing_fetch)
+        callers = [
+            asyncio.create_task(cache.get_settings(AsyncMock())) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        results = await asyncio.gather(*callers, return_exceptions=True)
+        assert all(isinstance(result, LLMConfigurationError) for result in results)
+        assert cache._cached_settings is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_fetch_is_taken_over_by_a_waiter(self):
+        """Test cancelling the fetching caller doesn't fail the others."""
+        cache = LLMSettingsCache()
+        settings_row = Mock()
+        release = asyncio.Event()
+
+        async def slow_fetch(db):
+            await release.wait()
+            return settings_row
+
+        cache._fetch_from_database = AsyncMock(side_effect=slow_fetch)
+        leader = asyncio.create_task(cache.get_settings(AsyncMock()))
+        await asyncio.sleep(0)
+        waiters = [
+            asyncio.create_task(cache.get_settings(AsyncMock())) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert all(result is settings_row for result in await asyncio.gather(*waiters))
+        assert leader.cancelled()
+        assert cache._fetch_from_database.await_count == 2
+        assert cache._cached_settings is settings_row
+
+    @pytest.mark.asyncio
+    async def test_invalidate_discards_in_flight_fetch(self):
+        """Test a fetch started before invalidate_cache doesn't repopulate it."""
+        cache = LLMSettingsCache()
+        release = asyncio.Event()
+
+        async def slow_fetch(db):
+            await release.wait()
+            return Mock()
+
+        cache._fetch_from_database = AsyncMock(side_effect=slow_fetch)
+        caller = asyncio.create_task(cache.get_settings(AsyncMock()))
+        await asyncio.sleep(0)
+        await cache.invalidate_cache()
+        release.set()
+        await caller
+
+        assert cache._cached_settings is None
+
+    @pytest.mark.asyncio
+    async def test_expired_settings_are_refetched(self):
+        """Test settings past their stale deadline are fetched before returning."""
+        cache = LLMSettingsCache(ttl_seconds=60)
+        cache._fetch_from_database = AsyncMock(side_effect=[Mock(), Mock()])
+
+        first = await cache.get_settings(AsyncMock())
+        cache._expires_at = cache._stale_expires_at = time.monotonic() - 1
+        second = await cache.get_settings(AsyncMock())
+
+        assert first is not second
+        assert cache._fetch_from_database.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_settings_refresh_in_background(self):
+        """Test stale settings are served while one background task refreshes."""
+        cache = LLMSettingsCache(ttl_seconds=60)
+        stale, fresh = Mock(), Mock()
+        cache._fetch_from_database = AsyncMock(side_effect=[stale, fresh])
+        await cache.get_settings(AsyncMock())
+        cache._expires_at = time.monotonic() - 1
+
+        session_factory = MagicMock()
+        with patch("app.services.llm.cache.async_session_factory", session_factory):
+            assert await cache.get_settings(AsyncMock()) is stale
+            assert await cache.get_settings(AsyncMock()) is stale
+            await cache._refresh_task
+
+        assert await cache.get_settings(AsyncMock()) is fresh
+        assert cache._fetch_from_database.await_count == 2
+        session_factory.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_settings_are_upserted(self):
+        """Test missing settings are created (or fetched) in a single upsert."""
+        cache = LLMSettingsCache()
+        settings_row = Mock()
+        cache._llm_settings_repo = Mock(
+            get_default_settings=AsyncMock(return_value=None),
+            get_or_create_default_settings=AsyncMock(return_value=settings_row),
+        )
+        db = AsyncMock()
+
+        assert await cache.get_settings(db) is settings_row
+        cache._llm_settings_repo.get_or_create_default_settings.assert_awaited_once()
+        db.rollback.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_settings_created_concurrently_are_read_back(self):
+        """Test without an upsert, a lost insert race returns the stored row."""
+        from sqlalchemy.exc import IntegrityError
+
+        from app.repositories.llm_settings import LLMSettingsRepository
+
+        repo = LLMSettingsRepository()
+        settings_row = Mock()
+        db = AsyncMock()
+        db.get_bind = Mock(return_value=Mock(dialect=Mock()))
+        db.get_bind.return_value.dialect.name = "sqlite"
+
+        with (
+            patch.object(
+                repo,
+                "create_default_settings",
+                new_callable=AsyncMock,
+                side_effect=IntegrityError("INSERT", {}, Exception("duplicate")),
+            ),
+            patch.object(
+                repo,
+                "get_default_settings",
+                new_callable=AsyncMock,
+                return_value=settings_row,
+            ),
+        ):
+            result = await repo.get_or_create_default_settings(db, Mock())
+
+        assert result is settings_row
+        db.scalars.assert_not_awaited()
+
+
+class TestLLMServiceCache:
+    """Test LLMServiceCache behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_cached_service_skips_the_lock(self):
+        """Test a fresh service is returned without calling the factory again."""
+        cache = LLMServiceCache()
+        service = Mock()
+        factory = Mock(return_value=service)
+
+        assert await cache.get_service("openai|gpt-4o-mini", factory) is service
+        assert await cache.get_service("openai|gpt-4o-mini", factory) is service
+
+        factory.assert_called_once()
+        assert cache._creation_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_create_once(self):
+        """Test concurrent misses on one key call the factory a single time."""
+        cache = LLMServiceCache()
+        factory = Mock(return_value=Mock())
+
+        services = await asyncio.gather(
+            *(cache.get_service("openai|gpt-4o-mini", factory) for _ in range(5))
+        )
+
+        assert all(service is services[0] for service in services)
+        factory.assert_called_once()
+        assert cache._creation_locks == {}
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_service_is_evicted(self):
+        """Test the cache stays bounded and evicts the least recently used key."""
+        cache = LLMServiceCache(max_entries=2)
+        await cache.get_service("a", Mock)
+        await cache.get_service("b", Mock)
+        await cache.get_service("a", Mock)  # "b" is now least recently used
+        await cache.get_service("c", Mock)
+
+        assert list(cache._cached_services) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_sweep_drops_expired_entries(self):
+        """Test the periodic sweep removes expired entries that are never read."""
+        cache = LLMServiceCache()
+        cache.SWEEP_INTERVAL = 2
+        await cache.get_service("stale", Mock)
+        cache._cached_services["stale"] = (Mock(), time.monotonic() - 1)
+        await cache.get_service("fresh", Mock)
+
+        assert list(cache._cached_services) == ["fresh"]
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_each_cached_service_once(self):
+        """Test shutdown closes every cached service and empties the cache."""
+        cache = LLMServiceCache()
+        service = Mock(aclose=AsyncMock())
+        await cache.get_service("lmstudio|local-model", lambda: service)
+        cache.set_default_service(Mock(), service)
+
+        await cache.aclose()
+
+        service.aclose.assert_awaited_once()
+        assert cache._cached_services == {}
+        assert cache._default_entry is None
+
+    def test_generate_cache_key(self):
+        """Test cache keys are stable and ignore parameter order."""
+        cache = LLMServiceCache()
+
+        assert cache._generate_cache_key("openai", "gpt-4o-mini") == (
+            "openai|gpt-4o-mini"
+        )
+        assert (
+            cache._generate_cache_key("openai", "gpt-4o-mini", timeout=30, retries=2)
+            == "openai|gpt-4o-mini|retries=2|timeout=30"
+        )
+        assert (
+            cache._generate_cache_key("openai", "gpt-4o-mini", stop=["a"])
+            == "openai|gpt-4o-mini|stop=['a']"
+        )
+
+
+class TestPreloadLLMService:
+    """Test the startup preload of the LLM caches."""
+
+    @pytest.mark.asyncio
+    async def test_preload_warms_service_cache(self):
+        """Test preloading creates the configured provider's service."""
+        from app.services.llm import dependency_resolver
+
+        settings_row = Mock(provider="openai", openai_model="gpt-4o-mini")
+        settings_cache = Mock(preload=AsyncMock(return_value=settings_row))
+        session_factory = MagicMock()
+
+        with (
+            patch.object(
+                dependency_resolver,
+                "get_llm_settings_cache",
+                return_value=settings_cache,
+            ),
+            patch.object(
+                dependency_resolver, "_create_service_with_cache_async"
+            ) as create_service,
+        ):
+            await dependency_resolver.preload_llm_service(session_factory)
+
+        create_service.assert_awaited_once_with("openai", "gpt-4o-mini")
+
+    @pytest.mark.asyncio
+    async def test_preload_failure_is_logged_not_raised(self):
+        """Test a misconfigured provider doesn't break startup."""
+        from app.services.llm import dependency_resolver
+
+        settings_cache = Mock(
+            preload=AsyncMock(side_effect=LLMConfigurationError("no settings"))
+        )
+
+        with patch.object(
+            dependency_resolver, "get_llm_settings_cache", return_value=settings_cache
+        ):
+            await dependency_resolver.preload_llm_service(MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_unexpected_preload_error_is_logged(self):
+        """Test errors outside the configuration path don't escape the task."""
+        from app.services.llm import dependency_resolver
+
+        settings_row = Mock(provider="openai", openai_model="gpt-4o-mini")
+        settings_cache = Mock(preload=AsyncMock(return_value=settings_row))
+
+        with (
+            patch.object(
+                dependency_resolver,
+                "get_llm_settings_cache",
+                return_value=settings_cache,
+            ),
+            patch.object(
+                dependency_resolver,
+                "_create_service_with_cache_async",
+                side_effect=ConnectionError("provider unreachable"),
+            ),
+            patch.object(dependency_resolver, "logger") as mock_logger,
+        ):
+            await dependency_resolver.preload_llm_service(MagicMock())
+
+        mock_logger.warning.assert_called_once()
+
+
+class TestGlobalCaches:
+    """Test the global cache accessors."""
+
+    def test_accessors_return_singletons_until_reset(self):
+        """Test each accessor returns one instance until reset_caches is called."""
+        from app.services.llm.cache import (
+            get_llm_service_cache,
+            get_llm_settings_cache,
+            reset_caches,
+        )
+
+        settings_cache = get_llm_settings_cache()
+        service_cache = get_llm_service_cache()
+        assert get_llm_settings_cache() is settings_cache
+        assert get_llm_service_cache() is service_cache
+
+        reset_caches()
+
+        assert get_llm_settings_cache() is not settings_cache
+        assert get_llm_service_cache() is not service_cache
+
+
+class TestDefaultLLMService:
+    """Test the memoized default service used by get_llm_service."""
+
+    @pytest.mark.asyncio
+    async def test_default_service_follows_settings_row(self):
+        """Test the default service is reused until the settings row changes."""
+        from app.services.llm import dependency_resolver
+
+        service_cache = LLMServiceCache()
+        first_row = Mock(provider="openai", openai_model="gpt-4o-mini")
+        second_row = Mock(provider="openai", openai_model="gpt-4o")
+
+        with (
+            patch.object(
+                dependency_resolver,
+                "ensure_llm_settings",
+                AsyncMock(side_effect=[first_row, first_row, second_row]),
+            ),
+            patch.object(
+                dependency_resolver,
+                "get_llm_service_cache",
+                return_value=service_cache,
+            ),
+            patch.object(
+                dependency_resolver, "_create_service_with_cache_async"
+            ) as create_service,
+        ):
+            create_service.side_effect = [Mock(), Mock()]
+            first = await dependency_resolver.get_llm_service(AsyncMock())
+            again = await dependency_resolver.get_llm_service(AsyncMock())
+            changed = await dependency_resolver.get_llm_service(AsyncMock())
+
+        assert again is first
+        assert changed is not first
+        assert create_service.await_count == 2
+        create_service.assert_awaited_with("openai", "gpt-4o")
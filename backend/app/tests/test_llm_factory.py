@@ -175,3 +175,40 @@ def test_config_mapping_structure():
 
     bedrock_getter = registry.get_config_getter("bedrock")
     assert bedrock_getter(bedrock_config) == bedrock_config.bedrock
+
+
+def test_builtin_providers_are_imported_on_first_use():
+    """Test built-in providers resolve lazily to their provider classes."""
+    from app.services.llm import providers
+    from app.services.llm.registry import LLMProviderRegistry
+
+    registry = LLMProviderRegistry()
+    assert registry._providers == {}
+    assert {"openai", "openrouter", "bedrock", "lmstudio"} <= set(
+        registry.list_providers()
+    )
+
+    assert registry.get_provider_class("lmstudio") is providers.LMStudioLLMProvider
+    assert registry.list_providers().count("lmstudio") == 1
+
+    with pytest.raises(AttributeError):
+        providers.MissingLLMProvider
+
+
+def test_provider_factory_is_resolved_once_per_name():
+    """Test create_provider reuses its factory until the provider is replaced."""
+    from app.services.llm.registry import LLMProviderRegistry
+
+    class OtherMockProvider(MockProvider):
+        """Replacement provider registered under the same name."""
+
+    registry = LLMProviderRegistry()
+    registry.register_provider("mock", MockProvider, lambda config: Mock())
+
+    assert isinstance(registry.create_provider("MOCK", Mock()), MockProvider)
+    factory = registry._factories["mock"]
+    registry.create_provider("mock", Mock())
+    assert registry._factories["mock"] is factory
+
+    registry.register_provider("mock", OtherMockProvider, lambda config: Mock())
+    assert isinstance(registry.create_provider("mock", Mock()), OtherMockProvider)
@@ -144,3 +144,76 @@ async def test_get_llm_service_openrouter(monkeypatch):
     config = load_config(provider="openrouter", default_model="gpt-4o-mini")
     service = LLMServiceFactory.create_service(config)
     assert type(service).__name__ == "OpenRouterLLMProvider"
+
+
+@pytest.mark.asyncio
+async def test_openai_compatible_providers_share_clients():
+    from app.services.llm.config import OpenAIConfig, OpenRouterConfig
+    from app.services.llm.providers.openai import OpenAILLMProvider
+    from app.services.llm.providers.openrouter import OpenRouterLLMProvider
+
+    first = OpenAILLMProvider(OpenAIConfig(api_key="shared", default_model="a"))
+    second = OpenAILLMProvider(OpenAIConfig(api_key="shared", default_model="b"))
+    other_key = OpenAILLMProvider(OpenAIConfig(api_key="other"))
+    router = OpenRouterLLMProvider(OpenRouterConfig(api_key="shared"))
+
+    assert first.client is second.client
+    assert other_key.client is not first.client
+    assert router.client is not first.client
+    assert str(router.client.base_url).startswith("https://openrouter.ai")
+
+
+def test_openai_clients_are_not_shared_across_event_loops():
+    import asyncio
+
+    from app.services.llm.providers.openai import _get_client
+
+    async def client():
+        return _get_client("shared")
+
+    assert asyncio.run(client()) is not asyncio.run(client())
+    assert _get_client("shared") is not _get_client("shared")
+
+
+@pytest.mark.asyncio
+async def test_evicted_openai_client_is_closed(monkeypatch):
+    import asyncio
+
+    from app.services.llm.providers import openai
+
+    monkeypatch.setattr(openai, "_MAX_CLIENTS_PER_LOOP", 1)
+    first = openai._get_client("first-key")
+    second = openai._get_client("second-key")
+    await asyncio.gather(*openai._closing)
+
+    assert first.is_closed()
+    assert not second.is_closed()
+    assert openai._get_client("second-key") is second
+
+
+@pytest.mark.asyncio
+async def test_structured_request_sends_schema_as_system_message():
+    from unittest.mock import MagicMock
+
+    from pydantic import BaseModel
+
+    from app.services.llm.config import OpenAIConfig
+    from app.services.llm.providers.openai import OpenAILLMProvider
+
+    class Answer(BaseModel):
+        value: int
+
+    provider = OpenAILLMProvider(OpenAIConfig(api_key="test"))
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = '{"value": 1}'
+    provider.client = MagicMock()
+    provider.client.chat.completions.create = AsyncMock(return_value=response)
+
+    assert await provider.get_structured_response("What?", Answer) == Answer(value=1)
+
+    messages = provider.client.chat.completions.create.call_args.kwargs["messages"]
+    assert messages == [
+        {"role": "system", "content": provider._structured_instructions(Answer)},
+        {"role": "user", "content": "What?"},
+    ]
@@ -0,0 +1,289 @@
+"""Tests for the LLM response caches."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+from pydantic import BaseModel
+
+from app.services.llm.config import LLMConfig, OpenAIConfig
+from app.services.llm.providers.openai import OpenAILLMProvider
+from app.services.llm.registry import get_provider_registry
+from app.services.llm.response_cache import (
+    InMemoryCacheBackend,
+    LLMResponseCache,
+    SemanticCache,
+    configure_semantic_cache,
+)
+
+URL = "https://api.openai.com/v1/"
+
+# Toy embeddings: the two capital questions point the same way
+EMBEDDINGS = {
+    "Capital of France?": [1.0, 0.0, 0.0],
+    "What is the capital of France?": [0.99, 0.05, 0.0],
+    "Largest ocean?": [0.0, 1.0, 0.0],
+}
+
+
+class Answer(BaseModel):
+    """Response model used in the structured response tests."""
+
+    value: int
+
+
+def completion(content):
+    """Build a chat completion response holding ``content``."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    return response
+
+
+@pytest.fixture
+def provider():
+    """Create an OpenAI provider with a private cache and a mocked client."""
+    provider = OpenAILLMProvider(
+        OpenAIConfig(api_key="test-key"), cache=LLMResponseCache()
+    )
+    provider.client = MagicMock()
+    provider.client.chat.completions.create = AsyncMock()
+    return provider
+
+
+class TestInMemoryCacheBackend:
+    """Test the in-process LRU backend."""
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        """Test the backend stays bounded and evicts the least recently used key."""
+        backend = InMemoryCacheBackend(max_entries=2)
+        await backend.set("a", "1")
+        await backend.set("b", "2")
+        await backend.get("a")  # "b" is now least recently used
+        await backend.set("c", "3")
+
+        assert list(backend._entries) == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_a_miss(self):
+        """Test an entry past its TTL is dropped on read."""
+        backend = InMemoryCacheBackend()
+        await backend.set("a", "1", ttl=-1)
+
+        assert await backend.get("a") is None
+        assert backend._entries == {}
+
+
+class TestLLMResponseCache:
+    """Test cache key generation."""
+
+    def test_only_deterministic_calls_get_a_key(self):
+        """Test calls without temperature=0 are never cached."""
+        cache = LLMResponseCache()
+        messages = [{"role": "user", "content": "hi"}]
+
+        assert cache.key_for("openai", URL, "m", messages, {}) is None
+        assert cache.key_for("openai", URL, "m", messages, {"temperature": 0.7}) is None
+        assert (
+            cache.key_for("openai", URL, "m", messages, {"temperature": 0}) is not None
+        )
+
+    def test_key_ignores_parameter_order(self):
+        """Test equal requests hash the same and different ones don't."""
+        cache = LLMResponseCache()
+        messages = [{"role": "user", "content": "hi"}]
+
+        key = cache.key_for("openai", URL, "m", messages, {"temperature": 0, "seed": 1})
+        assert key == cache.key_for(
+            "openai", URL, "m", messages, {"seed": 1, "temperature": 0}
+        )
+        assert key != cache.key_for(
+            "openai", URL, "other", messages, {"seed": 1, "temperature": 0}
+        )
+
+    def test_key_depends_on_endpoint(self):
+        """Test the same request to a different server gets its own key."""
+        cache = LLMResponseCache()
+        messages = [{"role": "user", "content": "hi"}]
+        params = {"temperature": 0}
+
+        assert cache.key_for("openai", URL, "m", messages, params) != cache.key_for(
+            "openai", "http://localhost:1234/v1", "m", messages, params
+        )
+
+    def test_unserializable_params_are_not_cached(self):
+        """Test params without a JSON form skip the cache instead of using repr."""
+        cache = LLMResponseCache()
+        messages = [{"role": "user", "content": "hi"}]
+        params = {"temperature": 0, "tool": object()}
+
+        assert cache.key_for("openai", URL, "m", messages, params) is None
+
+    @pytest.mark.asyncio
+    async def test_backend_errors_are_misses(self):
+        """Test a failing backend doesn't fail the call."""
+        backend = MagicMock(
+            get=AsyncMock(side_effect=ConnectionError("down")),
+            set=AsyncMock(side_effect=ConnectionError("down")),
+        )
+        cache = LLMResponseCache(backend)
+
+        assert await cache.get("key") is None
+        await cache.set("key", "value")
+
+
+class TestSemanticCache:
+    """Test similarity lookups."""
+
+    @pytest.mark.asyncio
+    async def test_similar_prompt_hits_and_unrelated_prompt_misses(self):
+        """Test only prompts above the threshold share a stored response."""
+        cache = SemanticCache(EMBEDDINGS.__getitem__)
+        await cache.add("ns", await cache.embed("Capital of France?"), "Paris")
+
+        paraphrase = await cache.embed("What is the capital of France?")
+        assert await cache.lookup("ns", paraphrase) == "Paris"
+        assert await cache.lookup("ns", await cache.embed("Largest ocean?")) is None
+        assert await cache.lookup("other-ns", paraphrase) is None
+
+    @pytest.mark.asyncio
+    async def test_dissimilar_prompts_start_new_clusters(self):
+        """Test entries are grouped so lookups scan a single cluster."""
+        cache = SemanticCache(EMBEDDINGS.__getitem__)
+        for prompt in EMBEDDINGS:
+            await cache.add("ns", await cache.embed(prompt), prompt)
+
+        assert [len(cluster.entries) for cluster in cache._clusters["ns"]] == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_embedding_errors_are_misses(self):
+        """Test a failing embedding function doesn't fail the caller."""
+        cache = SemanticCache(Mock(side_effect=RuntimeError("model not loaded")))
+
+        assert await cache.embed("Capital of France?") is None
+
+    def test_configured_cache_reaches_registry_providers(self):
+        """Test providers built by the registry use the global semantic cache."""
+        config = LLMConfig(openai=OpenAIConfig(api_key="test-key"))
+        registry = get_provider_registry()
+        assert registry.create_provider("openai", config).semantic_cache is None
+
+        semantic_cache = configure_semantic_cache(EMBEDDINGS.__getitem__)
+        try:
+            provider = registry.create_provider("openai", config)
+        finally:
+            configure_semantic_cache(None)
+
+        assert semantic_cache is not None
+        assert provider.semantic_cache is semantic_cache
+
+
+class TestProviderResponseCache:
+    """Test the OpenAI provider's use of the response cache."""
+
+    @pytest.mark.asyncio
+    async def test_deterministic_response_is_replayed(self, provider):
+        """Test a repeated temperature=0 call is served from the cache."""
+        provider.client.chat.completions.create.return_value = completion("Paris")
+
+        first = await provider.get_response("Capital of France?", temperature=0)
+        second = await provider.get_response("Capital of France?", temperature=0)
+
+        assert first == second == "Paris"
+        provider.client.chat.completions.create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_deterministic_calls_share_one_request(self, provider):
+        """Test identical calls made while one is running don't hit the API."""
+        release = asyncio.Event()
+
+        async def slow_completion(**kwargs):
+            await release.wait()
+            return completion("Paris")
+
+        provider.client.chat.completions.create.side_effect = slow_completion
+        callers = [
+            asyncio.create_task(
+                provider.get_response("Capital of France?", temperature=0)
+            )
+            for _ in range(5)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*callers) == ["Paris"] * 5
+        provider.client.chat.completions.create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_sampled_response_is_not_cached(self, provider):
+        """Test calls with a non-zero temperature always reach the API."""
+        provider.client.chat.completions.create.return_value = completion("Paris")
+
+        await provider.get_response("Capital of France?", temperature=0.7)
+        await provider.get_response("Capital of France?", temperature=0.7)
+
+        assert provider.client.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_structured_response_is_validated_on_hit(self, provider):
+        """Test a cached structured response is parsed into a new instance."""
+        provider.client.chat.completions.create.return_value = completion(
+            '{"value": 42}'
+        )
+
+        first = await provider.get_structured_response("x", Answer, temperature=0)
+        second = await provider.get_structured_response("x", Answer, temperature=0)
+
+        assert first == second == Answer(value=42)
+        assert first is not second
+        provider.client.chat.completions.create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_similar_structured_prompt_is_replayed(self, provider):
+        """Test a paraphrased deterministic prompt reuses a validated response."""
+        provider.semantic_cache = SemanticCache(EMBEDDINGS.__getitem__)
+        provider.client.chat.completions.create.return_value = completion(
+            '{"value": 42}'
+        )
+
+        await provider.get_structured_response(
+            "Capital of France?", Answer, temperature=0
+        )
+        result = await provider.get_structured_response(
+            "What is the capital of France?", Answer, temperature=0
+        )
+
+        assert result == Answer(value=42)
+        provider.client.chat.completions.create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_failure_calls_the_model(self, provider):
+        """Test an embedding error is treated as a semantic cache miss."""
+        provider.semantic_cache = SemanticCache(Mock(side_effect=RuntimeError("down")))
+        provider.client.chat.completions.create.return_value = completion(
+            '{"value": 42}'
+        )
+
+        result = await provider.get_structured_response("x", Answer, temperature=0)
+
+        assert result == Answer(value=42)
+        provider.client.chat.completions.create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_semantic_hit_failing_validation_calls_the_model(self, provider):
+        """Test a similar response that doesn't fit the schema is ignored."""
+        provider.semantic_cache = SemanticCache(EMBEDDINGS.__getitem__)
+        namespace = f"{provider.default_model}|{Answer.__qualname__}"
+        vector = await provider.semantic_cache.embed("Capital of France?")
+        await provider.semantic_cache.add(namespace, vector, '{"value": "Paris"}')
+        provider.client.chat.completions.create.return_value = completion(
+            '{"value": 42}'
+        )
+
+        result = await provider.get_structured_response(
+            "What is the capital of France?", Answer, temperature=0
+        )
+
+        assert result == Answer(value=42)
+        provider.client.chat.completions.create.assert_awaited_once()
@@ -364,6 +364,24 @@ class TestLLMSettingsService:
             assert result == mock_models
             mock_provider.get_available_models.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_lmstudio_models_reuses_provider(self, llm_service):
+        """Test model listings share one provider until the service is closed."""
+        with patch(
+            "app.services.llm_settings.LMStudioLLMProvider"
+        ) as mock_provider_class:
+            mock_provider = Mock()
+            mock_provider.get_available_models = AsyncMock(return_value=["model1"])
+            mock_provider.aclose = AsyncMock()
+            mock_provider_class.return_value = mock_provider
+
+            await llm_service.get_lmstudio_models()
+            await llm_service.get_lmstudio_models()
+            await llm_service.aclose()
+
+            mock_provider_class.assert_called_once()
+            mock_provider.aclose.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_get_lmstudio_models_empty_result(self, llm_service, mock_settings):
         """Test LMStudio models retrieval with empty result."""
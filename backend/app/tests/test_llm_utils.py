@@ -0,0 +1,115 @@
+"""Tests for the shared LLM utilities."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+from openai import APIStatusError
+from pydantic import BaseModel
+
+from app.services.llm.exceptions import LLMRateLimitError, LLMValidationError
+from app.services.llm.utils import (
+    _is_retryable_error,
+    _parse_retry_after,
+    parse_json_response,
+    retry_on_failure,
+)
+
+
+class Answer(BaseModel):
+    """Response model used in the parsing tests."""
+
+    value: int
+
+
+@pytest.mark.asyncio
+async def test_retry_waits_with_jittered_exponential_backoff():
+    """Test each retry waits the backoff delay plus a random jitter."""
+    func = AsyncMock(side_effect=[LLMRateLimitError("slow down")] * 2 + ["ok"])
+    func.__name__ = "call"
+    decorator = retry_on_failure(max_retries=3, delay=1.0, backoff=2.0, jitter=0.5)
+    retrying = decorator(func)
+
+    with (
+        patch("app.services.llm.utils.random.uniform", return_value=0.25) as uniform,
+        patch("app.services.llm.utils.asyncio.sleep", new_callable=AsyncMock) as sleep,
+    ):
+        assert await retrying() == "ok"
+
+    assert [call.args[0] for call in sleep.await_args_list] == [1.25, 2.25]
+    uniform.assert_called_with(0, 0.5)
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_are_raised_immediately():
+    """Test permanent errors are not retried."""
+    func = AsyncMock(side_effect=ValueError("bad request"))
+    func.__name__ = "call"
+
+    with patch("app.services.llm.utils.asyncio.sleep", new_callable=AsyncMock) as sleep:
+        with pytest.raises(ValueError):
+            await retry_on_failure(max_retries=3)(func)()
+
+    func.assert_awaited_once()
+    sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_retry_after_header_replaces_backoff_delay():
+    """Test a rate limit carrying retry-after waits as long as the API asked."""
+    sdk_error = Exception("429")
+    sdk_error.response = Mock(headers=httpx.Headers({"retry-after": "7"}))
+    rate_limited = LLMRateLimitError("slow down")
+    rate_limited.__cause__ = sdk_error
+    func = AsyncMock(side_effect=[rate_limited, "ok"])
+    func.__name__ = "call"
+
+    with (
+        patch("app.services.llm.utils.random.uniform", return_value=0.25),
+        patch("app.services.llm.utils.asyncio.sleep", new_callable=AsyncMock) as sleep,
+    ):
+        assert await retry_on_failure(max_retries=3, delay=1.0)(func)() == "ok"
+
+    sleep.assert_awaited_once_with(7.25)
+
+
+def test_retry_after_parsing():
+    """Test retry-after-ms, seconds and HTTP dates are understood."""
+    assert _parse_retry_after("1500", None) == 1.5
+    assert _parse_retry_after(None, "3") == 3.0
+    assert _parse_retry_after(None, "Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert _parse_retry_after(None, "Wed, 21 Oct 2015 07:28:00 -0000") == 0.0
+    assert _parse_retry_after(None, "soon") is None
+    assert _parse_retry_after(None, None) is None
+
+
+def test_parse_json_response_accepts_padded_and_embedded_json():
+    """Test bare JSON (with whitespace) and JSON inside prose both parse."""
+    assert parse_json_response(' \n {"value": 1} \n', Answer) == Answer(value=1)
+    assert parse_json_response('Sure! {"value": 2} Done.', Answer) == Answer(value=2)
+
+
+def test_parse_json_response_rejects_missing_or_invalid_json():
+    """Test content without a valid object raises LLMValidationError."""
+    with pytest.raises(LLMValidationError):
+        parse_json_response("no json here", Answer)
+    with pytest.raises(LLMValidationError):
+        parse_json_response('{"value": "x"}', Answer)
+    with pytest.raises(LLMValidationError):
+        parse_json_response("   ", Answer)
+
+
+def test_retryable_error_classification():
+    """Test transient errors are retried and permanent ones are not."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+    def status_error(status):
+        response = httpx.Response(status, request=request)
+        return APIStatusError("error", response=response, body=None)
+
+    assert _is_retryable_error(status_error(503))
+    assert _is_retryable_error(status_error(429))
+    assert not _is_retryable_error(status_error(400))
+    assert _is_retryable_error(LLMRateLimitError("slow down"))
+    assert _is_retryable_error(TimeoutError())
+    assert not _is_retryable_error(ValueError("bad request"))
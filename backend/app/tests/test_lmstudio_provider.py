@@ -2,13 +2,40 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
+from openai import BadRequestError
+from pydantic import BaseModel
 
 from app.services.llm.config import LMStudioConfig
 from app.services.llm.exceptions import LLMProviderError
 from app.services.llm.providers.lmstudio import LMStudioLLMProvider
 
 
+class Haiku(BaseModel):
+    """Response model used in the structured response tests."""
+
+    lines: list[str]
+
+
+def completion(content):
+    """Build a chat completion response holding ``content``."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    return response
+
+
+def bad_request(message="unsupported response_format"):
+    """Build the error an OpenAI-compatible server returns for a bad request."""
+    request = httpx.Request("POST", "http://localhost:1234/v1/chat/completions")
+    return BadRequestError(
+        message,
+        response=httpx.Response(400, request=request),
+        body=None,
+    )
+
+
 @pytest.fixture
 def lmstudio_config():
     """Create a test LMStudio configuration."""
@@ -39,46 +66,73 @@ class TestLMStudioProvider:
     async def test_get_available_models_success(self, lmstudio_provider):
         """Test successful model fetching."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "data": [{"id": "llama-3-8b"}, {"id": "mistral-7b"}, {"id": "codellama-7b"}]
-        }
+        mock_response.content = (
+            b'{"data": [{"id": "llama-3-8b"}, {"id": "mistral-7b"}, '
+            b'{"id": "codellama-7b"}]}'
+        )
         mock_response.raise_for_status.return_value = None
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+        with patch.object(
+            lmstudio_provider._http, "get", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = mock_response
 
             models = await lmstudio_provider.get_available_models()
 
             assert models == ["llama-3-8b", "mistral-7b", "codellama-7b"]
-            mock_client_instance.get.assert_called_once_with(
-                "http://localhost:1234/v1/models"
-            )
+            mock_get.assert_called_once_with("/models")
+
+    def test_http_client_targets_base_url(self, lmstudio_provider):
+        """Test the shared HTTP client resolves paths against the base URL."""
+        request = lmstudio_provider._http.build_request("GET", "/models")
+
+        assert str(request.url) == "http://localhost:1234/v1/models"
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_http_clients(self, lmstudio_provider):
+        """Test aclose releases the shared HTTP client."""
+        await lmstudio_provider.aclose()
+
+        assert lmstudio_provider._http.is_closed
 
     @pytest.mark.asyncio
     async def test_get_available_models_empty_response(self, lmstudio_provider):
         """Test handling of empty model response."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"data": []}
+        mock_response.content = b'{"data": []}'
         mock_response.raise_for_status.return_value = None
 
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get.return_value = mock_response
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+        with patch.object(
+            lmstudio_provider._http, "get", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = mock_response
 
             models = await lmstudio_provider.get_available_models()
 
             assert models == []
 
+    @pytest.mark.asyncio
+    async def test_get_available_models_invalid_json(self, lmstudio_provider):
+        """Test a malformed models payload is reported as a provider error."""
+        mock_response = MagicMock()
+        mock_response.content = b"<html>not json</html>"
+        mock_response.raise_for_status.return_value = None
+
+        with patch.object(
+            lmstudio_provider._http, "get", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = mock_response
+
+            with pytest.raises(LLMProviderError, match="Invalid response format"):
+                await lmstudio_provider.get_available_models()
+
     @pytest.mark.asyncio
     async def test_get_available_models_http_error(self, lmstudio_provider):
         """Test handling of HTTP errors when fetching models."""
-        with patch("httpx.AsyncClient") as mock_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get.side_effect = Exception("Connection refused")
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+        with patch.object(
+            lmstudio_provider._http, "get", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.side_effect = Exception("Connection refused")
 
             with pytest.raises(
                 LLMProviderError, match="Unexpected error fetching models"
@@ -148,10 +202,164 @@ class TestLMStudioProvider:
             mock_create.return_value = mock_stream()
 
             chunks = []
-            async for chunk in lmstudio_provider.stream_response("Hello"):
+            async for chunk in lmstudio_provider.stream_response(
+                "Hello", stream_batch_chars=1
+            ):
                 chunks.append(chunk)
 
             assert chunks == ["Hello", " from", " LMStudio!"]
+            assert "stream_batch_chars" not in mock_create.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_stream_response_batches_deltas(self, lmstudio_provider):
+        """Test streamed deltas are coalesced by default."""
+        mock_chunks = []
+        for content in ["Hello", " from", " LMStudio!"]:
+            chunk = MagicMock()
+            chunk.choices = [MagicMock()]
+            chunk.choices[0].delta.content = content
+            mock_chunks.append(chunk)
+
+        async def mock_stream():
+            for chunk in mock_chunks:
+                yield chunk
+
+        with patch.object(
+            lmstudio_provider.client.chat.completions, "create", new_callable=AsyncMock
+        ) as mock_create:
+            mock_create.return_value = mock_stream()
+
+            chunks = [chunk async for chunk in lmstudio_provider.stream_response("Hi")]
+
+            assert chunks == ["Hello from LMStudio!"]
+
+    @pytest.mark.asyncio
+    async def test_structured_response_requests_json_schema(self, lmstudio_provider):
+        """Test structured responses ask for schema-constrained output first."""
+        with patch.object(
+            lmstudio_provider.client.chat.completions, "create", new_callable=AsyncMock
+        ) as mock_create:
+            mock_create.return_value = completion('{"lines": ["a", "b", "c"]}')
+
+            result = await lmstudio_provider.get_structured_response("Haiku", Haiku)
+
+            assert result == Haiku(lines=["a", "b", "c"])
+            response_format = mock_create.call_args.kwargs["response_format"]
+            assert response_format["type"] == "json_schema"
+            assert response_format["json_schema"]["name"] == "Haiku"
+            assert response_format["json_schema"]["schema"] == Haiku.model_json_schema()
+
+    @pytest.mark.asyncio
+    async def test_structured_response_falls_back_to_json_mode(self, lmstudio_provider):
+        """Test a rejected json_schema format is retried with JSON mode."""
+        with patch.object(
+            lmstudio_provider.client.chat.completions, "create", new_callable=AsyncMock
+        ) as mock_create:
+            mock_create.side_effect = [
+                bad_request(),
+                completion('{"lines": ["a", "b", "c"]}'),
+            ]
+
+            result = await lmstudio_provider.get_structured_response("Haiku", Haiku)
+
+            assert result == Haiku(lines=["a", "b", "c"])
+            formats = [
+                call.kwargs["response_format"]["type"]
+                for call in mock_create.call_args_list
+            ]
+            assert formats == ["json_schema", "json_object"]
+
+    @pytest.mark.asyncio
+    async def test_accepted_response_format_is_remembered(self, lmstudio_provider):
+        """Test a model that rejected json_schema gets JSON mode directly next time."""
+        with patch.object(
+            lmstudio_provider.client.chat.completions, "create", new_callable=AsyncMock
+        ) as mock_create:
+            mock_create.side_effect = [
+                bad_request(),
+                completion('{"lines": ["a", "b", "c"]}'),
+                completion('{"lines": ["d", "e", "f"]}'),
+            ]
+
+            await lmstudio_provider.get_structured_response("Haiku", Haiku)
+            result = await lmstudio_provider.get_structured_response("Haiku", Haiku)
+
+            assert result == Haiku(lines=["d", "e", "f"])
+            formats = [
+                call.kwargs["response_format"]["type"]
+                for call in mock_create.call_args_list
+            ]
+            assert formats == ["json_schema", "json_object", "json_object"]
+
+    @pytest.mark.asyncio
+    async def test_unsupported_response_formats_fall_back_to_prompt(
+        self, lmstudio_provider
+    ):
+        """Test a model that rejects every format is prompted for JSON instead."""
+        with patch.object(
+            lmstudio_provider.client.chat.completions, "create", new_callable=AsyncMock
+        ) as mock_create:
+            mock_create.side_effect = [
+                bad_request(),
+                bad_request(),
+                completion('{"lines": ["a", "b", "c"]}'),
+            ]
+
+            result = await lmstudio_provider.get_structured_response("Haiku", Haiku)
+
+            assert result == Haiku(lines=["a", "b", "c"])
+            assert mock_create.await_count == 3
+            assert "response_format" not in mock_create.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_request_errors_are_not_format_rejections(self, lmstudio_provider):
+        """Test a 400 caused by the prompt is raised and doesn't change later calls."""
+        with patch.object(
+            lmstudio_provider.client.chat.completions, "create", new_callable=AsyncMock
+        ) as mock_create:
+            mock_create.side_effect = [
+                bad_request("context length exceeded"),
+                completion('{"lines": ["a", "b", "c"]}'),
+            ]
+
+            with pytest.raises(BadRequestError):
+                await lmstudio_provider.get_structured_response("Haiku", Haiku)
+            await lmstudio_provider.get_structured_response("Haiku", Haiku)
+
+            formats = [
+                call.kwargs["response_format"]["type"]
+                for call in mock_create.call_args_list
+            ]
+            assert formats == ["json_schema", "json_schema"]
+
+    @pytest.mark.asyncio
+    async def test_response_format_is_remembered_per_response_model(
+        self, lmstudio_provider
+    ):
+        """Test one rejected schema doesn't pin JSON mode for other models."""
+
+        class Limerick(BaseModel):
+            """Second response model sharing the LLM model."""
+
+            lines: list[str]
+
+        with patch.object(
+            lmstudio_provider.client.chat.completions, "create", new_callable=AsyncMock
+        ) as mock_create:
+            mock_create.side_effect = [
+                bad_request(),
+                completion('{"lines": ["a", "b", "c"]}'),
+                completion('{"lines": ["d", "e", "f"]}'),
+            ]
+
+            await lmstudio_provider.get_structured_response("Haiku", Haiku)
+            await lmstudio_provider.get_structured_response("Limerick", Limerick)
+
+            formats = [
+                call.kwargs["response_format"]["type"]
+                for call in mock_create.call_args_list
+            ]
+            assert formats == ["json_schema", "json_object", "json_schema"]
 
     def test_model_selection(self, lmstudio_provider):
         """Test model selection logic."""
@@ -45,7 +45,10 @@ class TestPAKEndToEnd:
 
         from app.models.api_key import ApiKey
         from app.models.user import User
-        from app.security.auth_pak import decode_access_token_enhanced
+        from app.security.auth_pak import (
+            decode_access_token_enhanced,
+            invalidate_pak_cache,
+        )
         from app.utils.jwt_pak import (
             compute_token_hash,
             create_api_key_token,
@@ -103,7 +106,7 @@ class TestPAKEndToEnd:
                     return api_key  # Return active key
                 return None
 
-            async def mock_update_last_used(db, key):
+            async def mock_record_last_used(key):
                 key.last_used_at = datetime.now(timezone.utc)
 
             with (
@@ -112,8 +115,8 @@ class TestPAKEndToEnd:
                     mock_verify_api_key_by_hash,
                 ),
                 patch(
-                    "app.security.auth_pak.update_api_key_last_used",
-                    mock_update_last_used,
+                    "app.security.auth_pak.record_api_key_last_used",
+                    mock_record_last_used,
                 ),
             ):
 
@@ -127,6 +130,7 @@ class TestPAKEndToEnd:
 
             # Step 5: Simulate API key revocation
             api_key.revoked_at = datetime.now(timezone.utc)
+            invalidate_pak_cache(api_key.jti)
 
             # Mock the database to return None for revoked key
             async def mock_verify_revoked_key(db, hash_param, jti_param):
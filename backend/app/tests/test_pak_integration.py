@@ -77,7 +77,7 @@ class TestPAKIntegration:
                     return api_key
                 return None
 
-            async def mock_update_last_used(db, key):
+            async def mock_record_last_used(key):
                 # Simulate updating last_used_at
                 key.last_used_at = datetime.now(timezone.utc)
 
@@ -88,8 +88,8 @@ class TestPAKIntegration:
                     mock_verify_api_key_by_hash,
                 ),
                 patch(
-                    "app.security.auth_pak.update_api_key_last_used",
-                    mock_update_last_used,
+                    "app.security.auth_pak.record_api_key_last_used",
+                    mock_record_last_used,
                 ),
             ):
 
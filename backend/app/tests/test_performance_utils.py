@@ -0,0 +1,51 @@
+"""Tests for the timing decorator in app.utils.performance."""
+
+import logging
+
+import pytest
+
+from app.utils import performance
+from app.utils.performance import timing_decorator
+
+
+@timing_decorator
+def add(a, b):
+    return a + b
+
+
+@timing_decorator
+async def add_async(a, b):
+    return a + b
+
+
+@pytest.mark.asyncio
+async def test_timing_is_logged_when_info_is_enabled(caplog):
+    """Test sync and async calls are timed and logged at INFO."""
+    with caplog.at_level(logging.INFO, logger=performance.logger.name):
+        assert add(1, 2) == 3
+        assert await add_async(1, 2) == 3
+
+    assert [message.split(" took ")[0] for message in caplog.messages] == [
+        "Performance: add",
+        "Performance: add_async",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_unsampled_calls_are_not_timed(caplog, monkeypatch):
+    """Test calls skip timing when the sample rate excludes them."""
+    monkeypatch.setattr(performance, "PERF_SAMPLE_RATE", 0.0)
+
+    with caplog.at_level(logging.INFO, logger=performance.logger.name):
+        assert add(1, 2) == 3
+        assert await add_async(1, 2) == 3
+
+    assert caplog.messages == []
+
+
+def test_calls_are_not_timed_above_info(caplog):
+    """Test nothing is measured or logged when INFO is disabled."""
+    with caplog.at_level(logging.WARNING, logger=performance.logger.name):
+        assert add(1, 2) == 3
+
+    assert caplog.messages == []
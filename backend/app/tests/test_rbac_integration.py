@@ -32,16 +32,10 @@ class TestRBACIntegration:
 
         async for mock_db in create_mock_db_session():
             with (
-                patch("app.services.user.UserRepository") as mock_user_repo_class,
-                patch("app.services.user.RoleRepository") as mock_role_repo_class,
+                patch("app.services.user.user_repository") as mock_user_repo,
+                patch("app.services.user.role_repository") as mock_role_repo,
                 patch("app.services.user.get_password_hash") as mock_hash,
             ):
-                # Mock repositories
-                mock_user_repo = Mock()
-                mock_role_repo = Mock()
-                mock_user_repo_class.return_value = mock_user_repo
-                mock_role_repo_class.return_value = mock_role_repo
-
                 # Mock password hashing
                 mock_hash.return_value = "hashed_password"
 
@@ -76,15 +70,9 @@ class TestRBACIntegration:
 
         async for mock_db in create_mock_db_session():
             with (
-                patch("app.services.user.UserRepository") as mock_user_repo_class,
-                patch("app.services.user.RoleRepository") as mock_role_repo_class,
+                patch("app.services.user.user_repository") as mock_user_repo,
+                patch("app.services.user.role_repository") as mock_role_repo,
             ):
-                # Mock repositories
-                mock_user_repo = Mock()
-                mock_role_repo = Mock()
-                mock_user_repo_class.return_value = mock_user_repo
-                mock_role_repo_class.return_value = mock_role_repo
-
                 # Mock role retrieval
                 admin_role = Role(id=1, name="admin", description="Administrator")
                 mock_role_repo.get_by_name = AsyncMock(return_value=admin_role)
@@ -192,16 +180,10 @@ class TestRBACIntegration:
 
         async for mock_db in create_mock_db_session():
             with (
-                patch("app.services.user.UserRepository") as mock_user_repo_class,
-                patch("app.services.user.RoleRepository") as mock_role_repo_class,
+                patch("app.services.user.user_repository") as mock_user_repo,
+                patch("app.services.user.role_repository") as mock_role_repo,
                 patch("app.services.user.get_password_hash") as mock_hash,
             ):
-                # Mock repositories
-                mock_user_repo = Mock()
-                mock_role_repo = Mock()
-                mock_user_repo_class.return_value = mock_user_repo
-                mock_role_repo_class.return_value = mock_role_repo
-
                 # Mock password hashing
                 mock_hash.return_value = "hashed_password"
 
@@ -325,11 +307,9 @@ class TestRBACPerformance:
 
     def test_role_loading_efficiency(self, admin_authenticated_client: TestClient):
         """Test that roles are efficiently loaded with users."""
-        with patch("app.repositories.user.UserRepository") as mock_repo_class:
-            mock_repo = Mock()
+        with patch("app.api.v1.endpoints.admin.user_repository") as mock_repo:
             mock_admin = create_mock_current_admin_user()
             mock_repo.get_by_id_with_role = AsyncMock(return_value=mock_admin)
-            mock_repo_class.return_value = mock_repo
 
             response = admin_authenticated_client.get("/api/v1/admin/users/1")
             assert response.status_code == 200
@@ -299,30 +299,32 @@ class TestRoleRepositoryLogging:
         """Test that database errors are properly logged."""
         mock_db_session.execute = AsyncMock(side_effect=SQLAlchemyError("Test error"))
 
-        with patch("app.repositories.role.logger") as mock_logger:
+        with patch("app.repositories.base.logger") as mock_logger:
             with pytest.raises(SQLAlchemyError):
                 await role_repo.get_by_name(mock_db_session, "admin")
 
             # Verify error was logged
-            mock_logger.error.assert_called_once()
-            log_message = mock_logger.error.call_args[0][0]
-            assert "Database error getting role by name admin" in log_message
+            mock_logger.exception.assert_called_once()
+            log_format, *log_args = mock_logger.exception.call_args[0]
+            log_message = log_format % tuple(log_args)
+            assert "Database error in RoleRepository.get_by_name" in log_message
 
     @pytest.mark.asyncio
     async def test_get_all_active_error_logging(self, role_repo, mock_db_session):
         """Test error logging for get_all_active method."""
         with (
             patch.object(role_repo, "get_all", new_callable=AsyncMock) as mock_get_all,
-            patch("app.repositories.role.logger") as mock_logger,
+            patch("app.repositories.base.logger") as mock_logger,
         ):
             mock_get_all.side_effect = SQLAlchemyError("Test error")
 
             with pytest.raises(SQLAlchemyError):
                 await role_repo.get_all_active(mock_db_session)
 
-            mock_logger.error.assert_called_once()
-            log_message = mock_logger.error.call_args[0][0]
-            assert "Database error getting all active roles" in log_message
+            mock_logger.exception.assert_called_once()
+            log_format, *log_args = mock_logger.exception.call_args[0]
+            log_message = log_format % tuple(log_args)
+            assert "Database error in RoleRepository.get_all_active" in log_message
 
     @pytest.mark.asyncio
     async def test_name_exists_error_logging(self, role_repo, mock_db_session):
@@ -331,16 +333,31 @@ class TestRoleRepositoryLogging:
             patch.object(
                 role_repo, "get_by_name", new_callable=AsyncMock
             ) as mock_get_by_name,
-            patch("app.repositories.role.logger") as mock_logger,
+            patch("app.repositories.base.logger") as mock_logger,
         ):
             mock_get_by_name.side_effect = SQLAlchemyError("Test error")
 
             with pytest.raises(SQLAlchemyError):
                 await role_repo.name_exists(mock_db_session, "admin")
 
-            mock_logger.error.assert_called_once()
-            log_message = mock_logger.error.call_args[0][0]
-            assert "Database error checking if role name exists admin" in log_message
+            mock_logger.exception.assert_called_once()
+            log_format, *log_args = mock_logger.exception.call_args[0]
+            log_message = log_format % tuple(log_args)
+            assert "Database error in RoleRepository.name_exists" in log_message
+
+    @pytest.mark.asyncio
+    async def test_nested_call_error_logged_once(self, role_repo, mock_db_session):
+        """Test a failure inside a nested repository call is logged only once."""
+        mock_db_session.execute = AsyncMock(side_effect=SQLAlchemyError("Test error"))
+
+        with patch("app.repositories.base.logger") as mock_logger:
+            with pytest.raises(SQLAlchemyError):
+                await role_repo.name_exists(mock_db_session, "admin")
+
+            mock_logger.exception.assert_called_once()
+            log_format, *log_args = mock_logger.exception.call_args[0]
+            log_message = log_format % tuple(log_args)
+            assert "RoleRepository.name_exists(name='admin')" in log_message
 
 
 class TestRoleRepositoryEdgeCases:
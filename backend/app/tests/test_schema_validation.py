@@ -1,7 +1,13 @@
 import pytest
 from pydantic import ValidationError
 
-from app.schemas.llm_settings import LLMSettingsCreateSchema
+from app.models.llm_settings import LLMSettings
+from app.schemas.api_key import ApiKeyCreate
+from app.schemas.haiku import HaikuRequest
+from app.schemas.llm_settings import LLMSettingsCreateSchema, LLMSettingsSchema
+from app.schemas.role import UserWithRole
+from app.schemas.user import UserCreate
+from app.tests.mocks import create_mock_current_admin_user
 
 
 class TestLLMSettingsCreateSchemaValidation:
@@ -168,6 +174,97 @@ class TestLLMSettingsCreateSchemaValidation:
 
         errors = exc_info.value.errors()
         assert any(
-            "Model name must be less than 200 characters" in str(error)
+            error["type"] == "string_too_long" and error["loc"] == ("openai_model",)
             for error in errors
         )
+
+
+class TestUserCreatePasswordValidation:
+    """Test password requirements on UserCreate."""
+
+    def test_valid_password(self):
+        """Test a password containing every required character class."""
+        user = UserCreate(email="user@example.com", password="Secret-123!")
+        assert user.password == "Secret-123!"
+
+    @pytest.mark.parametrize(
+        "password,message",
+        [
+            ("Sh0rt!", "Password must be at least 8 characters long"),
+            ("secret-123!", "Password must contain at least one uppercase letter"),
+            ("SECRET-123!", "Password must contain at least one lowercase letter"),
+            ("Secret-abc!", "Password must contain at least one digit"),
+            ("Secret1234", "Password must contain at least one special character"),
+        ],
+    )
+    def test_missing_requirement(self, password, message):
+        """Test each missing requirement reports its specific error."""
+        with pytest.raises(ValidationError) as exc_info:
+            UserCreate(email="user@example.com", password=password)
+
+        assert any(message in str(error) for error in exc_info.value.errors())
+
+    def test_non_ascii_digit_counts_as_digit(self):
+        """Test that Unicode decimal digits satisfy the digit requirement."""
+        user = UserCreate(email="user@example.com", password="Secret-\u0663abc!")
+        assert user.password == "Secret-\u0663abc!"
+
+
+class TestWhitelistedTextFields:
+    """Test the pattern-constrained text fields on request schemas."""
+
+    def test_values_are_stripped(self):
+        """Test surrounding whitespace is removed before validation."""
+        request = HaikuRequest(topic="  autumn leaves!  ", model=" gpt-4o ")
+        assert request.topic == "autumn leaves!"
+        assert request.model == "gpt-4o"
+
+    @pytest.mark.parametrize(
+        "topic",
+        ["   ", "two  spaces", "semi;colon", "caf\u00e9"],
+    )
+    def test_invalid_topic(self, topic):
+        """Test empty, double-spaced and non-whitelisted topics are rejected."""
+        with pytest.raises(ValidationError):
+            HaikuRequest(topic=topic)
+
+    def test_model_name_rejects_whitespace(self):
+        """Test model names may not contain inner whitespace."""
+        with pytest.raises(ValidationError):
+            HaikuRequest(topic="rain", model="gpt 4o")
+
+    def test_label_allows_single_spaces(self):
+        """Test labels accept single spaces, hyphens and underscores."""
+        key = ApiKeyCreate(label=" My dev_key-1 ")
+        assert key.label == "My dev_key-1"
+
+        with pytest.raises(ValidationError):
+            ApiKeyCreate(label="My  key")
+
+
+class TestFromOrmFast:
+    """Test that from_orm_fast matches full validation for trusted rows."""
+
+    def test_user_with_role_matches_model_validate(self):
+        """Test UserWithRole built without validation equals the validated one."""
+        user = create_mock_current_admin_user()
+
+        fast = UserWithRole.from_orm_fast(user)
+
+        assert fast.model_dump() == UserWithRole.model_validate(user).model_dump()
+        assert fast.role is not None
+        assert fast.role.name == "admin"
+
+    def test_llm_settings_empty_model_names_become_none(self):
+        """Test stored empty model names are read as unset."""
+        row = LLMSettings(
+            id=1, provider="openai", openai_model="gpt-4o", bedrock_model=""
+        )
+
+        fast = LLMSettingsSchema.from_orm_fast(row)
+
+        assert fast.openai_model == "gpt-4o"
+        assert fast.bedrock_model is None
+        # Full validation rejects the empty name outright (min_length=1)
+        with pytest.raises(ValidationError):
+            LLMSettingsSchema.model_validate(row)
@@ -0,0 +1,62 @@
+"""
+Unit tests for the verified token cache.
+"""
+
+import time
+
+from app.security.token_cache import VerifiedTokenCache
+
+
+class TestVerifiedTokenCache:
+    """Test VerifiedTokenCache behaviour."""
+
+    def test_get_returns_cached_subject(self):
+        """Test a cached token returns its subject and unknown tokens miss."""
+        cache = VerifiedTokenCache()
+        cache.set("token-a", "a@example.com")
+
+        assert cache.get("token-a") == "a@example.com"
+        assert cache.get("token-b") is None
+
+    def test_expired_token_is_not_cached(self):
+        """Test a token whose exp has passed is never cached."""
+        cache = VerifiedTokenCache()
+        cache.set("token-a", "a@example.com", exp=time.time() - 1)
+
+        assert cache.get("token-a") is None
+
+    def test_ttl_expiry(self):
+        """Test entries are dropped once the TTL elapses."""
+        cache = VerifiedTokenCache(ttl_seconds=0.01)
+        cache.set("token-a", "a@example.com")
+        time.sleep(0.02)
+
+        assert cache.get("token-a") is None
+
+    def test_invalidate(self):
+        """Test invalidate, invalidate_tag and clear drop the right entries."""
+        cache = VerifiedTokenCache()
+        cache.set("token-a", "a@example.com", tag="jti-a")
+        cache.set("token-b", "b@example.com", tag="jti-b")
+        cache.set("token-c", "c@example.com")
+
+        cache.invalidate("token-c")
+        assert cache.get("token-c") is None
+
+        cache.invalidate_tag("jti-a")
+        assert cache.get("token-a") is None
+        assert cache.get("token-b") == "b@example.com"
+
+        cache.clear()
+        assert cache.get("token-b") is None
+
+    def test_maxsize_evicts_oldest(self):
+        """Test the oldest entry is evicted once maxsize is exceeded."""
+        cache = VerifiedTokenCache(maxsize=2)
+        cache.set("token-a", "a@example.com")
+        cache.set("token-b", "b@example.com")
+        cache.set("token-c", "c@example.com")
+
+        assert cache.get("token-a") is None
+        assert cache.get("token-b") == "b@example.com"
+        assert cache.get("token-c") == "c@example.com"
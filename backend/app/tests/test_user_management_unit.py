@@ -176,8 +176,8 @@ class TestUserServiceManagement:
         mock_repo = AsyncMock()
         mock_repo.soft_delete_user = AsyncMock(return_value=mock_user)
 
-        # Patch the UserRepository class
-        monkeypatch.setattr("app.services.user.UserRepository", lambda: mock_repo)
+        # Patch the shared user repository
+        monkeypatch.setattr("app.services.user.user_repository", mock_repo)
 
         # Call the service method
         result = await disable_user(mock_db, 1)
@@ -193,8 +193,8 @@ class TestUserServiceManagement:
         mock_repo = AsyncMock()
         mock_repo.activate_user = AsyncMock(return_value=mock_user)
 
-        # Patch the UserRepository class
-        monkeypatch.setattr("app.services.user.UserRepository", lambda: mock_repo)
+        # Patch the shared user repository
+        monkeypatch.setattr("app.services.user.user_repository", mock_repo)
 
         # Call the service method
         result = await enable_user(mock_db, 1)
@@ -211,8 +211,8 @@ class TestUserServiceManagement:
         mock_repo.get_by_id = AsyncMock(return_value=mock_user)
         mock_repo.hard_delete_user = AsyncMock(return_value=True)
 
-        # Patch the UserRepository class
-        monkeypatch.setattr("app.services.user.UserRepository", lambda: mock_repo)
+        # Patch the shared user repository
+        monkeypatch.setattr("app.services.user.user_repository", mock_repo)
 
         # Call the service method
         result = await delete_user(mock_db, 1)
@@ -230,8 +230,8 @@ class TestUserServiceManagement:
         mock_repo.get_by_id = AsyncMock(return_value=None)
         mock_repo.hard_delete_user = AsyncMock()
 
-        # Patch the UserRepository class
-        monkeypatch.setattr("app.services.user.UserRepository", lambda: mock_repo)
+        # Patch the shared user repository
+        monkeypatch.setattr("app.services.user.user_repository", mock_repo)
 
         # Call the service method
         result = await delete_user(mock_db, 999)
@@ -248,8 +248,8 @@ class TestUserServiceManagement:
         mock_repo = AsyncMock()
         mock_repo.soft_delete_user = AsyncMock(return_value=None)
 
-        # Patch the UserRepository class
-        monkeypatch.setattr("app.services.user.UserRepository", lambda: mock_repo)
+        # Patch the shared user repository
+        monkeypatch.setattr("app.services.user.user_repository", mock_repo)
 
         # Call the service method
         result = await disable_user(mock_db, 999)
@@ -265,8 +265,8 @@ class TestUserServiceManagement:
         mock_repo = AsyncMock()
         mock_repo.activate_user = AsyncMock(return_value=None)
 
-        # Patch the UserRepository class
-        monkeypatch.setattr("app.services.user.UserRepository", lambda: mock_repo)
+        # Patch the shared user repository
+        monkeypatch.setattr("app.services.user.user_repository", mock_repo)
 
         # Call the service method
         result = await enable_user(mock_db, 999)
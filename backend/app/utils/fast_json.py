@@ -0,0 +1,55 @@
+"""
+orjson-backed JSON helpers.
+
+``loads``/``dumps`` are drop-in replacements for the stdlib functions on hot
+paths where only plain JSON types are involved. ``install_jose_json`` points
+python-jose at orjson for parsing token headers and payloads.
+"""
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import orjson
+
+__all__ = ["loads", "dumps", "install_jose_json"]
+
+loads = orjson.loads
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize ``obj`` to a compact JSON string.
+
+    Args:
+        obj: Object made of JSON-compatible types
+
+    Returns:
+        JSON text (UTF-8, no whitespace between tokens)
+    """
+    return orjson.dumps(obj).decode()
+
+
+def _jose_loads(s: str | bytes, **kwargs: Any) -> Any:
+    """Parse with orjson unless stdlib-only options (e.g. ``parse_int``) are used."""
+    if kwargs:
+        return json.loads(s, **kwargs)
+    return orjson.loads(s)
+
+
+# Stand-in for the ``json`` module inside python-jose. Serialization stays on
+# the stdlib so the bytes of issued tokens are unchanged.
+_JOSE_JSON = SimpleNamespace(loads=_jose_loads, dumps=json.dumps)
+
+
+def install_jose_json() -> None:
+    """
+    Make python-jose parse JWT headers and payloads with orjson.
+
+    Most of a JWT decode on a small token is JSON parsing rather than the
+    signature check. Safe to call more than once.
+    """
+    from jose import jws, jwt
+
+    jws.json = _JOSE_JSON  # type: ignore[assignment]
+    jwt.json = _JOSE_JSON  # type: ignore[assignment]
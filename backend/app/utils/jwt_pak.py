@@ -7,16 +7,63 @@ HS256 session tokens used for cookie-based authentication.
 """
 
 import hashlib
+import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
-from uuid import uuid4
+from typing import Any, Dict, Optional, Tuple
 
 from cryptography.hazmat.primitives import serialization
-from jose import JWTError, jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 from jose.constants import ALGORITHMS
 
 from app.utils.rsa_keys import get_private_key, get_public_key
 
+# python-jose keys built from the cached RSA keys, paired with the key object
+# they were built from so a reloaded key (e.g. after clear_key_cache) is rebuilt
+_signing_key: Optional[Tuple[rsa.RSAPrivateKey, Key]] = None
+_verification_key: Optional[Tuple[rsa.RSAPublicKey, Key]] = None
+
+
+def _get_signing_key() -> Key:
+    """
+    Return the PAK private key prepared for python-jose.
+
+    Returns:
+        RS256 signing key, serialized and parsed once per loaded private key
+    """
+    global _signing_key
+    private_key = get_private_key()
+    if _signing_key is None or _signing_key[0] is not private_key:
+        private_key_pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        )
+        _signing_key = (private_key, jwk.construct(private_key_pem, ALGORITHMS.RS256))
+    return _signing_key[1]
+
+
+def _get_verification_key() -> Key:
+    """
+    Return the PAK public key prepared for python-jose.
+
+    Returns:
+        RS256 verification key, serialized and parsed once per loaded public key
+    """
+    global _verification_key
+    public_key = get_public_key()
+    if _verification_key is None or _verification_key[0] is not public_key:
+        public_key_pem = public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo,
+        )
+        _verification_key = (
+            public_key,
+            jwk.construct(public_key_pem, ALGORITHMS.RS256),
+        )
+    return _verification_key[1]
+
 
 def create_api_key_token(
     subject: str, jti: str, scopes: list[str], expires_delta: Optional[timedelta] = None
@@ -51,20 +98,10 @@ def create_api_key_token(
         if expires_delta:
             claims["exp"] = now_utc + expires_delta
 
-        # Get private key for signing
-        private_key = get_private_key()
-
-        # Convert private key to PEM format for jose library
-        private_key_pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption(),
-        )
-
         # Create JWT token
         token = jwt.encode(
             claims,
-            private_key_pem,
+            _get_signing_key(),
             algorithm=ALGORITHMS.RS256,
             headers={"kid": "pak-key-1"},  # Key ID for rotation support
         )
@@ -100,7 +137,7 @@ def create_api_jwt(
     """
     try:
         # Generate unique token identifier
-        jti = str(uuid4())
+        jti = secrets.token_hex(16)
 
         # Prepare token claims
         now_utc = datetime.now(timezone.utc)
@@ -115,26 +152,16 @@ def create_api_jwt(
         if expires_delta:
             claims["exp"] = now_utc + expires_delta
 
-        # Get private key for signing
-        private_key = get_private_key()
-
-        # Convert private key to PEM format for jose library
-        private_key_pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption(),
-        )
-
         # Create JWT token
         token = jwt.encode(
             claims,
-            private_key_pem,
+            _get_signing_key(),
             algorithm=ALGORITHMS.RS256,
             headers={"kid": "pak-key-1"},  # Key ID for rotation support
         )
 
         # Generate token hash for database storage
-        token_hash = hashlib.sha256(token.encode()).hexdigest()
+        token_hash = compute_token_hash(token)
 
         return token, jti, token_hash
 
@@ -161,19 +188,10 @@ def verify_api_jwt(token: str) -> Optional[Dict[str, Any]]:
         Additional checks (revocation, database lookup) must be done separately.
     """
     try:
-        # Get public key for verification
-        public_key = get_public_key()
-
-        # Convert public key to PEM format for jose library
-        public_key_pem = public_key.public_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PublicFormat.SubjectPublicKeyInfo,
-        )
-
         # Decode and verify token
         payload = jwt.decode(
             token,
-            public_key_pem,
+            _get_verification_key(),
             algorithms=[ALGORITHMS.RS256],
             options={"verify_exp": True, "verify_iat": True},
         )
@@ -233,6 +251,10 @@ def compute_token_hash(token: str) -> str:
     """
     Compute SHA256 hash of a JWT token for database storage.
 
+    This is the single definition of the stored ``token_hash`` format; keys are
+    only ever looked up by recomputing it, so it must not change without a
+    rollover plan for existing keys.
+
     Args:
         token: The JWT token string
 
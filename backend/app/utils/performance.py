@@ -1,42 +1,62 @@
 import asyncio
 import logging
-import time
+import os
 from functools import wraps
+from random import random
+from time import perf_counter_ns
 from typing import Any, Callable, TypeVar
 
 F = TypeVar("F", bound=Callable[..., Any])
 logger = logging.getLogger(__name__)
 
+# Fraction of decorated calls that are timed, e.g. 0.01 for one in a hundred
+PERF_SAMPLE_RATE = float(os.getenv("PERF_SAMPLE_RATE", "1.0"))
+
+
+def _should_time() -> bool:
+    """Decide whether to time this call: INFO must be enabled and it is sampled."""
+    return logger.isEnabledFor(logging.INFO) and (
+        PERF_SAMPLE_RATE >= 1.0 or random() < PERF_SAMPLE_RATE
+    )
+
+
+def _log_duration(func: Callable[..., Any], start_ns: int) -> None:
+    """Log how long ``func`` ran since ``start_ns``."""
+    logger.info(
+        "Performance: %s took %.4f seconds to execute.",
+        func.__name__,
+        (perf_counter_ns() - start_ns) / 1e9,
+    )
+
 
 def timing_decorator(func: F) -> F:
     """
     A decorator that logs the execution time of a function.
     Works with both synchronous and asynchronous functions.
+
+    Calls are only timed while this module's logger is enabled for INFO, and
+    then only a ``PERF_SAMPLE_RATE`` fraction of them (all by default).
     """
 
     @wraps(func)
     async def async_wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
-        start_time = time.monotonic()
+        if not _should_time():
+            return await func(*args, **kwargs)
+        start_ns = perf_counter_ns()
         try:
             return await func(*args, **kwargs)
         finally:
-            end_time = time.monotonic()
-            total_time = end_time - start_time
-            logger.info(
-                f"Performance: {func.__name__} took {total_time:.4f} seconds to execute."
-            )
+            _log_duration(func, start_ns)
 
     @wraps(func)
     def sync_wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
-        start_time = time.monotonic()
+        if not _should_time():
+            return func(*args, **kwargs)
+        start_ns = perf_counter_ns()
         try:
             return func(*args, **kwargs)
         finally:
-            end_time = time.monotonic()
-            total_time = end_time - start_time
-            logger.info(
-                f"Performance: {func.__name__} took {total_time:.4f} seconds to execute."
-            )
+            _log_duration(func, start_ns)
 
     if asyncio.iscoroutinefunction(func):
         return async_wrapper  # type: ignore[return-value]